@@ -0,0 +1,94 @@
+import importlib
+import os
+
+import cv2
+
+from module.base.atlas import AtlasWriter
+from module.base.button import Button
+from module.base.resource import Resource
+from module.base.template import Template
+from module.base.utils import load_image, rgb2luma
+from module.config.language import VALID_LANGUAGE
+from module.logger import logger
+
+MODULE_FOLDER = './module'
+ASSETS_FILES = ['assets.py', 'assets_game.py']
+
+
+def image_binary(image):
+    """
+    The same as Template.image_binary
+    """
+    image_gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    _, binary = cv2.threshold(image_gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    return binary
+
+
+def iter_assets_modules():
+    """
+    Yields:
+        str: Module path, such as 'module.ui.assets'
+    """
+    for root, _, files in os.walk(MODULE_FOLDER):
+        for file in sorted(files):
+            if file not in ASSETS_FILES:
+                continue
+            path = os.path.relpath(os.path.join(root, file), '.')
+            yield os.path.splitext(path)[0].replace('\\', '.').replace('/', '.')
+
+
+class AtlasBuilder:
+    """
+    Pack all Button and Template images into ./bin/assets/atlas.bin,
+    then Button.ensure_template() and Template.image slice from the memory-mapped atlas,
+    instead of decoding PNG files.
+
+    Run this after dev_tools/button_extract.py, atlas entries are ignored if asset files changed.
+    Gif assets are not packed.
+    """
+
+    def __init__(self):
+        self.writer = AtlasWriter()
+
+    def add_button(self, button, lang):
+        file = Resource.parse_property(button.raw_file, l=lang)
+        area = Resource.parse_property(button.raw_area, l=lang)
+        if not file or area is None or not os.path.exists(file) or file.endswith('.gif'):
+            return
+        image = load_image(file, area)
+        self.writer.add(file, area, {
+            'image': image,
+            'luma': rgb2luma(image),
+            'binary': image_binary(image),
+        })
+
+    def add_template(self, template, lang):
+        file = Resource.parse_property(template.raw_file, l=lang)
+        if not file or not os.path.exists(file) or file.endswith('.gif'):
+            return
+        # Stored pre-processed, Template.image doesn't call pre_process() again on atlas hit
+        image = template.pre_process(load_image(file))
+        self.writer.add(file, None, {
+            'image': image,
+            'binary': image_binary(image),
+        })
+
+    def build(self):
+        logger.hr('Template atlas', level=1)
+        for name in iter_assets_modules():
+            try:
+                module = importlib.import_module(name)
+            except ImportError as e:
+                logger.warning(f'Failed to import {name}: {e}')
+                continue
+            for obj in module.__dict__.values():
+                for lang in VALID_LANGUAGE:
+                    if isinstance(obj, Button):
+                        self.add_button(obj, lang)
+                    elif isinstance(obj, Template):
+                        self.add_template(obj, lang)
+        self.writer.write()
+
+
+if __name__ == '__main__':
+    AtlasBuilder().build()
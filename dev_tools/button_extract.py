@@ -1,3 +1,4 @@
+import json
 import os
 
 import imageio
@@ -33,6 +34,7 @@ class ImageExtractor:
         self.area, self.color, self.button, self.file = {}, {}, {}, {}
         for language in VALID_LANGUAGE:
             self.load(language)
+        self.meta = self.load_meta()
 
     def get_file(self, genre='', language='zh-CN'):
         names = [f'{self.name}.{genre}{ext}' if genre else f'{self.name}{ext}' for ext in ['.png', '.gif']]
@@ -115,10 +117,28 @@ class ImageExtractor:
             self.button[language] = self.button['zh-CN']
             self.file[language] = self.file['zh-CN']
 
+    def load_meta(self):
+        """
+        Load XXX.META.json beside the zh-CN asset, such as {"pyramid": 2}
+
+        Returns:
+            dict: Extra keyword arguments of Button or Template.
+        """
+        folder = os.path.dirname(self.file['zh-CN'])
+        file = os.path.join(folder, f'{self.name}.META.json').replace('\\', '/')
+        if not os.path.exists(file):
+            return {}
+        with open(file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @property
+    def meta_expression(self):
+        return ''.join(f', {key}={value!r}' for key, value in self.meta.items())
+
     @property
     def expression(self):
-        return '%s = Button(area=%s, color=%s, button=%s, file=%s)' % (
-            self.name, self.area, self.color, self.button, self.file)
+        return '%s = Button(area=%s, color=%s, button=%s, file=%s%s)' % (
+            self.name, self.area, self.color, self.button, self.file, self.meta_expression)
 
 
 class TemplateExtractor(ImageExtractor):
@@ -143,7 +163,7 @@ class TemplateExtractor(ImageExtractor):
 
     @property
     def expression(self):
-        return '%s = Template(file=%s)' % (self.name, self.file)
+        return '%s = Template(file=%s%s)' % (self.name, self.file, self.meta_expression)
         # return '%s = Template(area=%s, color=%s, button=%s, file=\'%s\')' % (
         #     self.name, self.area, self.color, self.button,
         #     self.config.ASSETS_FOLDER + '/' + self.module + '/' + self.name + '.png')
@@ -176,6 +196,8 @@ class ModuleExtractor:
         for file in os.listdir(self.folder):
             if file[0].isdigit():
                 continue
+            if os.path.splitext(file)[1] not in ['.png', '.gif']:
+                continue
             if file.startswith('TEMPLATE_'):
                 exp.append(TemplateExtractor(module=self.module_path, file=file).expression)
                 continue
@@ -228,6 +250,9 @@ class AssetExtractor:
              > Button(area=(553, 482, 727, 539), color=(93, 142, 203), button=(553, 482, 727, 539), name='GET_MISSION')
     Asset name like XXX.AREA.png, XXX.COLOR.png, XXX.BUTTON.png, will overwrite the attribute of XXX.png.
         E.g. BATTLE_STATUS_S.BUTTON.png overwrites the attribute 'button' of BATTLE_STATUS_S
+    Asset metadata XXX.META.json will be passed to Button or Template as keyword arguments.
+        E.g. SKIP.META.json {"pyramid": 2}
+             > SKIP = Button(..., pyramid=2)
     Asset name starts with 'OCR_' will treat as button.
         E.g. OCR_EXERCISE_TIMES.png.
     """
@@ -0,0 +1,27 @@
+import numpy as np
+
+from module.base.button import Button
+from module.base.detector import ButtonDetector
+from module.logger import logger
+
+
+def check_color_buttons():
+    """
+    Buttons detected by color (offset=0) used to return numpy.bool_ in DetectResult.__bool__,
+    which raises TypeError on truth testing.
+    """
+    image = np.zeros((1280, 720, 3), dtype=np.uint8)
+    image[100:150, 100:200] = (200, 100, 50)
+    hit = Button(area=(100, 100, 200, 150), color=(200, 100, 50), button=(100, 100, 200, 150), name='COLOR_HIT')
+    miss = Button(area=(300, 300, 400, 350), color=(255, 255, 255), button=(300, 300, 400, 350), name='COLOR_MISS')
+
+    results = ButtonDetector([hit, miss], offset=0, threshold=10).detect(image)
+    assert results[hit], results[hit]
+    assert not results[miss], results[miss]
+    assert any(results.values())
+    assert [button for button, result in results.items() if result] == [hit]
+    logger.info('Color buttons: OK')
+
+
+if __name__ == '__main__':
+    check_color_buttons()
@@ -0,0 +1,69 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from module.base.http import HttpSession
+from module.logger import logger
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Keep-alive stub server.
+    /item/<n> returns n after a delay of (5 - n % 5) * 20ms, so later requests may finish first.
+    /error returns 500.
+    """
+    protocol_version = 'HTTP/1.1'
+    # Client addresses of accepted connections
+    connections = set()
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with self.lock:
+            self.connections.add(self.client_address)
+        if self.path.startswith('/item/'):
+            n = int(self.path.rsplit('/', 1)[1])
+            time.sleep((5 - n % 5) * 0.02)
+            status, body = 200, str(n).encode()
+        else:
+            status, body = 500, b'error'
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def check_http_session():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_port}'
+    session = HttpSession(pool_size=3, trust_env=False)
+
+    try:
+        # Serial requests share one keep-alive connection
+        for n in range(5):
+            assert session.get(f'{url}/item/{n}').text == str(n)
+        assert len(StubHandler.connections) == 1, StubHandler.connections
+
+        # map() keeps the order of items, and opens at most pool_size connections
+        StubHandler.connections.clear()
+        items = list(range(12))
+        result = session.map(lambda n: int(session.get(f'{url}/item/{n}').text), items)
+        assert result == items, result
+        assert len(StubHandler.connections) <= session.pool_size, StubHandler.connections
+
+        # 5xx responses are counted as errors
+        session.get(f'{url}/error')
+        stat = session.metrics['GET /error']
+        assert stat.count == 1 and stat.errors == 1, stat
+        session.show_metrics()
+    finally:
+        server.shutdown()
+        session.close()
+    logger.info('HttpSession: OK')
+
+
+if __name__ == '__main__':
+    check_http_session()
@@ -184,39 +184,112 @@ class NikkeAutoScript:
             if self.config.PCClient_ScreenRotate:
                 self.device.screen_rotate(self.config.PCClient_ScreenNumber)
             exit(1)
+        finally:
+            # GUI stops instances by killing the process, atexit won't run, write saved config now
+            self.config.flush()
 
     def save_error_log(self):
         """
         Save last 60 screenshots in ./log/error/<timestamp>
         Save logs to ./log/error/<timestamp>/log.txt
-        """
-        from module.base.utils import save_image
-        from module.handler.sensitive_info import handle_sensitive_logs
 
+        Only screenshots are copied here, reading logs and encoding images are done
+        by a background thread, so the crash path is not blocked by disk I/O.
+
+        Returns:
+            threading.Thread: The writer thread.
+        """
         if not os.path.exists('./log/error'):
             os.mkdir('./log/error')
         folder = f'./log/error/{int(time.time() * 1000)}'
         logger.warning(f'Saving error: {folder}')
         os.mkdir(folder)
-        for data in self.device.screenshot_deque:
+        images = self.device.screenshot_deque.snapshot()
+        # Logs written after this are not included
+        try:
+            log_end = os.path.getsize(logger.log_file)
+        except OSError:
+            log_end = 0
+
+        # 非守护线程, 进程退出前会等待写入完成
+        thread = threading.Thread(
+            target=self._write_error_log, args=(folder, images, logger.log_file, log_end), name='ErrorLogWriter')
+        thread.start()
+        return thread
+
+    @staticmethod
+    def _read_task_log(file, end, chunk=65536, limit=4194304):
+        """
+        Read logs of the last task by seeking backwards from the end of the file,
+        instead of reading the whole file.
+
+        Args:
+            file (str): Log file.
+            end (int): Read logs before this position.
+            chunk (int): Bytes to read each time.
+            limit (int): Max bytes to read, all logs read are returned if task separator not found.
+
+        Returns:
+            list[str]: Lines from 2 lines before the last `═══` separator.
+        """
+        separator = re.compile('^═{15,}$')
+
+        def to_lines(raw):
+            text = b'\n'.join(raw).decode('utf-8', errors='replace').replace('\r\n', '\n')
+            text = text.split('\n')
+            # Keep line endings like readlines()
+            return [line + '\n' for line in text[:-1]] + ([text[-1]] if text[-1] else [])
+
+        data = b''
+        lines = []
+        # Number of lines at the end that have been checked
+        checked = 0
+        position = end
+        with open(file, 'rb') as f:
+            while position > 0 and end - position < limit:
+                size = min(chunk, position)
+                position -= size
+                f.seek(position)
+                data = f.read(size) + data
+                lines = data.split(b'\n')
+                # First line may be incomplete
+                first = 0 if position == 0 else 1
+                for index in range(len(lines) - 1 - checked, first + 1, -1):
+                    # 从最后一个任务截取
+                    if separator.match(lines[index].decode('utf-8', errors='replace').strip(' \r\t\n')):
+                        return to_lines(lines[index - 2:])
+                checked = max(len(lines) - first - 2, 0)
+
+        if position > 0:
+            lines = lines[1:]
+        return to_lines(lines)
+
+    @staticmethod
+    def _write_error_log(folder, images, log_file, log_end):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from module.base.utils import save_image
+        from module.handler.sensitive_info import handle_sensitive_logs
+
+        def save(data):
             image_time = datetime.strftime(data['time'], '%Y-%m-%d_%H-%M-%S-%f')
             # 遮挡个人消息
             # image = handle_sensitive_image(data['image'])
-            image = data['image']
-            save_image(image, f'{folder}/{image_time}.png')
-        with open(logger.log_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            start = 0
-            for index, line in enumerate(lines):
-                line = line.strip(' \r\t\n')
-                # 从最后一个任务截取
-                if re.match('^═{15,}$', line):
-                    start = index
-            lines = lines[start - 2 :]
-            # 替换真实路径
-            lines = handle_sensitive_logs(lines)
-        with open(f'{folder}/log.txt', 'w', encoding='utf-8') as f:
-            f.writelines(lines)
+            save_image(data['image'], f'{folder}/{image_time}.png')
+
+        try:
+            # PNG encoding releases GIL, encode images in parallel
+            with ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1)) as executor:
+                futures = [executor.submit(save, data) for data in images]
+                lines = NikkeAutoScript._read_task_log(log_file, log_end) if log_end else []
+                # 替换真实路径
+                lines = handle_sensitive_logs(lines)
+                with open(f'{folder}/log.txt', 'w', encoding='utf-8') as f:
+                    f.writelines(lines)
+                for future in futures:
+                    future.result()
+        except Exception as e:
+            logger.warning(f'Failed to save error log: {e}')
 
     def restart(self):
         from module.handler.login import LoginHandler
@@ -453,7 +526,8 @@ class NikkeAutoScript:
         future = future + timedelta(seconds=1)
         self.config.start_watching()
         while 1:
-            if datetime.now() > future:
+            remain = (future - datetime.now()).total_seconds()
+            if remain < 0:
                 return True
             if self.stop_event is not None:
                 if self.stop_event.is_set():
@@ -461,7 +535,8 @@ class NikkeAutoScript:
                     logger.info(f'[{self.config_name}] exited. Reason: Update')
                     exit(0)
 
-            time.sleep(5)
+            # Blocks until GUI saves config or updates, see ConfigWatcher.wait_change()
+            self.config.wait_change(timeout=remain)
 
             if self.config.should_reload():
                 return False
@@ -587,8 +662,13 @@ class NikkeAutoScript:
                 self.device.click_record_clear()
 
             logger.hr(task, level=0)
+            pacer = getattr(self.__dict__.get('device'), 'screenshot_pacer', None)
+            if pacer is not None:
+                pacer.reset()
             success = self.run(inflection.underscore(task), skip_first_screenshot=(task == 'Restart'))
             logger.info(f'Scheduler: End task `{task}`')
+            if pacer is not None:
+                pacer.show(task)
             self.is_first_task = False
 
             # Check failures
@@ -0,0 +1,174 @@
+import json
+import os
+from functools import cached_property
+
+import numpy as np
+
+from module.logger import logger
+
+ATLAS_FOLDER = './bin/assets'
+ATLAS_DATA = 'atlas.bin'
+ATLAS_INDEX = 'atlas.json'
+ATLAS_VERSION = 2
+# Align every image to 64 bytes
+ATLAS_ALIGN = 64
+
+
+def atlas_key(file, area=None):
+    """
+    Args:
+        file (str): Asset file, such as './assets/zh-CN/ui/MAIN_CHECK.png'.
+            Language is already included in the path.
+        area (tuple): Crop area of Button, None for Template.
+
+    Returns:
+        str: Such as './assets/zh-CN/ui/MAIN_CHECK.png:(1, 2, 3, 4)'
+    """
+    file = file.replace('\\', '/')
+    if area is None:
+        return file
+    else:
+        return f'{file}:{tuple(int(v) for v in area)}'
+
+
+def file_stat(file):
+    """
+    Args:
+        file (str):
+
+    Returns:
+        list[int] | None: [st_size, st_mtime_ns], None if file not exists.
+    """
+    try:
+        stat = os.stat(file)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class TemplateAtlas:
+    """
+    All Button and Template images packed into one file,
+    so assets can be sliced from a memory-mapped file without decoding PNG.
+
+    Atlas is built by dev_tools/assets_atlas.py, and rebuilt by Updater after updates.
+    If it doesn't exist or an asset is changed after building, get() returns None
+    and caller should load the asset as usual.
+    """
+
+    def __init__(self, folder=ATLAS_FOLDER):
+        self.folder = folder
+
+    @cached_property
+    def index(self):
+        """
+        Returns:
+            dict: Key: atlas_key(), value: {variant: [offset, shape], 'stat': [st_size, st_mtime_ns]}
+        """
+        file = os.path.join(self.folder, ATLAS_INDEX)
+        if not os.path.exists(file):
+            return {}
+        try:
+            with open(file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f'Failed to read template atlas: {e}')
+            return {}
+        if data.get('version') != ATLAS_VERSION:
+            logger.warning('Template atlas version mismatch, ignored')
+            return {}
+        return data.get('entries', {})
+
+    @cached_property
+    def data(self):
+        """
+        Returns:
+            np.memmap | None:
+        """
+        file = os.path.join(self.folder, ATLAS_DATA)
+        if not self.index or not os.path.exists(file):
+            return None
+        # Copy-on-write, the atlas file itself is never modified
+        return np.memmap(file, dtype=np.uint8, mode='c')
+
+    @cached_property
+    def _file_stat(self):
+        return {}
+
+    def is_valid(self, file, entry):
+        """
+        An entry is invalid if its asset file is modified after building.
+        """
+        try:
+            stat = self._file_stat[file]
+        except KeyError:
+            stat = file_stat(file)
+            self._file_stat[file] = stat
+        return stat is not None and stat == entry.get('stat')
+
+    def get(self, file, area=None, variant='image'):
+        """
+        Args:
+            file (str): Asset file.
+            area (tuple): Crop area of Button, None for Template.
+            variant (str): 'image', 'luma' or 'binary'.
+
+        Returns:
+            np.ndarray | None: A view of the memory-mapped atlas, or None if not in atlas.
+        """
+        if not self.index:
+            return None
+        entry = self.index.get(atlas_key(file, area))
+        if entry is None or variant not in entry:
+            return None
+        if not self.is_valid(file, entry):
+            return None
+        data = self.data
+        if data is None:
+            return None
+
+        offset, shape = entry[variant]
+        size = int(np.prod(shape))
+        return data[offset:offset + size].reshape(shape)
+
+
+class AtlasWriter:
+    def __init__(self, folder=ATLAS_FOLDER):
+        self.folder = folder
+        self.entries = {}
+        self.chunks = []
+        self.offset = 0
+
+    def add(self, file, area, images):
+        """
+        Args:
+            file (str): Asset file.
+            area (tuple): Crop area of Button, None for Template.
+            images (dict[str, np.ndarray]): Key: variant, value: image.
+        """
+        key = atlas_key(file, area)
+        if key in self.entries:
+            return
+        entry = {'stat': file_stat(file)}
+        for variant, image in images.items():
+            image = np.ascontiguousarray(image, dtype=np.uint8)
+            entry[variant] = [self.offset, list(image.shape)]
+            self.chunks.append(image.tobytes())
+            self.offset += image.nbytes
+            pad = -self.offset % ATLAS_ALIGN
+            if pad:
+                self.chunks.append(b'\x00' * pad)
+                self.offset += pad
+        self.entries[key] = entry
+
+    def write(self):
+        os.makedirs(self.folder, exist_ok=True)
+        with open(os.path.join(self.folder, ATLAS_DATA), 'wb') as f:
+            for chunk in self.chunks:
+                f.write(chunk)
+        with open(os.path.join(self.folder, ATLAS_INDEX), 'w', encoding='utf-8') as f:
+            json.dump({'version': ATLAS_VERSION, 'entries': self.entries}, f)
+        logger.info(f'Template atlas: {len(self.entries)} assets, {self.offset} bytes')
+
+
+TEMPLATE_ATLAS = TemplateAtlas()
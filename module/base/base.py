@@ -4,6 +4,7 @@ from functools import cached_property
 import numpy as np
 
 from module.base.button import Button
+from module.base.detector import DetectResult, get_detector
 from module.base.timer import Timer
 from module.base.utils import float2str, point2str
 from module.config.config import NikkeConfig
@@ -62,20 +63,200 @@ class ModuleBase:
     def ocr_models(self):
         return OCR_MODEL
 
+    def appear_many(self, buttons, offset=0, interval=0, threshold=None, static=True):
+        """
+        Detect several buttons on the same screenshot in one pass.
+
+        Args:
+            buttons (list[Button]):
+            offset (bool, int, tuple): The same as appear()
+            interval (int, float): Buttons in interval are skipped and considered not appear.
+                Note that interval timers are not reset here, callers should reset the one they use.
+            threshold (float):
+            static (bool):
+
+        Returns:
+            dict[Button, DetectResult]: Results of all buttons, in the same order as input.
+        """
+        if offset:
+            if isinstance(offset, bool):
+                offset = self.config.BUTTON_OFFSET
+            if not threshold:
+                threshold = self.config.BUTTON_MATCH_SIMILARITY
+        else:
+            if not threshold:
+                threshold = self.config.COLOR_SIMILAR_THRESHOLD
+
+        skipped = set()
+        for button in buttons:
+            self.device.stuck_record_add(button)
+            if interval:
+                if button.name in self.interval_timer:
+                    if self.interval_timer[button.name].limit != interval:
+                        self.interval_timer[button.name] = Timer(interval)
+                else:
+                    self.interval_timer[button.name] = Timer(interval)
+                if not self.interval_timer[button.name].reached():
+                    skipped.add(button)
+
+        detector = get_detector(tuple(b for b in buttons if b not in skipped),
+                                offset=offset, threshold=threshold, static=static)
+        results = detector.detect(self.device.image, downscale=self.device.image_downscale)
+        return {button: results[button] if button in results else DetectResult(button, 0., False)
+                for button in buttons}
+
     def appear_any(self, buttons, **kwargs):
         """任意一个按钮出现即返回 True"""
-        for btn in buttons:
-            if self.appear(btn, **kwargs):
+        interval = kwargs.pop('interval', 0)
+        results = self.appear_many(buttons, interval=interval, **kwargs)
+        for button, result in results.items():
+            if result:
+                if interval:
+                    self.interval_timer[button.name].reset()
                 return True
         return False
 
-    def appear_then_click_any(self, buttons, **kwargs):
+    def appear_then_click_any(self, buttons, click_offset=0, screenshot=False, **kwargs):
         """任意一个按钮出现即点击并返回 True"""
-        for btn in buttons:
-            if self.appear_then_click(btn, **kwargs):
+        interval = kwargs.pop('interval', 0)
+        results = self.appear_many(buttons, interval=interval, **kwargs)
+        for button, result in results.items():
+            if result:
+                if interval:
+                    self.interval_timer[button.name].reset()
+                if screenshot:
+                    self.device.sleep(self.config.WAIT_BEFORE_SAVING_SCREEN_SHOT)
+                    self.device.screenshot()
+                self.device.click(button, click_offset)
                 return True
         return False
 
+    def _rule_detect_key(self, detect):
+        """
+        Args:
+            detect (Detect):
+
+        Returns:
+            tuple: (button, offset, threshold, static) with defaults resolved like appear()
+        """
+        offset = detect.offset
+        if offset:
+            if isinstance(offset, bool):
+                offset = self.config.BUTTON_OFFSET
+            if isinstance(offset, list):
+                offset = tuple(offset)
+            threshold = detect.threshold if detect.threshold else self.config.BUTTON_MATCH_SIMILARITY
+            static = detect.static
+        else:
+            threshold = detect.threshold if detect.threshold else self.config.COLOR_SIMILAR_THRESHOLD
+            static = True
+        return detect.button, offset, threshold, static
+
+    def run_rules(self, rules):
+        """
+        Evaluate a RuleSet on the current screenshot, and run the first matched rule.
+        Buttons of all rules are detected in one pass, buttons with the same arguments
+        are detected by one ButtonDetector, see module/base/rule.py
+        Buttons with static=False are detected only when a rule needs them.
+
+        Args:
+            rules (RuleSet):
+
+        Returns:
+            Rule | None: The rule that ran, None if no rule matched.
+        """
+        if not rules.click_timer.reached():
+            return None
+
+        candidates = []
+        for rule in rules.rules:
+            if not rule.is_enabled():
+                continue
+            if rule.interval:
+                timer = self.interval_timer.get(rule.name)
+                if timer is None or timer.limit != rule.interval:
+                    timer = self.interval_timer[rule.name] = Timer(rule.interval)
+                if not timer.reached():
+                    continue
+            candidates.append(rule)
+        if not candidates:
+            return None
+
+        results = {}
+
+        def detect_group(offset, threshold, static, buttons):
+            """
+            Args:
+                buttons (dict): Key: Button, value: detect key.
+            """
+            start = time.perf_counter()
+            for button in buttons:
+                self.device.stuck_record_add(button)
+            detector = get_detector(tuple(buttons), offset=offset, threshold=threshold, static=static)
+            for button, result in detector.detect(self.device.image, downscale=self.device.image_downscale).items():
+                results[buttons[button]] = result
+            rules.detects += len(buttons)
+            rules.detect_cost += time.perf_counter() - start
+
+        def appear(detect):
+            key = self._rule_detect_key(detect)
+            if key not in results:
+                # Searching the whole screenshot is expensive, only do it when a rule reaches it
+                button, offset, threshold, static = key
+                detect_group(offset, threshold, static, {button: key})
+            return bool(results[key])
+
+        # Group detects by arguments, each group is one batched detection
+        groups = {}
+        for rule in candidates:
+            for detect in rule.detects:
+                button, offset, threshold, static = key = self._rule_detect_key(detect)
+                if not static:
+                    continue
+                groups.setdefault((offset, threshold, static), {})[button] = key
+        rules.frames += 1
+        for (offset, threshold, static), buttons in groups.items():
+            detect_group(offset, threshold, static, buttons)
+
+        for rule in candidates:
+            rule.stat.checks += 1
+            if not all(appear(detect) for detect in rule.require):
+                continue
+            if any(appear(detect) for detect in rule.exclude):
+                continue
+            if rule.detect is not None and not appear(rule.detect):
+                continue
+
+            start = time.perf_counter()
+            if rule.action is None:
+                key = self._rule_detect_key(rule.detect)
+                button, offset = key[0], key[1]
+                if offset:
+                    # Same button may be detected with other arguments after this one
+                    button._button_offset = results[key].area
+                self.device.click(button, rule.click_offset)
+            elif rule.action() is False:
+                continue
+            rule.stat.hits += 1
+            rule.stat.cost += time.perf_counter() - start
+            if rule.interval:
+                self.interval_timer[rule.name].reset()
+            rules.click_timer.reset()
+            return rule
+
+        return None
+
+    def _appear_cache(self):
+        """
+        Returns:
+            dict | None: Detection results of the current screenshot,
+                or None if the screenshot is modified outside or device doesn't support it.
+        """
+        image = getattr(self.device, 'appear_cache_image', None)
+        if image is None or image is not self.device.image:
+            return None
+        return self.device.appear_cache
+
     def appear(self, button: Button, offset=0, interval=0, threshold=None, static=True) -> bool:
 
         self.device.stuck_record_add(button)
@@ -93,12 +274,25 @@ class ModuleBase:
             if isinstance(offset, bool):
                 offset = self.config.BUTTON_OFFSET
 
-            appear = button.match(self.device.image, offset=offset,
-                                  threshold=self.config.BUTTON_MATCH_SIMILARITY if not threshold else threshold,
-                                  static=static)
+        # 画面没有变化时复用上一帧的结果
+        cache = self._appear_cache()
+        key = (button, offset, threshold, static)
+        # 按钮加载过新的颜色或偏移后, 缓存结果失效
+        if cache is not None and key in cache and cache[key][2] == button.load_count:
+            appear, button_offset, _ = cache[key]
+            if button_offset is not None:
+                button._button_offset = button_offset
         else:
-            appear = button.appear_on(self.device.image,
-                                      threshold=self.config.COLOR_SIMILAR_THRESHOLD if not threshold else threshold)
+            if offset:
+                appear = button.match(self.device.image, offset=offset,
+                                      threshold=self.config.BUTTON_MATCH_SIMILARITY if not threshold else threshold,
+                                      static=static, downscale=self.device.image_downscale)
+            else:
+                appear = button.appear_on(self.device.image,
+                                          threshold=self.config.COLOR_SIMILAR_THRESHOLD if not threshold else threshold)
+            if cache is not None:
+                cache[key] = (appear, getattr(button, '_button_offset', None) if appear and offset else None,
+                              button.load_count)
 
         if appear and interval:
             self.interval_timer[button.name].reset()
@@ -122,7 +316,8 @@ class ModuleBase:
                 self.device.image,
                 offset=offset,
                 threshold=self.config.BUTTON_MATCH_SIMILARITY if not threshold else threshold,
-                static=static
+                static=static,
+                downscale=self.device.image_downscale
             )
         else:
             appear = button.appear_on(
@@ -174,7 +369,8 @@ class ModuleBase:
             self.device.image,
             threshold=self.config.BUTTON_MATCH_SIMILARITY if threshold is None else threshold,
             scale_range=scale_range,
-            scale_step=scale_step
+            scale_step=scale_step,
+            downscale=self.device.image_downscale
         )
 
         if appear and interval:
@@ -194,7 +390,18 @@ class ModuleBase:
 
         return appear
 
-    def appear_text(self, text, threshold=0.7, interval=0, lang='ch') -> bool or tuple:
+    def appear_text(self, text, threshold=0.7, interval=0, lang='ch', area=None) -> bool or tuple:
+        """
+        Args:
+            text (str):
+            threshold (float):
+            interval (int, float):
+            lang (str):
+            area (tuple, Button, list): Only search text in these areas, None for the whole screen.
+
+        Returns:
+            tuple | bool: Center of the text, or False.
+        """
         if interval:
             if text in self.interval_timer:
                 if self.interval_timer[text].limit != interval:
@@ -204,20 +411,13 @@ class ModuleBase:
             if not self.interval_timer[text].reached():
                 return False
 
-        # OCR 缓存
-        if not hasattr(self, "_ocr_cache"):
-            self._ocr_cache = {
-                "last_hash": None,
-                "last_result": None
-            }
-
-        current_hash = hash(self.device.image.tobytes())
-        if current_hash != self._ocr_cache["last_hash"]:
-            # 重新 OCR
+        # OCR 结果按截图区域缓存在 OCR_CACHE 中, 画面不变时不会重复识别
+        if area is None:
             ocr_instance = Ocr(buttons=[], lang=lang, model_type=self.config.Optimization_OcrModelType)
-            self._ocr_cache["last_result"] = ocr_instance.ocr(self.device.image, direct_ocr=True, show_log=False)
-            self._ocr_cache["last_hash"] = current_hash
-        res = self._ocr_cache["last_result"]
+            res = ocr_instance.ocr(self.device.image, direct_ocr=True, show_log=False)
+        else:
+            ocr_instance = Ocr(buttons=area, lang=lang, model_type=self.config.Optimization_OcrModelType)
+            res = ocr_instance.ocr(self.device.image, show_log=False, absolute_bbox=True)
 
         location = self.device.get_location(text, res, threshold=threshold)
         if location:
@@ -288,15 +488,16 @@ class ModuleBase:
         method: swipe, 使用鼠标左键快速滑动
         """
         for i in range(count):
-            self.device.swipe(x1, x2, speed=speed, method=method, handle_control_check=False)
-            self.device.sleep(delay)
+            # 画面停止滚动后立即返回, 最多等待 delay 秒
+            self.device.swipe_and_wait_change(x1, x2, timeout=delay, speed=speed, method=method,
+                                              handle_control_check=False)
 
     def ensure_sroll_to_top(self, x1=(360, 460), x2=(360, 900), speed=30, count=2, delay=1.5):
         for i in range(count):
-            self.device.swipe(x1, x2, method='swipe', speed=speed, handle_control_check=False)
-            self.device.sleep(delay)
+            self.device.swipe_and_wait_change(x1, x2, timeout=delay, method='swipe', speed=speed,
+                                              handle_control_check=False)
 
     def ensure_sroll_to_bottom(self, x1=(360, 900), x2=(360, 460), speed=30, count=2, delay=1.5):
         for i in range(count):
-            self.device.swipe(x1, x2, method='swipe', speed=speed, handle_control_check=False)
-            self.device.sleep(delay)
+            self.device.swipe_and_wait_change(x1, x2, timeout=delay, method='swipe', speed=speed,
+                                              handle_control_check=False)
@@ -7,12 +7,13 @@ import imageio
 import numpy as np
 
 from module.logger import logger
+from module.base.atlas import TEMPLATE_ATLAS
 from module.base.resource import Resource
 from module.base.utils import *
 
 
 class Button(Resource):
-    def __init__(self, area, color, button, file=None, name=None):
+    def __init__(self, area, color, button, file=None, name=None, pyramid=None):
         """Initialize a Button instance.
 
         Args:
@@ -23,6 +24,9 @@ class Button(Resource):
             button (dict[tuple], tuple): Area to be click if button appears on the image.
                             (upper_left_x, upper_left_y, bottom_right_x, bottom_right_y)
                             If tuple is empty, this object can be use as a checker.
+            pyramid (int): Downscale ratio of coarse-to-fine matching when static=False, such as 2, 4.
+                           None to search the whole image at full resolution.
+                           Set in assets metadata XXX.META.json, see dev_tools/button_extract.py
         Examples:
             BATTLE_PREPARATION = Button(
                 area=(1562, 908, 1864, 1003),
@@ -35,6 +39,7 @@ class Button(Resource):
         self.raw_button = button
         self.raw_file = file
         self.raw_name = name
+        self.pyramid = pyramid
 
         # 非模板位置，例如'确认'并不是固定的
         self._button_offset = None
@@ -44,6 +49,12 @@ class Button(Resource):
         self.image = None
         self.image_binary = None
         self.image_luma = None
+        self.image_pyramid = None
+        self.image_scales = None
+        # 上次 match_with_scale 命中的缩放比例
+        self._last_scale = None
+        # load_color() 和 load_offset() 的次数, 变化后 appear() 不再复用缓存结果
+        self.load_count = 0
 
         if self.file:
             self.resource_add(key=self.file)
@@ -107,7 +118,9 @@ class Button(Resource):
                     image = crop(image, self.area)
                     self.image.append(image)
             else:
-                self.image = load_image(self.file, self.area)
+                self.image = TEMPLATE_ATLAS.get(self.file, self.area)
+                if self.image is None:
+                    self.image = load_image(self.file, self.area)
             self._match_init = True
 
     def ensure_luma_template(self):
@@ -118,24 +131,70 @@ class Button(Resource):
                     luma = rgb2luma(image)
                     self.image_luma.append(luma)
             else:
-                self.image_luma = rgb2luma(self.image)
+                self.image_luma = TEMPLATE_ATLAS.get(self.file, self.area, variant='luma')
+                if self.image_luma is None:
+                    self.image_luma = rgb2luma(self.image)
             self._match_luma_init = True
 
-    def match(self, image, offset=30, threshold=0.85, static=True) -> bool:
-        self.ensure_template()
-        if static:
-            if isinstance(offset, tuple):
-                if len(offset) == 2:
-                    offset = np.array((-offset[0], -offset[1], offset[0], offset[1]))
-                else:
-                    offset = np.array(offset)
+    @staticmethod
+    def _offset_area(offset):
+        """
+        Args:
+            offset (int, tuple): Detection area offset, such as 30, (30, 30), (-3, -30, 3, 30)
+
+        Returns:
+            np.ndarray: (upper_left_x, upper_left_y, bottom_right_x, bottom_right_y)
+        """
+        if isinstance(offset, tuple):
+            if len(offset) == 2:
+                return np.array((-offset[0], -offset[1], offset[0], offset[1]))
             else:
-                offset = np.array((-3, -offset, 3, offset))
+                return np.array(offset)
+        else:
+            return np.array((-3, -offset, 3, offset))
 
+    def _match_pyramid(self, image, threshold, downscale=None):
+        """
+        Coarse-to-fine matching on the whole image, see match_pyramid().
+
+        Args:
+            image (np.ndarray):
+            threshold (float):
+            downscale (callable): Function that returns `image` downscaled by a given level, such as
+                Device.image_downscale, so buttons matching on the same screenshot share one resize.
+
+        Returns:
+            float: Similarity.
+            tuple[int, int]: Upper left.
+        """
+        level = self.pyramid
+        height, width = self.image.shape[:2]
+        # 模板缩小后太小则不再降采样
+        while level > 1 and min(height, width) // level < 6:
+            level //= 2
+        if level <= 1:
+            res = cv2.matchTemplate(self.image, image, cv2.TM_CCOEFF_NORMED)
+            _, similarity, _, upper_left = cv2.minMaxLoc(res)
+            return similarity, upper_left
+
+        if self.image_pyramid is None or self.image_pyramid[0] != level:
+            small = cv2.resize(self.image, (width // level, height // level), interpolation=cv2.INTER_AREA)
+            self.image_pyramid = (level, small)
+        image_small = downscale(level) if downscale is not None else None
+        return match_pyramid(image, self.image, level, template_small=self.image_pyramid[1],
+                             image_small=image_small, threshold=threshold)
+
+    def match(self, image, offset=30, threshold=0.85, static=True, downscale=None) -> bool:
+        self.ensure_template()
+        if static:
+            offset = self._offset_area(offset)
             image = crop(image, offset + self.area)
 
-        res = cv2.matchTemplate(self.image, image, cv2.TM_CCOEFF_NORMED)
-        _, similarity, _, upper_left = cv2.minMaxLoc(res)
+        if not static and self.pyramid and not self.is_gif:
+            similarity, upper_left = self._match_pyramid(image, threshold, downscale=downscale)
+        else:
+            res = cv2.matchTemplate(self.image, image, cv2.TM_CCOEFF_NORMED)
+            _, similarity, _, upper_left = cv2.minMaxLoc(res)
 
         if similarity > threshold:
             if static:
@@ -158,54 +217,139 @@ class Button(Resource):
         #     return False
         # else:
 
-    def match_with_scale(self, image, threshold=0.85, scale_range=(0.9, 1.1), scale_step=0.02):
+    def _scale_templates(self, scale_range, scale_step):
+        """
+        Resized templates of all scales, cached per scale settings.
+
+        Returns:
+            list[tuple[float, np.ndarray, np.ndarray | None]]: (scale, template, template downscaled by 2),
+                the downscaled template is None if it's too small for coarse matching.
+        """
+        key = (scale_range, scale_step)
+        if self.image_scales is None or self.image_scales[0] != key:
+            templates = []
+            count = int(round((scale_range[1] - scale_range[0]) / scale_step)) + 1
+            for index in range(count):
+                scale = round(scale_range[0] + index * scale_step, 6)
+                template = cv2.resize(self.image, (0, 0), fx=scale, fy=scale)
+                height, width = template.shape[:2]
+                if min(height, width) // 2 >= 6:
+                    small = cv2.resize(template, (width // 2, height // 2), interpolation=cv2.INTER_AREA)
+                else:
+                    small = None
+                templates.append((scale, template, small))
+            self.image_scales = (key, templates)
+        return self.image_scales[1]
+
+    def match_with_scale(self, image, threshold=0.85, scale_range=(0.9, 1.1), scale_step=0.02, margin=0.15,
+                         downscale=None):
         """
         多尺度匹配：在一定范围内连续搜索最佳缩放匹配
 
+        1. 上次命中过的比例：半分辨率粗匹配找到候选位置，全分辨率小窗口精确匹配，命中则返回
+        2. 其余比例：半分辨率粗匹配所有比例，合并得到最多 3 个候选位置，
+           再从上次命中的比例由近及远，在候选位置小窗口内精确匹配，超过阈值立即返回
+
         Args:
             image: 要匹配的图像
-            offset (int | tuple): 匹配区域偏移
             threshold (float): 相似度阈值
             scale_range (tuple[float, float]): 缩放范围 (min_scale, max_scale)
             scale_step (float): 缩放步长
+            margin (float): 粗匹配相似度高于 threshold - margin 的位置作为候选
+            downscale (callable): 返回缩小后图像的函数, 如 Device.image_downscale, 同一截图只缩放一次
 
         Returns:
             bool: 是否匹配成功
         """
         self.ensure_template()
+        image_height, image_width = image.shape[:2]
+        templates = [t for t in self._scale_templates(scale_range, scale_step)
+                     if t[1].shape[0] <= image_height and t[1].shape[1] <= image_width]
 
         best_similarity = -1
         best_scale = 1.0
         best_loc = None
-
-        # 在范围内连续扫描比例
-        scale = scale_range[0]
-        while scale <= scale_range[1]:
-            resized_template = cv2.resize(self.image, (0, 0), fx=scale, fy=scale)
-            if resized_template.shape[0] > image.shape[0] or resized_template.shape[1] > image.shape[1]:
-                scale += scale_step
-                continue
-
-            res = cv2.matchTemplate(image, resized_template, cv2.TM_CCOEFF_NORMED)
-            _, similarity, _, upper_left = cv2.minMaxLoc(res)
-
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_scale = scale
-                best_loc = upper_left
-
-            scale += scale_step
-
-        if best_similarity > threshold:
+        count = 0
+        image_small = None
+
+        def coarse(small):
+            nonlocal image_small
+            if image_small is None:
+                image_small = downscale(2) if downscale is not None else image_downscale(image, 2)
+            res = cv2.matchTemplate(image_small, small, cv2.TM_CCOEFF_NORMED)
+            h, w = small.shape[:2]
+            peaks = match_peaks(res, threshold=threshold - margin, size=(w, h), max_results=3)
+            if not peaks:
+                _, similarity, _, upper_left = cv2.minMaxLoc(res)
+                peaks = [(similarity, upper_left)]
+            return [(similarity, (x * 2, y * 2)) for similarity, (x, y) in peaks]
+
+        def fine(scale, template, candidates):
+            # candidates 为 None 时全图匹配
+            nonlocal best_similarity, best_scale, best_loc, count
+            height, width = template.shape[:2]
+            if candidates is None:
+                areas = [(0, 0, image_width, image_height)]
+            else:
+                pad = 4 + int(max(height, width) * (scale_range[1] - scale_range[0]) / 2)
+                areas = [(max(x - pad, 0), max(y - pad, 0),
+                          min(x + width + pad, image_width), min(y + height + pad, image_height))
+                         for x, y in candidates]
+            for x1, y1, x2, y2 in areas:
+                if x2 - x1 < width or y2 - y1 < height:
+                    continue
+                count += 1
+                res = cv2.matchTemplate(image[y1:y2, x1:x2], template, cv2.TM_CCOEFF_NORMED)
+                _, similarity, _, upper_left = cv2.minMaxLoc(res)
+                if similarity > best_similarity:
+                    best_similarity = similarity
+                    best_scale = scale
+                    best_loc = (upper_left[0] + x1, upper_left[1] + y1)
+            return best_similarity > threshold
+
+        # 从上次命中的比例开始，由近及远
+        scales = [t[0] for t in templates]
+        first = self._last_scale if self._last_scale in scales else None
+        if first is not None:
+            templates.sort(key=lambda t: abs(t[0] - first))
+
+        hit = False
+        if first is not None:
+            scale, template, small = templates.pop(0)
+            candidates = None if small is None else [loc for _, loc in coarse(small)]
+            hit = fine(scale, template, candidates)
+
+        if not hit and templates:
+            if all(small is not None for _, _, small in templates):
+                peaks = sorted([peak for _, _, small in templates for peak in coarse(small)], key=lambda p: -p[0])
+                # 合并各比例的候选位置
+                height, width = templates[0][1].shape[:2]
+                candidates = []
+                for _, (x, y) in peaks:
+                    if any(abs(x - cx) < width // 2 and abs(y - cy) < height // 2 for cx, cy in candidates):
+                        continue
+                    candidates.append((x, y))
+                    if len(candidates) >= 3:
+                        break
+            else:
+                # 模板太小，直接全图匹配
+                candidates = None
+            for scale, template, _ in templates:
+                if fine(scale, template, candidates):
+                    hit = True
+                    break
+
+        if hit:
+            self._last_scale = best_scale
             h, w = self.area[3] - self.area[1], self.area[2] - self.area[0]
             bottom_right = (best_loc[0] + w, best_loc[1] + h)
             self._button_offset = (best_loc[0], best_loc[1], bottom_right[0], bottom_right[1])
 
         logger.debug(
             f'Button: {self.name}, best_similarity: {best_similarity:.3f}, '
-            f'best_scale: {best_scale:.3f}, threshold: {threshold}, hit: {best_similarity > threshold}'
+            f'best_scale: {best_scale:.3f}, threshold: {threshold}, hit: {hit}, matches: {count}'
         )
-        return best_similarity > threshold
+        return hit
 
     def match_luma(self, image, offset=30, similarity=0.85):
         """
@@ -247,15 +391,43 @@ class Button(Resource):
             print(f'luma similarity: {sim}')
             return sim > similarity
 
-    def match_several(self, image, offset=30, threshold=0.85, static=True) -> list[dict]:
-        # areas = set()
+    def match_several(self, image, offset=30, threshold=0.85, static=True, max_results=None) -> list[dict]:
+        """
+        Find all instances of the button with one template matching.
+
+        Args:
+            image: Screenshot.
+            offset (int, tuple): Detection area offset, the same as match().
+            threshold (float):
+            static (bool): False to search the whole image.
+            max_results (int): Maximum number of instances, None for unlimited.
+
+        Returns:
+            list[dict]: {'area': tuple, 'location': tuple, 'similarity': float},
+                sorted by similarity descending, overlapping instances are suppressed.
+        """
+        self.ensure_template()
+        if static:
+            offset = self._offset_area(offset)
+            image = crop(image, offset + self.area)
+
+        res = cv2.matchTemplate(image, self.image, cv2.TM_CCOEFF_NORMED)
+        h, w = self.area[3] - self.area[1], self.area[2] - self.area[0]
+        peaks = match_peaks(res, threshold=threshold, size=(w, h), max_results=max_results)
+
         areas = []
-        while 1:
-            if self.match(image, offset=offset, threshold=threshold, static=static):
-                areas.append({'area': self._button_offset, 'location': self.location})
-                image = mask_area(image, self._button_offset)
+        for similarity, upper_left in peaks:
+            if static:
+                area = area_offset(self._button, offset[:2] + np.array(upper_left))
             else:
-                return areas
+                area = (upper_left[0], upper_left[1], upper_left[0] + w, upper_left[1] + h)
+            area = tuple(int(v) for v in area)
+            areas.append({'area': area, 'location': find_center(area), 'similarity': similarity})
+        if areas:
+            self._button_offset = areas[0]['area']
+
+        logger.debug(f'Button: {self.name}, match several: {len(areas)}, threshold: {threshold}')
+        return areas
 
     def appear_on(self, image, threshold=10) -> bool:
         """Check if the button appears on the image.
@@ -309,7 +481,10 @@ class Button(Resource):
         """
         self.__dict__['color'] = get_color(image, self.area)
         self.image = crop(image, self.area)
+        self.image_pyramid = None
+        self.image_scales = None
         self.__dict__['is_gif'] = False
+        self.load_count += 1
         return self.color
 
     def load_offset(self, button):
@@ -321,6 +496,7 @@ class Button(Resource):
         """
         offset = np.subtract(button.button, button._button)[:2]
         self._button_offset = area_offset(self._button, offset=offset)
+        self.load_count += 1
         
     def crop(self, area, image=None, name=None):
         """
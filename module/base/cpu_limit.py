@@ -0,0 +1,45 @@
+import os
+import threading
+from contextlib import contextmanager
+
+
+class CpuLimit:
+    """
+    Limit the number of instances running CPU-heavy phases, such as OCR, at the same time.
+
+    `semaphore` is a semaphore shared by all instances, set by the supervisor worker,
+    see module/webui/supervisor.py. There's no limit if it's None.
+    """
+    semaphore = None
+    # Dict shared with supervisor, key: pid, value: number of permits held by this process.
+    # Supervisor releases permits of workers killed in a CPU-heavy phase, see Supervisor.reclaim()
+    holders = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def _hold(cls, delta):
+        holders = cls.holders
+        if holders is None:
+            return
+        pid = os.getpid()
+        with cls._lock:
+            count = holders.get(pid, 0) + delta
+            if count > 0:
+                holders[pid] = count
+            else:
+                holders.pop(pid, None)
+
+    @classmethod
+    @contextmanager
+    def heavy(cls):
+        semaphore = cls.semaphore
+        if semaphore is None:
+            yield
+            return
+        semaphore.acquire()
+        cls._hold(1)
+        try:
+            yield
+        finally:
+            cls._hold(-1)
+            semaphore.release()
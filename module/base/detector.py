@@ -0,0 +1,230 @@
+from functools import cached_property, lru_cache
+
+import cv2
+import numpy as np
+
+from module.base.button import Button
+from module.base.utils import area_offset, color_similar, crop, get_color
+from module.logger import logger
+
+
+def area_overlap(area1, area2):
+    """
+    Args:
+        area1: (upper_left_x, upper_left_y, bottom_right_x, bottom_right_y)
+        area2: (upper_left_x, upper_left_y, bottom_right_x, bottom_right_y)
+
+    Returns:
+        bool: If two areas overlap.
+    """
+    return area1[0] < area2[2] and area2[0] < area1[2] and area1[1] < area2[3] and area2[1] < area1[3]
+
+
+def area_union(area1, area2):
+    return (
+        min(area1[0], area2[0]),
+        min(area1[1], area2[1]),
+        max(area1[2], area2[2]),
+        max(area1[3], area2[3]),
+    )
+
+
+class DetectResult:
+    __slots__ = ('button', 'similarity', 'hit', 'area')
+
+    def __init__(self, button, similarity, hit, area=None):
+        """
+        Args:
+            button (Button):
+            similarity (float): Template similarity, or color difference if detected by color.
+            hit (bool):
+            area (tuple): Area where the button is found, only available if hit.
+        """
+        self.button = button
+        self.similarity = similarity
+        self.hit = hit
+        self.area = area
+
+    def __bool__(self):
+        return bool(self.hit)
+
+    def __str__(self):
+        return f'DetectResult({self.button}, similarity={round(float(self.similarity), 3)}, hit={self.hit})'
+
+    __repr__ = __str__
+
+
+class ButtonDetector:
+    def __init__(self, buttons, offset=30, threshold=0.85, static=True):
+        """
+        Detect a set of buttons on the same screenshot at once.
+
+        Search areas of the buttons are grouped by overlapping, each group is
+        sliced (or cropped if exceeding the screen) from the screenshot only once,
+        and all the buttons in the group are matched on views of that region.
+
+        Args:
+            buttons (list[Button]):
+            offset (int, tuple): Detection area offset, the same as Button.match().
+                0 to detect buttons by color, the same as Button.appear_on().
+            threshold (float): Similarity threshold if offset,
+                or color threshold if not offset.
+            static (bool): False to search the whole screenshot.
+
+        Examples:
+            detector = ButtonDetector([MAIN_CHECK, REWARD_CHECK], offset=(30, 30), threshold=0.74)
+            result = detector.detect(image)
+            if result[MAIN_CHECK]:
+                pass
+        """
+        self.buttons = list(dict.fromkeys(buttons))
+        self.offset = offset
+        self.threshold = threshold
+        self.static = static
+
+    @cached_property
+    def search_offset(self):
+        return Button._offset_area(self.offset)
+
+    def _search_area(self, button):
+        return tuple(int(v) for v in self.search_offset + button.area)
+
+    @cached_property
+    def groups(self):
+        """
+        Returns:
+            list[tuple[tuple, list[Button]]]: List of (group area, buttons in group).
+        """
+        groups = []
+        for button in self.buttons:
+            if button.is_gif:
+                continue
+            area = self._search_area(button)
+            members = [button]
+            # Merge every group that overlaps, until no more overlapping
+            merged = True
+            while merged:
+                merged = False
+                for group in groups:
+                    if area_overlap(area, group[0]):
+                        area = area_union(area, group[0])
+                        members = group[1] + members
+                        groups.remove(group)
+                        merged = True
+                        break
+            groups.append((area, members))
+
+        return groups
+
+    @staticmethod
+    def _region(image, area):
+        """
+        Get a view of image if area is inside the image, otherwise a padded copy.
+        """
+        h, w = image.shape[:2]
+        x1, y1, x2, y2 = area
+        if x1 >= 0 and y1 >= 0 and x2 <= w and y2 <= h:
+            return image[y1:y2, x1:x2]
+        else:
+            return crop(image, area)
+
+    def _match(self, button, image):
+        """
+        Args:
+            button (Button):
+            image (np.ndarray): Search region of this button.
+
+        Returns:
+            float, tuple: Similarity, upper left point of the best match.
+        """
+        button.ensure_template()
+        res = cv2.matchTemplate(button.image, image, cv2.TM_CCOEFF_NORMED)
+        _, similarity, _, upper_left = cv2.minMaxLoc(res)
+        return similarity, upper_left
+
+    def _detect_color(self, image):
+        results = {}
+        for button in self.buttons:
+            diff = color_similar(color1=get_color(image, button.area), color2=button.color)
+            results[button] = DetectResult(button, diff, diff <= self.threshold, area=button.button)
+        return results
+
+    def _detect_static(self, image):
+        results = {}
+        offset = self.search_offset
+        for area, members in self.groups:
+            region = self._region(image, area)
+            for button in members:
+                x1, y1, x2, y2 = self._search_area(button)
+                view = region[y1 - area[1]:y2 - area[1], x1 - area[0]:x2 - area[0]]
+                similarity, upper_left = self._match(button, view)
+                hit = similarity > self.threshold
+                if hit:
+                    button._button_offset = area_offset(button._button, offset[:2] + np.array(upper_left))
+                results[button] = DetectResult(button, similarity, hit, area=button.button if hit else None)
+        return results
+
+    def _detect_full(self, image, downscale=None):
+        results = {}
+        for button in self.buttons:
+            if button.is_gif:
+                continue
+            if button.pyramid:
+                button.ensure_template()
+                similarity, upper_left = button._match_pyramid(image, self.threshold, downscale=downscale)
+            else:
+                similarity, upper_left = self._match(button, image)
+            hit = similarity > self.threshold
+            if hit:
+                h, w = button.area[3] - button.area[1], button.area[2] - button.area[0]
+                button._button_offset = (upper_left[0], upper_left[1], upper_left[0] + w, upper_left[1] + h)
+            results[button] = DetectResult(button, similarity, hit, area=button.button if hit else None)
+        return results
+
+    def detect(self, image, downscale=None):
+        """
+        Args:
+            image (np.ndarray): Screenshot.
+            downscale (callable): Function that returns `image` downscaled by a given level,
+                used by buttons with pyramid, see Button.match().
+
+        Returns:
+            dict[Button, DetectResult]: Results in the same order as input buttons.
+        """
+        if not self.offset:
+            results = self._detect_color(image)
+        elif self.static:
+            results = self._detect_static(image)
+        else:
+            results = self._detect_full(image, downscale=downscale)
+
+        # Gif buttons can't share search regions, fallback to Button.match()
+        for button in self.buttons:
+            if button not in results:
+                hit = button.match(image, offset=self.offset, threshold=self.threshold, static=self.static,
+                                   downscale=downscale)
+                results[button] = DetectResult(button, float(hit), hit, area=button.button if hit else None)
+
+        results = {button: results[button] for button in self.buttons}
+        logger.debug(
+            f'ButtonDetector: {len(self.buttons)} buttons, '
+            f'hit: {[str(result.button) for result in results.values() if result.hit]}'
+        )
+        return results
+
+
+@lru_cache(maxsize=64)
+def get_detector(buttons, offset=30, threshold=0.85, static=True):
+    """
+    Get a cached ButtonDetector, so search groups are calculated only once.
+
+    Args:
+        buttons (tuple[Button]):
+        offset (int, tuple):
+        threshold (float):
+        static (bool):
+
+    Returns:
+        ButtonDetector:
+    """
+    return ButtonDetector(buttons, offset=offset, threshold=threshold, static=static)
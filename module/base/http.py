@@ -0,0 +1,112 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from module.logger import logger
+
+
+class EndpointStat:
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.
+        self.min = 0.
+        self.max = 0.
+        self.last = 0.
+
+    def record(self, cost, ok=True):
+        """
+        Args:
+            cost (float): Seconds from sending the request to receiving headers.
+            ok (bool): False if request raised or got a 4xx/5xx response.
+        """
+        if not ok:
+            self.errors += 1
+        self.min = cost if not self.count else min(self.min, cost)
+        self.max = max(self.max, cost)
+        self.last = cost
+        self.total += cost
+        self.count += 1
+
+    @property
+    def avg(self):
+        return self.total / self.count if self.count else 0.
+
+    def __str__(self):
+        return (f'count={self.count}, errors={self.errors}, avg={self.avg * 1000:.1f}ms, '
+                f'min={self.min * 1000:.1f}ms, max={self.max * 1000:.1f}ms')
+
+
+class HttpSession(requests.Session):
+    """
+    requests.Session with a sized keep-alive pool and per-endpoint latency metrics.
+
+    Independent requests can be sent in parallel with map(),
+    the connection pool is shared by threads so each of them keeps its connection alive.
+    """
+
+    def __init__(self, pool_size=4, trust_env=True):
+        """
+        Args:
+            pool_size (int): Connections kept alive per host, also the max number of parallel requests.
+            trust_env (bool): False to ignore proxy in environment variables.
+        """
+        super().__init__()
+        self.trust_env = trust_env
+        self.pool_size = pool_size
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
+        # Key: 'POST /api/path', value: EndpointStat
+        self.metrics = {}
+        self._metrics_lock = threading.Lock()
+
+    @staticmethod
+    def endpoint(method, url):
+        return f'{method.upper()} {urlsplit(url).path or "/"}'
+
+    def request(self, method, url, *args, **kwargs):
+        start = time.perf_counter()
+        ok = False
+        try:
+            response = super().request(method, url, *args, **kwargs)
+            # 4xx and 5xx are errors too, they are what callers retry on
+            ok = response.ok
+            return response
+        finally:
+            cost = time.perf_counter() - start
+            key = self.endpoint(method, url)
+            with self._metrics_lock:
+                stat = self.metrics.get(key)
+                if stat is None:
+                    stat = self.metrics[key] = EndpointStat()
+                stat.record(cost, ok=ok)
+
+    def map(self, func, items, workers=None):
+        """
+        Call func on each item in parallel threads.
+
+        Args:
+            func (callable): Usually a method that sends requests through this session.
+            items (iterable):
+            workers (int): Number of threads, default to pool_size. 1 to call serially.
+
+        Returns:
+            list: Results in the same order as items.
+        """
+        items = list(items)
+        workers = min(workers or self.pool_size, len(items))
+        if workers <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items))
+
+    def show_metrics(self):
+        with self._metrics_lock:
+            metrics = list(self.metrics.items())
+        for key, stat in metrics:
+            logger.info(f'{key}: {stat}')
@@ -0,0 +1,92 @@
+import time
+
+from module.logger import logger
+
+
+class ScreenshotPacer:
+    """
+    Adaptive interval between screenshots, replacing a fixed Timer(Emulator_ScreenshotInterval).
+
+    - Right after a click, screen is expected to change, take screenshots every `fast` seconds.
+    - While screen is static, such as waiting for loading, back off exponentially up to `slow` seconds.
+    - Otherwise, use the normal `interval`.
+    """
+
+    def __init__(self, interval, fast=0.1, slow=1.0, backoff=1.5, click_window=1.0):
+        """
+        Args:
+            interval (float): Normal interval, Emulator_ScreenshotInterval.
+            fast (float): Interval within `click_window` seconds after a click.
+            slow (float): Max interval when screen is static.
+            backoff (float): Interval is multiplied by this on each static screenshot.
+            click_window (float): Seconds to keep fast after a click.
+        """
+        self.interval = interval
+        self.fast = min(fast, interval)
+        self.slow = max(slow, interval)
+        self.backoff = backoff
+        self.click_window = click_window
+        self.current = interval
+        # Time of the last screenshot and the last click
+        self.last = 0.
+        self.last_control = 0.
+
+        self.frames = 0
+        self.static_frames = 0
+        self.start = time.time()
+
+    def wait(self, last_control=0.):
+        """
+        Wait before taking a screenshot.
+
+        Args:
+            last_control (float): Time of the last click or swipe.
+        """
+        if last_control > self.last_control:
+            self.last_control = last_control
+            if last_control > self.last:
+                # Don't wait the static backoff after a click
+                self.current = self.fast
+        remain = self.last + self.current - time.time()
+        if remain > 0:
+            time.sleep(remain)
+        self.last = time.time()
+        self.frames += 1
+
+    def update(self, static):
+        """
+        Set interval to the next screenshot.
+
+        Args:
+            static (bool): If the screenshot just taken is the same as the last one.
+        """
+        if static:
+            self.static_frames += 1
+        if self.last - self.last_control < self.click_window:
+            self.current = self.fast
+        elif static:
+            self.current = min(max(self.current, self.interval) * self.backoff, self.slow)
+        else:
+            self.current = self.interval
+
+    @property
+    def fps(self):
+        cost = time.time() - self.start
+        return self.frames / cost if cost > 0 else 0.
+
+    def show(self, name=''):
+        """
+        Log effective FPS since last show() and reset statistics.
+
+        Args:
+            name (str): Such as task name.
+        """
+        if self.frames:
+            logger.info(f'Screenshot {name}: {self.frames} frames in {time.time() - self.start:.1f}s, '
+                        f'{self.fps:.2f} FPS, static: {self.static_frames}')
+        self.reset()
+
+    def reset(self):
+        self.frames = 0
+        self.static_frames = 0
+        self.start = time.time()
@@ -0,0 +1,86 @@
+import threading
+
+import cv2
+import numpy as np
+
+
+class ImageRingBuffer:
+    """
+    Keep the last `length` screenshots in one preallocated array, as a replacement of
+    deque(maxlen=length), so saving a screenshot copies into a slot instead of holding the frame.
+
+    Frames can be downscaled by `scale` to save memory, they are only used in error logs.
+    """
+
+    def __init__(self, length, scale=1):
+        """
+        Args:
+            length (int): Number of frames to keep.
+            scale (int): Downscale ratio, 1 to keep full resolution.
+        """
+        self.maxlen = max(int(length), 0)
+        self.scale = max(int(scale), 1)
+        self.buffer = None
+        self.times = [None] * self.maxlen
+        # Index of the next slot to write
+        self.index = 0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def _ensure_buffer(self, image):
+        height, width = image.shape[:2]
+        shape = (self.maxlen, height // self.scale, width // self.scale) + image.shape[2:]
+        if self.buffer is None or self.buffer.shape != shape or self.buffer.dtype != image.dtype:
+            # Resolution changed, drop old frames
+            self.buffer = np.empty(shape, dtype=image.dtype)
+            self.index = 0
+            self.count = 0
+        return self.buffer
+
+    def append(self, data):
+        """
+        Args:
+            data (dict): {'time': datetime, 'image': np.ndarray}, the same as what deque stores.
+        """
+        if not self.maxlen:
+            return
+        image = data['image']
+        with self._lock:
+            buffer = self._ensure_buffer(image)
+            slot = buffer[self.index]
+            if self.scale == 1:
+                np.copyto(slot, image)
+            else:
+                cv2.resize(image, slot.shape[1::-1], dst=slot, interpolation=cv2.INTER_AREA)
+            self.times[self.index] = data['time']
+            self.index = (self.index + 1) % self.maxlen
+            self.count = min(self.count + 1, self.maxlen)
+
+    def _slots(self):
+        start = (self.index - self.count) % self.maxlen if self.maxlen else 0
+        return [(start + i) % self.maxlen for i in range(self.count)]
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        """
+        Yields:
+            dict: {'time': datetime, 'image': np.ndarray}, from old to new.
+                Images are views of the buffer, use snapshot() if buffer is still being written.
+        """
+        for slot in self._slots():
+            yield {'time': self.times[slot], 'image': self.buffer[slot]}
+
+    def snapshot(self):
+        """
+        Returns:
+            list[dict]: Copies of all frames, from old to new.
+        """
+        with self._lock:
+            return [{'time': self.times[slot], 'image': self.buffer[slot].copy()} for slot in self._slots()]
+
+    def clear(self):
+        with self._lock:
+            self.index = 0
+            self.count = 0
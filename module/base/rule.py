@@ -0,0 +1,139 @@
+from module.base.timer import Timer
+from module.logger import logger
+
+
+class Detect:
+    """
+    A button to detect, with the same arguments as ModuleBase.appear().
+    Detects with the same arguments share one detection on each screenshot.
+    """
+
+    def __init__(self, button, offset=0, threshold=None, static=True):
+        """
+        Args:
+            button (Button):
+            offset (bool, int, tuple):
+            threshold (float):
+            static (bool):
+        """
+        self.button = button
+        self.offset = offset
+        self.threshold = threshold
+        self.static = static
+
+    def __str__(self):
+        return str(self.button)
+
+    __repr__ = __str__
+
+
+def to_detect(detect):
+    if isinstance(detect, Detect):
+        return detect
+    return Detect(detect)
+
+
+class RuleStat:
+    def __init__(self):
+        # Screenshots that the rule is evaluated
+        self.checks = 0
+        self.hits = 0
+        # Seconds spent in actions
+        self.cost = 0.
+
+    def __str__(self):
+        avg = self.cost / self.hits * 1000 if self.hits else 0.
+        return f'checks={self.checks}, hits={self.hits}, action_avg={avg:.1f}ms'
+
+
+class Rule:
+    def __init__(self, button=None, offset=0, threshold=None, static=True, interval=0, click_offset=0,
+                 action=None, require=(), exclude=(), guard=True, name=None):
+        """
+        A rule matches if `button` appears, all `require` appear and none of `exclude` appears.
+        Then `button` is clicked, or `action` is called.
+
+        Args:
+            button (Button): Button to detect and click, None for a rule with action only.
+            offset (bool, int, tuple): The same as ModuleBase.appear()
+            threshold (float):
+            static (bool):
+            interval (int, float): Rule is skipped within this interval after last hit,
+                shares interval timers with ModuleBase.appear().
+            click_offset (int, tuple): The same as ModuleBase.appear_then_click()
+            action (callable): Called instead of clicking button, returns False if the action didn't happen,
+                then the next rule will be tried.
+            require (list[Detect, Button]): Buttons must appear, Button is detected by color.
+            exclude (list[Detect, Button]): Buttons must not appear.
+            guard (bool, callable): Rule is skipped if False, or if callable and it returns False.
+                Use a callable to read config, so the rule follows config changes after RuleSet is built.
+            name (str): Name in logs and interval timer, default to button name.
+        """
+        self.detect = Detect(button, offset=offset, threshold=threshold, static=static) if button else None
+        self.interval = interval
+        self.click_offset = click_offset
+        self.action = action
+        self.require = [to_detect(d) for d in require]
+        self.exclude = [to_detect(d) for d in exclude]
+        self.guard = guard
+        if name is None:
+            name = button.name if button else getattr(action, '__name__', 'RULE')
+        self.name = name
+        self.stat = RuleStat()
+
+    @property
+    def detects(self):
+        if self.detect is not None:
+            yield self.detect
+        yield from self.require
+        yield from self.exclude
+
+    def is_enabled(self):
+        if callable(self.guard):
+            return bool(self.guard())
+        return bool(self.guard)
+
+    def __str__(self):
+        return f'Rule({self.name})'
+
+    __repr__ = __str__
+
+
+class RuleSet:
+    """
+    A table of rules, replacing `while 1` loops of `click_timer.reached() and self.appear_then_click(...)`.
+    Rules are evaluated by ModuleBase.run_rules() in order, the first matched one is run.
+
+    Examples:
+        rules = RuleSet([
+            Rule(FIGHT, threshold=20, interval=2),
+            Rule(SKIP, offset=10, interval=1, guard=lambda: self.config.SemiCombat_SkipStory),
+            Rule(MAIN_STORY_MARK_OUT, offset=30, interval=5, require=[Detect(MAIN_STORY_NORMAL, offset=30)]),
+        ], click_interval=0.3)
+        while 1:
+            self.device.screenshot()
+            if self.run_rules(rules):
+                continue
+    """
+
+    def __init__(self, rules, click_interval=0.3):
+        """
+        Args:
+            rules (list[Rule]):
+            click_interval (int, float): No rules are evaluated within this interval after any hit.
+        """
+        self.rules = list(rules)
+        self.click_timer = Timer(click_interval)
+        # Screenshots evaluated
+        self.frames = 0
+        # Buttons detected, and seconds spent in detection
+        self.detects = 0
+        self.detect_cost = 0.
+
+    def show_stats(self):
+        if not self.frames:
+            return
+        logger.info(f'RuleSet: frames={self.frames}, detects/frame={self.detects / self.frames:.1f}, '
+                    f'detect_avg={self.detect_cost / self.frames * 1000:.1f}ms')
+        for rule in self.rules:
+            logger.info(f'{rule.name}: {rule.stat}')
@@ -2,6 +2,7 @@ import os
 
 import imageio
 
+from module.base.atlas import TEMPLATE_ATLAS
 from module.base.button import Button
 from functools import cached_property
 from module.base.resource import Resource
@@ -10,14 +11,18 @@ from module.map_detection.utils import Points
 
 
 class Template(Resource):
-    def __init__(self, file):
+    def __init__(self, file, pyramid=None):
         """
         Args:
             file (dict[str], str): Filepath of template file.
+            pyramid (int): Downscale ratio of coarse-to-fine matching in match() and match_result(), such as 2, 4.
+                None to search the whole image at full resolution.
         """
         self.raw_file = file
+        self.pyramid = pyramid
         self._image = None
         self._image_binary = None
+        self._image_pyramid = None
 
         self.resource_add(self.file)
 
@@ -53,7 +58,11 @@ class Template(Resource):
                     image = self.pre_process(image)
                     self._image += [image, cv2.flip(image, 1)]
             else:
-                self._image = self.pre_process(load_image(self.file))
+                # Images in atlas are already pre-processed, see dev_tools/assets_atlas.py
+                image = TEMPLATE_ATLAS.get(self.file)
+                if image is None:
+                    image = self.pre_process(load_image(self.file))
+                self._image = image
 
         return self._image
 
@@ -67,8 +76,10 @@ class Template(Resource):
                     _, image_binary = cv2.threshold(image_gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
                     self._image_binary.append(image_binary)
             else:
-                image_gray = cv2.cvtColor(self.image, cv2.COLOR_BGR2GRAY)
-                _, self._image_binary = cv2.threshold(image_gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+                self._image_binary = TEMPLATE_ATLAS.get(self.file, variant='binary')
+                if self._image_binary is None:
+                    image_gray = cv2.cvtColor(self.image, cv2.COLOR_BGR2GRAY)
+                    _, self._image_binary = cv2.threshold(image_gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
 
         return self._image_binary
 
@@ -80,6 +91,7 @@ class Template(Resource):
         super().resource_release()
         self._image = None
         self._image_binary = None
+        self._image_pyramid = None
 
     def pre_process(self, image):
         """
@@ -98,12 +110,14 @@ class Template(Resource):
         else:
             return self.image.shape[0:2][::-1]
 
-    def match(self, image, scaling=1.0, similarity=0.85):
+    def match(self, image, scaling=1.0, similarity=0.85, downscale=None):
         """
         Args:
             image:
             scaling (int, float): Scale the template to match image
             similarity (float): 0 to 1.
+            downscale (callable): Function that returns `image` downscaled by a given level,
+                such as Device.image_downscale, see _match_pyramid().
 
         Returns:
             bool: If matches.
@@ -111,6 +125,7 @@ class Template(Resource):
         scaling = 1 / scaling
         if scaling != 1.0:
             image = cv2.resize(image, None, fx=scaling, fy=scaling)
+            downscale = None
 
         if self.is_gif:
             for template in self.image:
@@ -122,6 +137,10 @@ class Template(Resource):
 
             return False
 
+        elif self.pyramid:
+            sim, _ = self._match_pyramid(image, similarity=similarity, downscale=downscale)
+            return sim > similarity
+
         else:
             res = cv2.matchTemplate(image, self.image, cv2.TM_CCOEFF_NORMED)
             _, sim, _, _ = cv2.minMaxLoc(res)
@@ -183,18 +202,53 @@ class Template(Resource):
             button.load_color(image)
         return button
 
-    def match_result(self, image, name=None):
+    def _match_pyramid(self, image, similarity=0.85, downscale=None):
+        """
+        Coarse-to-fine matching, see match_pyramid().
+
+        Args:
+            image (np.ndarray):
+            similarity (float): 0 to 1.
+            downscale (callable): Function that returns `image` downscaled by a given level,
+                so templates matching on the same screenshot share one resize.
+
+        Returns:
+            float: Similarity.
+            tuple[int, int]: Upper left.
+        """
+        level = self.pyramid
+        width, height = self.size
+        # 模板缩小后太小则不再降采样
+        while level > 1 and min(height, width) // level < 6:
+            level //= 2
+        if level <= 1:
+            res = cv2.matchTemplate(image, self.image, cv2.TM_CCOEFF_NORMED)
+            _, sim, _, point = cv2.minMaxLoc(res)
+            return sim, point
+
+        if self._image_pyramid is None or self._image_pyramid[0] != level:
+            small = cv2.resize(self.image, (width // level, height // level), interpolation=cv2.INTER_AREA)
+            self._image_pyramid = (level, small)
+        image_small = downscale(level) if downscale is not None else None
+        return match_pyramid(image, self.image, level, template_small=self._image_pyramid[1],
+                             image_small=image_small, threshold=similarity)
+
+    def match_result(self, image, name=None, downscale=None):
         """
         Args:
             image:
             name (str):
+            downscale (callable): See match().
 
         Returns:
             float: Similarity
             Button:
         """
-        res = cv2.matchTemplate(image, self.image, cv2.TM_CCOEFF_NORMED)
-        _, sim, _, point = cv2.minMaxLoc(res)
+        if self.pyramid and not self.is_gif:
+            sim, point = self._match_pyramid(image, downscale=downscale)
+        else:
+            res = cv2.matchTemplate(image, self.image, cv2.TM_CCOEFF_NORMED)
+            _, sim, _, point = cv2.minMaxLoc(res)
         # print(self.file, sim)
 
         button = self._point_to_button(point, image=image, name=name)
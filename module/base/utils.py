@@ -449,6 +449,140 @@ def rgb2luma(image):
     luma, _, _ = cv2.split(image)
     return luma
 
+def match_peaks(res, threshold, size, max_results=None):
+    """
+    Find all peaks on a result of cv2.matchTemplate, with non-maximum suppression.
+
+    Args:
+        res (np.ndarray): Result of cv2.matchTemplate.
+        threshold (float): Peaks with similarity <= threshold are dropped.
+        size (tuple[int, int]): (width, height) of the template,
+            peaks whose template areas overlap a better peak are suppressed.
+        max_results (int): Maximum number of peaks, None for unlimited.
+
+    Returns:
+        list[tuple[float, tuple[int, int]]]: List of (similarity, upper_left), sorted by similarity descending.
+    """
+    # Local maximums in 3x3 neighbourhood
+    dilated = cv2.dilate(res, np.ones((3, 3), dtype=np.uint8))
+    ys, xs = np.nonzero((res > threshold) & (res >= dilated))
+    if not len(xs):
+        return []
+    scores = res[ys, xs]
+    order = np.argsort(-scores, kind='stable')
+
+    width, height = size
+    peaks = []
+    kept = np.empty((0, 2), dtype=np.int64)
+    for index in order:
+        x, y = xs[index], ys[index]
+        if len(kept) and np.any((np.abs(kept[:, 0] - x) < width) & (np.abs(kept[:, 1] - y) < height)):
+            continue
+        peaks.append((float(scores[index]), (int(x), int(y))))
+        if max_results is not None and len(peaks) >= max_results:
+            break
+        kept = np.append(kept, [[x, y]], axis=0)
+    return peaks
+
+
+def image_downscale(image, level):
+    """
+    Downscale an image by `level` with area interpolation.
+
+    Args:
+        image (np.ndarray):
+        level (int): Downscale ratio, such as 2, 4.
+
+    Returns:
+        np.ndarray:
+    """
+    height, width = image.shape[:2]
+    return cv2.resize(image, (max(width // level, 1), max(height // level, 1)), interpolation=cv2.INTER_AREA)
+
+
+def match_pyramid(image, template, level, template_small=None, image_small=None,
+                  threshold=0.85, margin=0.15, candidates=3):
+    """
+    Coarse-to-fine template matching.
+    Match on images downscaled by `level` to find candidates,
+    then match again at full resolution in a small window around each candidate.
+    Similarity is computed at full resolution, so thresholds are the same as a full search.
+
+    Args:
+        image (np.ndarray): Screenshot.
+        template (np.ndarray):
+        level (int): Downscale ratio, such as 2, 4.
+        template_small (np.ndarray): Template downscaled by `level`, cache it for templates used frequently.
+        image_small (np.ndarray): Image downscaled by `level`, share it between templates matching on the same image.
+        threshold (float): Similarity threshold that caller uses.
+        margin (float): Candidates with coarse similarity > threshold - margin will be refined.
+        candidates (int): Maximum number of candidates, the best coarse location is always refined.
+
+    Returns:
+        float: Similarity.
+        tuple[int, int]: Upper left of the best match.
+    """
+    height, width = template.shape[:2]
+    if template_small is None:
+        template_small = cv2.resize(
+            template, (max(width // level, 1), max(height // level, 1)), interpolation=cv2.INTER_AREA)
+    if image_small is None:
+        image_small = image_downscale(image, level)
+    res = cv2.matchTemplate(image_small, template_small, cv2.TM_CCOEFF_NORMED)
+    h, w = template_small.shape[:2]
+    peaks = match_peaks(res, threshold=threshold - margin, size=(w, h), max_results=candidates)
+    if not peaks:
+        _, similarity, _, upper_left = cv2.minMaxLoc(res)
+        peaks = [(similarity, upper_left)]
+
+    best_similarity, best_loc = -1., (0, 0)
+    image_height, image_width = image.shape[:2]
+    pad = level * 2
+    for _, (x, y) in peaks:
+        x1, y1 = max(x * level - pad, 0), max(y * level - pad, 0)
+        x2, y2 = min(x * level + width + pad, image_width), min(y * level + height + pad, image_height)
+        if x2 - x1 < width or y2 - y1 < height:
+            continue
+        res = cv2.matchTemplate(image[y1:y2, x1:x2], template, cv2.TM_CCOEFF_NORMED)
+        _, similarity, _, upper_left = cv2.minMaxLoc(res)
+        if similarity > best_similarity:
+            best_similarity, best_loc = similarity, (upper_left[0] + x1, upper_left[1] + y1)
+    return best_similarity, best_loc
+
+
+def image_fingerprint(image, scale=8):
+    """
+    A downsampled copy of the image, to tell if two screenshots are the same cheaply.
+
+    Args:
+        image (np.ndarray): Shape (height, width, channel)
+        scale (int): Downsample ratio.
+
+    Returns:
+        np.ndarray: Shape (height // scale, width // scale, channel)
+    """
+    height, width = image.shape[:2]
+    return cv2.resize(image, (width // scale, height // scale), interpolation=cv2.INTER_AREA)
+
+
+def image_diff_ratio(image1, image2, threshold=16):
+    """
+    Args:
+        image1 (np.ndarray):
+        image2 (np.ndarray): Same shape as image1.
+        threshold (int): Pixels with any channel differs more than this are considered changed.
+
+    Returns:
+        float: Ratio of changed pixels, 1.0 if shapes are different.
+    """
+    if image1.shape != image2.shape or not image1.size:
+        return 1.
+    diff = cv2.absdiff(image1, image2)
+    if diff.ndim == 3:
+        diff = diff.max(axis=2)
+    return np.count_nonzero(diff > threshold) / diff.size
+
+
 def sort_buttons_by_location(buttons):
     """
     返回排序后的button列表
@@ -9,6 +9,7 @@ from typing import Dict, Tuple
 
 import requests
 
+from module.base.http import HttpSession
 from module.blablalink.langs import BlaLangs
 from module.config.delay import next_month
 from module.config.utils import deep_get
@@ -42,7 +43,7 @@ class Blablalink(UI):
 
     def __init__(self, config):
         super().__init__(config, independent=True)
-        self.session = requests.Session()
+        self.session = HttpSession(pool_size=self.config.HTTP_PARALLEL_REQUESTS)
         self.common_headers = self.base_headers.copy()
         self._cdk_temp_path = Path(f'./tmp/{config.config_name}/cdk_history.json')  # 临时文件路径
         self._prepare_config()
@@ -260,9 +261,8 @@ class Blablalink(UI):
         selected = random.sample(post_uuids, min(5, len(post_uuids)))
         logger.info(f'Randomly selected {len(selected)} posts to like')
 
-        for post_uuid in selected:
-            self.like_post(post_uuid)
-            time.sleep(random.uniform(1.5, 3.5))
+        # 每个请求前已有随机等待, 并发发送
+        self.session.map(self.like_post, selected)
 
     def open_post(self, post_uuid: str) -> bool:
         """打开单个帖子"""
@@ -292,9 +292,8 @@ class Blablalink(UI):
         selected = random.sample(post_uuids, min(5, len(post_uuids)))
         logger.info(f'Randomly selected {len(selected)} posts to browse')
 
-        for post_uuid in selected:
-            self.open_post(post_uuid)
-            time.sleep(random.uniform(2.0, 5.0))
+        # 每个请求前已有随机等待, 并发发送
+        self.session.map(self.open_post, selected)
 
     def _get_random_emoji(self) -> str:
         """获取随机表情URL"""
@@ -463,8 +462,12 @@ class Blablalink(UI):
         """CDK兑换功能"""
         logger.info('Starting CDK redemption task')
 
-        # 1. 获取兑换历史记录并追加到临时文件
-        redeemed_cdks = self.get_cdk_redemption_history()
+        # 1. 获取兑换历史记录并追加到临时文件, 批量模式下同时获取官方CDK
+        if cdk:
+            redeemed_cdks = self.get_cdk_redemption_history()
+        else:
+            redeemed_cdks, official_cdks = self.session.map(
+                lambda func: func(), [self.get_cdk_redemption_history, self.get_official_cdks])
         self._append_cdks_to_temp(redeemed_cdks)
 
         # 2. 从临时文件加载所有已记录的 CDK
@@ -482,7 +485,7 @@ class Blablalink(UI):
                     logger.info(f'CDK {code} already redeemed or recorded, skipping')
         else:
             # 批量模式：官方 + 额外来源
-            unredeemed_cdks = self.get_official_cdks().copy()
+            unredeemed_cdks = official_cdks.copy()
             if self.config.CDK_Extra:
                 sources = self.config.CDK_Source
                 if sources:
@@ -654,7 +657,7 @@ class Blablalink(UI):
         """从gamewith.jp提取CDK"""
         try:
             logger.info(f'Fetching CDKs from gamewith.jp: {url}')
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             response.raise_for_status()
 
             # 使用正则表达式提取CDK
@@ -767,44 +770,43 @@ class Blablalink(UI):
             logger.error(f'Exception when getting role info: {str(e)}')
             return {}
 
-    def get_all_commodities(self) -> list:
-        """分页获取所有商品列表"""
-        commodities = []
-        page_num = 1
-        page_size = 10
-
-        while True:
-            try:
-                result = self._request_with_retry(
-                    'POST',
-                    'https://api.blablalink.com/api/lip/proxy/commodity/Commodity/GetUserCommodityList',
-                    json={'page_num': page_num, 'page_size': page_size, 'game_id_list': ['29080'], 'is_bind_lip': True},
-                )
-
-                if result.get('code') != 0:
-                    logger.error(f'Failed to get commodities page {page_num}: {result.get("msg", "Unknown error")}')
-                    break
-
-                # 添加当前页的商品
-                page_commodities = result.get('data', {}).get('commodity_list', [])
-                commodities.extend(page_commodities)
-
-                # 计算总页数
-                total_num = result.get('data', {}).get('total_num', 0)
-                total_pages = (total_num + page_size - 1) // page_size
+    def get_commodity_page(self, page_num: int, page_size: int = 10) -> Dict:
+        """获取一页商品列表, 失败返回空字典"""
+        try:
+            result = self._request_with_retry(
+                'POST',
+                'https://api.blablalink.com/api/lip/proxy/commodity/Commodity/GetUserCommodityList',
+                json={'page_num': page_num, 'page_size': page_size, 'game_id_list': ['29080'], 'is_bind_lip': True},
+            )
+        except Exception as e:
+            logger.error(f'Exception when getting commodities page {page_num}: {str(e)}')
+            return {}
 
-                logger.info(f'Got page {page_num}/{total_pages} with {len(page_commodities)} commodities')
+        if result.get('code') != 0:
+            logger.error(f'Failed to get commodities page {page_num}: {result.get("msg", "Unknown error")}')
+            return {}
+        return result.get('data', {})
 
-                # 检查是否还有下一页
-                if page_num >= total_pages:
-                    break
+    def get_all_commodities(self) -> list:
+        """分页获取所有商品列表, 第一页得到总页数后并发获取其余页"""
+        page_size = 10
 
-                page_num += 1
-                time.sleep(random.uniform(1.0, 2.0))  # 页面间延迟
+        data = self.get_commodity_page(1, page_size)
+        if not data:
+            return []
+        total_num = data.get('total_num', 0)
+        total_pages = (total_num + page_size - 1) // page_size
+        pages = [data] + self.session.map(
+            lambda page_num: self.get_commodity_page(page_num, page_size), range(2, total_pages + 1))
 
-            except Exception as e:
-                logger.error(f'Exception when getting commodities: {str(e)}')
+        commodities = []
+        for page_num, data in enumerate(pages, start=1):
+            if not data:
+                # 与逐页获取时一致, 某页失败则丢弃之后的页
                 break
+            page_commodities = data.get('commodity_list', [])
+            commodities.extend(page_commodities)
+            logger.info(f'Got page {page_num}/{total_pages} with {len(page_commodities)} commodities')
 
         logger.info(f'Total commodities: {len(commodities)}')
         return commodities
@@ -904,6 +906,7 @@ class Blablalink(UI):
                 elif task == 'exchange':
                     self.exchange()
                     self.config.task_delay(target=next_month())
+                self.session.show_metrics()
                 return
         except MissingHeader:
             logger.error('Please check all parameters settings')
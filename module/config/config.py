@@ -1,6 +1,9 @@
+import atexit
 import copy
 import operator
+import os
 from datetime import datetime, timedelta
+from functools import lru_cache
 import threading
 import time
 
@@ -42,6 +45,20 @@ class Function:
             return False
 
 
+@lru_cache(maxsize=4)
+def priority_filter(priority):
+    """
+    Args:
+        priority (str): Such as ManualConfig.SCHEDULER_PRIORITY
+
+    Returns:
+        Filter: Loaded filter, shared by all get_next_task() calls.
+    """
+    f = Filter(regex=r"(.*)", attr=["command"])
+    f.load(priority)
+    return f
+
+
 def name_to_function(name):
     """
     Args:
@@ -63,7 +80,9 @@ class NikkeConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher):
     def __setattr__(self, key, value):
         if key in self.bound:
             path = self.bound[key]
-            self.modified[path] = value
+            # flush() may be reading data on the timer thread
+            with self._lock:
+                self.modified[path] = value
             if self.auto_update:
                 self.update()
         else:
@@ -84,6 +103,13 @@ class NikkeConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher):
         # Force override variables
         # Key: Argument name in GeneratedConfig. Value: Modified value.
         self.overridden = {}
+        # Saved arguments that haven't been written into file yet, writes in a short time are merged.
+        # Key: Argument path in yaml file. Value: Modified value.
+        self.journal = {}
+        # (st_mtime_ns, st_size) of the config file when it was last read or written
+        self._file_stat = None
+        self._flush_timer: threading.Timer = None
+        self._lock = threading.RLock()
         # Scheduler queue, will be updated in `get_next_task()`, list of Function objects
         # pending_task: Run time has been reached, but haven't been run due to task scheduling.
         # waiting_task: Run time haven't been reached, wait needed.
@@ -123,22 +149,42 @@ class NikkeConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher):
         if self.is_template_config:
             return
 
-        self.load()
-        if task is None:
-            # Bind `Alas` by default which includes emulator settings.
-            task = name_to_function("NKAS")
-        else:
-            # Bind a specific task for debug purpose.
-            task = name_to_function(task)
-        self.bind(task)
-        self.task = task
-        self.save()
+        with self._lock:
+            self.load()
+            if task is None:
+                # Bind `Alas` by default which includes emulator settings.
+                task = name_to_function("NKAS")
+            else:
+                # Bind a specific task for debug purpose.
+                task = name_to_function(task)
+            self.bind(task)
+            self.task = task
+            self.save()
+
+    def file_stat(self):
+        """
+        Returns:
+            tuple[int, int] | None: (st_mtime_ns, st_size) of the config file, None if not exists.
+        """
+        try:
+            stat = os.stat(filepath_config(self.config_name))
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
 
     def load(self):
-        self.data = self.read_file(self.config_name)
-        self.config_override()
-        for path, value in self.modified.items():
-            deep_set(self.data, keys=path, value=value)
+        with self._lock:
+            # Config file is not modified since last read or write, data in memory is the latest
+            stat = self.file_stat()
+            if not self.data or stat is None or stat != self._file_stat:
+                self.data = self.read_file(self.config_name)
+                self._file_stat = stat
+                # Saved but not written yet
+                for path, value in self.journal.items():
+                    deep_set(self.data, keys=path, value=value)
+            self.config_override()
+            for path, value in self.modified.items():
+                deep_set(self.data, keys=path, value=value)
 
     def bind(self, func, func_set=None):
         """
@@ -178,22 +224,73 @@ class NikkeConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher):
         for arg, value in self.overridden.items():
             super().__setattr__(arg, value)
 
-    def save(self, mod_name='nkas'):
+    def save(self, mod_name='nkas', flush=False):
+        """
+        Args:
+            mod_name (str):
+            flush (bool): True to write file immediately,
+                False to merge with other writes in CONFIG_WRITE_DELAY seconds.
+        """
         if not self.modified:
+            if flush:
+                self.flush()
             return False
-        for path, value in self.modified.items():
-            deep_set(self.data, keys=path, value=value)
-        logger.info(
-            f"Save config {filepath_config(self.config_name, mod_name)}, {dict_to_kv(self.modified)}"
-        )
-        # Don't use self.modified = {}, that will create a new object.
-        self.modified.clear()
-        self.write_file(self.config_name, data=self.data)
-    def update(self):
-        self.load()
-        self.config_override()
-        self.bind(self.task)
-        self.save()
+        with self._lock:
+            for path, value in self.modified.items():
+                deep_set(self.data, keys=path, value=value)
+            logger.info(
+                f"Save config {filepath_config(self.config_name, mod_name)}, {dict_to_kv(self.modified)}"
+            )
+            self.journal.update(self.modified)
+            # Don't use self.modified = {}, that will create a new object.
+            self.modified.clear()
+
+        if flush or not self.CONFIG_WRITE_DELAY:
+            self.flush()
+        elif self._flush_timer is None:
+            if not self._flush_registered:
+                atexit.register(self.flush)
+                self._flush_registered = True
+            self._flush_timer = threading.Timer(self.CONFIG_WRITE_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    _flush_registered = False
+
+    def flush(self):
+        """
+        Write saved arguments into file.
+        """
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self.journal:
+                return
+            if self.file_stat() != self._file_stat:
+                # Config file is modified by GUI after last read, merge into it instead of overwriting
+                logger.info(f'Config "{self.config_name}" changed before writing, reload and merge')
+                self.data = self.read_file(self.config_name)
+                # Only saved arguments, `modified` may be half of a batched update not saved yet
+                for path, value in self.journal.items():
+                    deep_set(self.data, keys=path, value=value)
+            self.write_file(self.config_name, data=self.data)
+            self.journal.clear()
+            self._file_stat = self.file_stat()
+
+    def start_watching(self) -> None:
+        # Writes not flushed yet are from this process, they are not config changes
+        self.flush()
+        super().start_watching()
+
+    def update(self, flush=False):
+        # load() applies `modified` into data, don't let a delayed flush write them before they are saved
+        with self._lock:
+            self.load()
+            self.config_override()
+            self.bind(self.task)
+            self.save(flush=flush)
+
     def config_override(self):
         now = datetime.now().replace(microsecond=0)
         limited = set()
@@ -286,12 +383,12 @@ class NikkeConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher):
         Reward (Enable, 1989-12-27 00:00:00)
         """
         for func in self.data.values():
-            func = Function(func)
             """
                 跳过Scheduler.Enable为False的任务
             """
-            if not func.enable:
+            if not deep_get(func, keys="Scheduler.Enable", default=False):
                 continue
+            func = Function(func)
             """
                 从配置中获取的运行时间格式错误
             """
@@ -307,8 +404,7 @@ class NikkeConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher):
         """
             任务优先级
         """
-        f = Filter(regex=r"(.*)", attr=["command"])
-        f.load(self.SCHEDULER_PRIORITY)
+        f = priority_filter(self.SCHEDULER_PRIORITY)
         if pending:
             """
                 待执行队列不进行排序，因为会影响到重启任务
@@ -376,7 +472,7 @@ class NikkeConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher):
                 task = self.task.command
             logger.info(f"Delay task `{task}` to {run} ({kv})")
             self.modified[f'{task}.Scheduler.NextRun'] = run
-            self.update()
+            self.update(flush=True)
         else:
             raise ScriptError(
                 "Missing argument in delay_next_run, should set at least one"
@@ -393,7 +489,7 @@ class NikkeConfig(ConfigUpdater, ManualConfig, GeneratedConfig, ConfigWatcher):
             )
             self.modified[f"{task}.Scheduler.Enable"] = True
             if self.auto_update:
-                self.update()
+                self.update(flush=True)
             return True
         else:
             logger.info(f"Task call: {task} (skipped because disabled by user)")
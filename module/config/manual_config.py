@@ -75,9 +75,37 @@ class ManualConfig:
 
     FORWARD_PORT_RANGE = (20000, 21000)
 
+    # 在这个时间(秒)内的多次配置修改合并为一次写入, 0 为每次修改都立即写入
+    CONFIG_WRITE_DELAY = 0.5
+    # 等待任务时, 由 GUI 启动的实例在配置修改或更新时被立即唤醒, 此为最长等待间隔(秒)
+    SCHEDULER_WAKEUP_INTERVAL = 60
+    # 不是由 GUI 启动时, 检查配置文件修改的间隔(秒)
+    SCHEDULER_POLL_INTERVAL = 5
+
     BUTTON_OFFSET = 30
     BUTTON_MATCH_SIMILARITY = 0.74
     COLOR_SIMILAR_THRESHOLD = 10
+    # 截图指纹缩放倍数，画面指纹不变时复用上一帧的识别结果，0 为关闭
+    SCREENSHOT_FINGERPRINT_SCALE = 8
+    # 后台线程持续截图, screenshot() 直接取最新的一帧
+    SCREENSHOT_STREAM = False
+    # 超过这个时间(秒)没有请求截图时, 后台截图暂停
+    SCREENSHOT_STREAM_IDLE = 1
+    # 自适应截图间隔: 点击后加快截图, 画面静止时逐渐放慢, 关闭时固定使用 Emulator_ScreenshotInterval
+    # 开启后点击后的截图间隔会低于 Emulator_ScreenshotInterval, 默认关闭
+    SCREENSHOT_ADAPTIVE = False
+    # 点击后 SCREENSHOT_CLICK_WINDOW 秒内的截图间隔(秒)
+    SCREENSHOT_INTERVAL_FAST = 0.1
+    SCREENSHOT_CLICK_WINDOW = 1.0
+    # 画面静止时每次截图间隔乘以 SCREENSHOT_BACKOFF, 最长 SCREENSHOT_INTERVAL_SLOW 秒
+    SCREENSHOT_INTERVAL_SLOW = 1.0
+    SCREENSHOT_BACKOFF = 1.5
+    # 画面指纹变化的比例小于这个值时视为静止, 比如只有加载图标在转
+    SCREENSHOT_STATIC_RATIO = 0.005
+    # click_and_wait_change(): 区域内变化像素的比例超过这个值时视为画面已响应
+    WAIT_CHANGE_RATIO = 0.02
+    # 画面响应后, 区域保持不变这么久(秒)视为已稳定
+    WAIT_CHANGE_SETTLE = 0.3
 
     WAIT_BEFORE_SAVING_SCREEN_SHOT = 1
 
@@ -88,6 +116,8 @@ class ManualConfig:
 
     DROIDCAST_RAW_FILEPATH_LOCAL = "./bin/DroidCast/DroidCastS-release-1.1.5.apk"
     DROIDCAST_RAW_FILEPATH_REMOTE = "/data/local/tmp/DroidCastS.apk"
+    # RGB565 转 RGB888 的方式, 'cv2' 或 'lut' (查表)
+    DROIDCAST_RAW_DECODE = 'cv2'
 
     EVENTS = [
         {
@@ -174,9 +204,29 @@ class ManualConfig:
     ]
 
     Error_ScreenshotLength = 1
+    # 错误日志截图的缩小倍数, 1 为原始分辨率
+    Error_ScreenshotScale = 1
 
     DEVICE_OVER_HTTP = False
 
+    # 互不依赖的 HTTP 请求 (帖子, 商品分页等) 的并发数, 1 为串行
+    HTTP_PARALLEL_REQUESTS = 3
+
+    # 多开时共用一个 OCR 进程, 由 GUI 启动, 连接失败时使用本进程的 OCR 模型
+    OCR_SERVER = False
+    OCR_SERVER_ADDRESS = ('127.0.0.1', 22268)
+    # 连接 OCR 进程失败后, 使用本进程的模型, 每隔这么久(秒)重试连接
+    OCR_SERVER_RETRY_INTERVAL = 30
+
+    # 多开时由 GUI 预先启动空闲进程, 提前完成导入和 OCR 模型加载, 启动实例时直接使用
+    SUPERVISOR = False
+    # 保持预热的空闲进程数量
+    SUPERVISOR_WARM_WORKERS = 1
+    # 每个实例绑定的 CPU 核心数, 0 为不绑定
+    SUPERVISOR_CPUS_PER_INSTANCE = 2
+    # 同时进行 OCR 等高 CPU 占用操作的实例数量, 0 为不限制
+    SUPERVISOR_HEAVY_LIMIT = 2
+
     # 独立任务，不依赖游戏运行
     INDEPENDENT_TASKS = ['BlaDaily', 'BlaCDK', 'BlaExchange', 'ScreenRotate', 'UpdateHosts']
     INDEPENDENT_TASKS_UNDER = ["bla_daily", "bla_cdk", "bla_exchange", 'screen_rotate', 'update_hosts']
@@ -1,4 +1,5 @@
 import os
+import time
 from datetime import datetime
 
 from module.config.utils import DEFAULT_TIME, filepath_config
@@ -8,9 +9,17 @@ from module.logger import logger
 class ConfigWatcher:
     config_name = 'nkas'
     start_mtime = DEFAULT_TIME
+    # (st_mtime_ns, st_size) when start watching
+    start_stat = None
+    # Event shared with GUI, set when config is saved by GUI or instance should stop.
+    # None if not started by GUI
+    wakeup_event = None
 
     def start_watching(self) -> None:
+        # Clear before reading stat, so any change after this will wake up wait_change()
+        self._clear_wakeup()
         self.start_mtime = self.get_mtime()
+        self.start_stat = self.get_stat()
 
     def get_mtime(self) -> datetime:
         """
@@ -20,14 +29,63 @@ class ConfigWatcher:
         mtime = datetime.fromtimestamp(timestamp).replace(microsecond=0)
         return mtime
 
+    def get_stat(self):
+        """
+        Returns:
+            tuple[int, int] | None: (st_mtime_ns, st_size), None if file not exists.
+        """
+        try:
+            stat = os.stat(filepath_config(self.config_name))
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def should_reload(self) -> bool:
         """
             Returns:
                 bool: Whether the file has been modified and configs should reload
         """
-        mtime = self.get_mtime()
-        if mtime > self.start_mtime:
-            logger.info(f'Config "{self.config_name}" changed at {mtime}')
+        # Compare in nanoseconds, a change within the same second is still detected
+        stat = self.get_stat()
+        if stat != self.start_stat:
+            if stat is not None:
+                mtime = datetime.fromtimestamp(stat[0] / 1e9).replace(microsecond=0)
+                logger.info(f'Config "{self.config_name}" changed at {mtime}')
             return True
         else:
             return False
+
+    def _clear_wakeup(self):
+        event = self.wakeup_event
+        if event is None:
+            return
+        try:
+            event.clear()
+        except (OSError, EOFError):
+            # GUI exited
+            self.__class__.wakeup_event = None
+
+    def wait_change(self, timeout) -> bool:
+        """
+        Block until GUI wakes up this instance or timeout, without polling.
+        Caller should check should_reload() and stop event after it returns.
+
+        Args:
+            timeout (float): Seconds.
+
+        Returns:
+            bool: True if woken up by GUI, False if timeout.
+        """
+        event = self.wakeup_event
+        if event is None:
+            time.sleep(max(min(timeout, self.SCHEDULER_POLL_INTERVAL), 0))
+            return False
+        try:
+            woken = event.wait(max(min(timeout, self.SCHEDULER_WAKEUP_INTERVAL), 0))
+        except (OSError, EOFError):
+            logger.warning('Lost connection to GUI, fallback to polling config file')
+            self.__class__.wakeup_event = None
+            return False
+        if woken:
+            self._clear_wakeup()
+        return bool(woken)
@@ -4,7 +4,7 @@ from module.base.template import Template
 # This file was automatically generated by dev_tools/button_extract.py.
 # Don't modify it manually.
 
-ANSWER_CHECK = Button(area={'zh-CN': (631, 832, 652, 882), 'en-US': (631, 832, 652, 882)}, color={'zh-CN': (15, 31, 45), 'en-US': (15, 31, 45)}, button={'zh-CN': (631, 832, 652, 882), 'en-US': (631, 832, 652, 882)}, file={'zh-CN': './assets/zh-CN/conversation/ANSWER_CHECK.png', 'en-US': './assets/zh-CN/conversation/ANSWER_CHECK.png'})
+ANSWER_CHECK = Button(area={'zh-CN': (631, 832, 652, 882), 'en-US': (631, 832, 652, 882)}, color={'zh-CN': (15, 31, 45), 'en-US': (15, 31, 45)}, button={'zh-CN': (631, 832, 652, 882), 'en-US': (631, 832, 652, 882)}, file={'zh-CN': './assets/zh-CN/conversation/ANSWER_CHECK.png', 'en-US': './assets/zh-CN/conversation/ANSWER_CHECK.png'}, pyramid=2)
 CASE_CLOSED = Button(area={'zh-CN': (583, 637, 686, 647), 'en-US': (583, 637, 686, 647)}, color={'zh-CN': (103, 205, 250), 'en-US': (103, 205, 250)}, button={'zh-CN': (583, 637, 686, 647), 'en-US': (583, 637, 686, 647)}, file={'zh-CN': './assets/zh-CN/conversation/CASE_CLOSED.png', 'en-US': './assets/zh-CN/conversation/CASE_CLOSED.png'})
 COMMUNICATE = Button(area={'zh-CN': (460, 1017, 559, 1064), 'en-US': (460, 1017, 559, 1064)}, color={'zh-CN': (87, 149, 207), 'en-US': (87, 149, 207)}, button={'zh-CN': (460, 1017, 559, 1064), 'en-US': (460, 1017, 559, 1064)}, file={'zh-CN': './assets/zh-CN/conversation/COMMUNICATE.png', 'en-US': './assets/zh-CN/conversation/COMMUNICATE.png'})
 COMMUNICATE_DONE = Button(area={'zh-CN': (462, 1023, 560, 1058), 'en-US': (462, 1023, 560, 1058)}, color={'zh-CN': (87, 88, 89), 'en-US': (87, 88, 89)}, button={'zh-CN': (462, 1023, 560, 1058), 'en-US': (462, 1023, 560, 1058)}, file={'zh-CN': './assets/zh-CN/conversation/COMMUNICATE_DONE.png', 'en-US': './assets/zh-CN/conversation/COMMUNICATE_DONE.png'})
@@ -17,9 +17,9 @@ FAVOURITE = Button(area={'zh-CN': (52, 663, 95, 705), 'en-US': (52, 663, 95, 705
 FAVOURITE_CHECK = Button(area={'zh-CN': (134, 371, 159, 400), 'en-US': (134, 371, 159, 400)}, color={'zh-CN': (254, 83, 69), 'en-US': (254, 83, 69)}, button={'zh-CN': (134, 371, 159, 400), 'en-US': (134, 371, 159, 400)}, file={'zh-CN': './assets/zh-CN/conversation/FAVOURITE_CHECK.png', 'en-US': './assets/zh-CN/conversation/FAVOURITE_CHECK.png'})
 GIFT = Button(area={'zh-CN': (160, 1018, 225, 1059), 'en-US': (160, 1018, 225, 1059)}, color={'zh-CN': (254, 177, 79), 'en-US': (254, 177, 79)}, button={'zh-CN': (160, 1018, 225, 1059), 'en-US': (160, 1018, 225, 1059)}, file={'zh-CN': './assets/zh-CN/conversation/GIFT.png', 'en-US': './assets/zh-CN/conversation/GIFT.png'})
 OPPORTUNITY = Button(area={'zh-CN': (86, 291, 292, 324), 'en-US': (86, 291, 292, 324)}, color={'zh-CN': (56, 185, 246), 'en-US': (56, 185, 246)}, button={'zh-CN': (86, 291, 292, 324), 'en-US': (86, 291, 292, 324)}, file={'zh-CN': './assets/zh-CN/conversation/OPPORTUNITY.png', 'en-US': './assets/zh-CN/conversation/OPPORTUNITY.png'})
-OPPORTUNITY_B = Button(area={'zh-CN': (506, 1068, 541, 1087), 'en-US': (506, 1068, 541, 1087)}, color={'zh-CN': (192, 191, 194), 'en-US': (192, 191, 194)}, button={'zh-CN': (506, 1068, 541, 1087), 'en-US': (506, 1068, 541, 1087)}, file={'zh-CN': './assets/zh-CN/conversation/OPPORTUNITY_B.png', 'en-US': './assets/zh-CN/conversation/OPPORTUNITY_B.png'})
+OPPORTUNITY_B = Button(area={'zh-CN': (506, 1068, 541, 1087), 'en-US': (506, 1068, 541, 1087)}, color={'zh-CN': (192, 191, 194), 'en-US': (192, 191, 194)}, button={'zh-CN': (506, 1068, 541, 1087), 'en-US': (506, 1068, 541, 1087)}, file={'zh-CN': './assets/zh-CN/conversation/OPPORTUNITY_B.png', 'en-US': './assets/zh-CN/conversation/OPPORTUNITY_B.png'}, pyramid=2)
 RANK_INCREASE_CHECK = Button(area={'zh-CN': (233, 660, 389, 704), 'en-US': (233, 660, 389, 704)}, color={'zh-CN': (90, 50, 78), 'en-US': (90, 50, 78)}, button={'zh-CN': (233, 660, 389, 704), 'en-US': (233, 660, 389, 704)}, file={'zh-CN': './assets/zh-CN/conversation/RANK_INCREASE_CHECK.png', 'en-US': './assets/zh-CN/conversation/RANK_INCREASE_CHECK.png'})
-RANK_INCREASE_COMFIRM = Button(area={'zh-CN': (295, 1079, 387, 1096), 'en-US': (295, 1079, 387, 1096)}, color={'zh-CN': (145, 150, 152), 'en-US': (145, 150, 152)}, button={'zh-CN': (295, 1079, 387, 1096), 'en-US': (295, 1079, 387, 1096)}, file={'zh-CN': './assets/zh-CN/conversation/RANK_INCREASE_COMFIRM.png', 'en-US': './assets/zh-CN/conversation/RANK_INCREASE_COMFIRM.png'})
+RANK_INCREASE_COMFIRM = Button(area={'zh-CN': (295, 1079, 387, 1096), 'en-US': (295, 1079, 387, 1096)}, color={'zh-CN': (145, 150, 152), 'en-US': (145, 150, 152)}, button={'zh-CN': (295, 1079, 387, 1096), 'en-US': (295, 1079, 387, 1096)}, file={'zh-CN': './assets/zh-CN/conversation/RANK_INCREASE_COMFIRM.png', 'en-US': './assets/zh-CN/conversation/RANK_INCREASE_COMFIRM.png'}, pyramid=2)
 RANK_MAX_CHECK = Button(area={'zh-CN': (465, 828, 510, 843), 'en-US': (465, 828, 510, 843)}, color={'zh-CN': (241, 168, 163), 'en-US': (241, 168, 163)}, button={'zh-CN': (465, 828, 510, 843), 'en-US': (465, 828, 510, 843)}, file={'zh-CN': './assets/zh-CN/conversation/RANK_MAX_CHECK.png', 'en-US': './assets/zh-CN/conversation/RANK_MAX_CHECK.png'})
 TEMPLATE_ANSWER_CHECK = Template(file={'zh-CN': './assets/zh-CN/conversation/TEMPLATE_ANSWER_CHECK.png', 'en-US': './assets/zh-CN/conversation/TEMPLATE_ANSWER_CHECK.png'})
-TEMPLATE_ANSWER_TRUE = Template(file={'zh-CN': './assets/zh-CN/conversation/TEMPLATE_ANSWER_TRUE.png', 'en-US': './assets/zh-CN/conversation/TEMPLATE_ANSWER_TRUE.png'})
+TEMPLATE_ANSWER_TRUE = Template(file={'zh-CN': './assets/zh-CN/conversation/TEMPLATE_ANSWER_TRUE.png', 'en-US': './assets/zh-CN/conversation/TEMPLATE_ANSWER_TRUE.png'}, pyramid=2)
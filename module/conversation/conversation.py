@@ -88,7 +88,8 @@ class Conversation(UI):
             self.device.image, threshold=10
         ):
             # 没有次数
-            if OPPORTUNITY_B.match(self.device.image, offset=5, threshold=0.96, static=False):
+            if OPPORTUNITY_B.match(self.device.image, offset=5, threshold=0.96, static=False,
+                                   downscale=self.device.image_downscale):
                 logger.warning('There are no remaining opportunities')
                 raise NoOpportunitiesRemain
 
@@ -247,9 +248,11 @@ class Conversation(UI):
                 continue
 
             # 有红心为正确答案
-            if click_timer.reached() and TEMPLATE_ANSWER_TRUE.match(self.device.image):
+            if click_timer.reached() and TEMPLATE_ANSWER_TRUE.match(
+                    self.device.image, downscale=self.device.image_downscale):
                 answer_true_exist = True
-                _, button = TEMPLATE_ANSWER_TRUE.match_result(self.device.image, name='ANSWER_TRUE')
+                _, button = TEMPLATE_ANSWER_TRUE.match_result(
+                    self.device.image, name='ANSWER_TRUE', downscale=self.device.image_downscale)
                 logger.info('Click %s @ %s' % (point2str(*button.location), 'ANSWER_TRUE'))
                 self.device.click(button)
                 click_timer.reset()
@@ -1,16 +1,157 @@
 import json
+import os
+import pickle
 import random
+import threading
 from difflib import SequenceMatcher
 from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from module.base.utils import (
     remove_punctuation,
 )
+from module.logger import logger
+
+DIALOGUE_CACHE_FOLDER = './bin/dialogue'
+DIALOGUE_CACHE_VERSION = 1
+# 相似度匹配时，每个选项最多比较的答案数量
+DIALOGUE_CANDIDATES = 8
+
+
+def normalize(text: str) -> str:
+    """选项和答案统一去除标点和空格后再比较"""
+    return remove_punctuation(text)
+
+
+def ngrams(text: str, n: int = 2) -> Set[str]:
+    """
+    Args:
+        text: 已经normalize的文本
+        n: 中文答案较短，OCR错一个字就会破坏3个三元组，默认使用二元组
+
+    Returns:
+        文本的所有n元组，不足n个字时返回文本本身
+    """
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class CharacterIndex:
+    """
+    单个角色的答案索引
+
+    answers: [(原始答案, normalize后的答案, 是否正确), ...]
+    correct_keys / wrong_keys: normalize后的正确/错误答案，用于精确匹配
+    grams: n元组 -> 包含该n元组的答案序号，用于相似度匹配前筛选候选
+    """
+
+    def __init__(self, correct: List[str], wrong: List[str]):
+        self.answers: List[Tuple[str, str, bool]] = []
+        for answer in correct:
+            self.answers.append((answer, normalize(answer), True))
+        for answer in wrong:
+            self.answers.append((answer, normalize(answer), False))
+        self.correct_keys = {key for _, key, right in self.answers if right}
+        self.wrong_keys = {key for _, key, right in self.answers if not right}
+        self.grams: Dict[str, List[int]] = {}
+        for index, (_, key, _) in enumerate(self.answers):
+            for gram in ngrams(key):
+                self.grams.setdefault(gram, []).append(index)
+
+    def candidates(self, key: str, limit: int = DIALOGUE_CANDIDATES) -> List[int]:
+        """
+        Args:
+            key: normalize后的选项
+            limit: 最多返回的答案数量
+
+        Returns:
+            共有n元组最多的答案序号
+        """
+        count: Dict[int, int] = {}
+        for gram in ngrams(key):
+            for index in self.grams.get(gram, ()):
+                count[index] = count.get(index, 0) + 1
+        if not count:
+            # 没有共同的n元组，和所有答案比较
+            return list(range(len(self.answers)))
+        return sorted(count, key=lambda i: count[i], reverse=True)[:limit]
+
+
+class DialogueIndex:
+    """
+    预编译的对话索引，由dialogue.json生成后以pickle缓存在DIALOGUE_CACHE_FOLDER，
+    json文件修改后自动重新生成，之后启动时无需再解析完整的json
+    """
+
+    def __init__(self, characters: Dict[str, CharacterIndex]):
+        self.characters = characters
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> 'DialogueIndex':
+        characters = {}
+        for character, qa_list in data.items():
+            correct, wrong = [], []
+            for qa in qa_list:
+                answer_dict = qa.get('answer', {})
+                for value, answers in ((answer_dict.get('true'), correct), (answer_dict.get('false'), wrong)):
+                    if not value:
+                        continue
+                    # 处理单个字符串或多个答案的情况
+                    if isinstance(value, list):
+                        answers.extend(value)
+                    else:
+                        answers.append(value)
+            characters[normalize(character)] = CharacterIndex(correct, wrong)
+        return cls(characters)
+
+    @staticmethod
+    def cache_file(file_path: Path) -> str:
+        return os.path.join(DIALOGUE_CACHE_FOLDER, f'{file_path.stem}.pickle')
+
+    @staticmethod
+    def source_stamp(file_path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    @classmethod
+    def load_cache(cls, file_path: Path, stamp) -> Optional['DialogueIndex']:
+        file = cls.cache_file(file_path)
+        if not os.path.exists(file):
+            return None
+        try:
+            with open(file, 'rb') as f:
+                data = pickle.load(f)
+        except Exception as e:
+            logger.warning(f'Failed to load dialogue cache: {e}')
+            return None
+        if data.get('version') != DIALOGUE_CACHE_VERSION or data.get('stamp') != stamp:
+            return None
+        return data.get('index')
+
+    @classmethod
+    def save_cache(cls, file_path: Path, stamp, index: 'DialogueIndex') -> None:
+        file = cls.cache_file(file_path)
+        tmp = f'{file}.tmp'
+        try:
+            os.makedirs(DIALOGUE_CACHE_FOLDER, exist_ok=True)
+            with open(tmp, 'wb') as f:
+                pickle.dump({'version': DIALOGUE_CACHE_VERSION, 'stamp': stamp, 'index': index}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, file)
+        except Exception as e:
+            logger.warning(f'Failed to save dialogue cache: {e}')
 
 
 class Dialogue:
+    # Key: json文件绝对路径, value: (stamp, DialogueIndex)
+    _indexes: Dict[str, Tuple[Any, DialogueIndex]] = {}
+    _lock = threading.Lock()
+
     def __init__(self, file_path):
         self.file_path = Path(file_path)
         self._raw_data = None
@@ -35,66 +176,61 @@ class Dialogue:
         return self._raw_data
 
     @cached_property
-    def dialogue_data(self) -> Dict[str, Any]:
-        """处理后的数据（仅处理角色名和问题，保留答案原始格式）"""
-
-        def process_data(obj: Any) -> Any:
-            """递归处理数据结构"""
-            if isinstance(obj, dict):
-                new_dict = {}
-                for key, value in obj.items():
-                    # 处理键（如果是字符串）
-                    cleaned_key = remove_punctuation(key) if isinstance(key, str) else key
-                    # 递归处理值
-                    new_dict[cleaned_key] = process_data(value)
-                return new_dict
-            elif isinstance(obj, list):
-                return [process_data(item) for item in obj]
-            elif isinstance(obj, str):
-                # 保留原始字符串
-                return obj
-            else:
-                return obj
-
-        return process_data(self.raw_data)
+    def index(self) -> DialogueIndex:
+        """
+        对话索引，同一个文件在进程内只加载一次，优先读取pickle缓存
+        """
+        key = str(self.file_path.resolve())
+        stamp = DialogueIndex.source_stamp(self.file_path)
+        with self._lock:
+            cached = self._indexes.get(key)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+
+            index = DialogueIndex.load_cache(self.file_path, stamp) if stamp is not None else None
+            if index is None:
+                index = DialogueIndex.from_data(self.raw_data)
+                if stamp is not None:
+                    DialogueIndex.save_cache(self.file_path, stamp, index)
+            self._indexes[key] = (stamp, index)
+            return index
+
+    def get_character(self, character: str) -> Optional[CharacterIndex]:
+        # 删除角色名称中的字符
+        return self.index.characters.get(normalize(character))
 
     def get_answer_list(self, character: str, correct: bool) -> List[str]:
         """
         获取指定角色的所有答案
         """
-        # 删除角色名称中的字符
-        cleaned_character = remove_punctuation(character)
-        character_data = self.dialogue_data.get(cleaned_character)
-        if not character_data:
+        character_index = self.get_character(character)
+        if character_index is None:
             return []
-
-        answers = []
-        for qa in character_data:
-            answer_dict = qa.get('answer', {})
-            if correct:
-                correct_answer = answer_dict.get('true')
-                if correct_answer:
-                    # 处理单个字符串或多个答案的情况
-                    if isinstance(correct_answer, list):
-                        answers.extend(correct_answer)
-                    else:
-                        answers.append(correct_answer)
-            else:
-                wrong_answer = answer_dict.get('false')
-                if wrong_answer:
-                    # 处理单个字符串或多个答案的情况
-                    if isinstance(wrong_answer, list):
-                        answers.extend(wrong_answer)
-                    else:
-                        answers.append(wrong_answer)
-
-        return answers
+        return [answer for answer, _, right in character_index.answers if right == correct]
 
     @staticmethod
     def similarity_difflib(str1: str, str2: str) -> float:
         """计算两个字符串的相似度"""
         return SequenceMatcher(None, str1, str2).ratio()
 
+    @staticmethod
+    def max_similarity(matcher: SequenceMatcher, answers: List[str]) -> float:
+        """
+        Args:
+            matcher: 已经set_seq1为选项的SequenceMatcher
+            answers: 答案列表
+
+        Returns:
+            与答案的最高相似度，上界不超过当前最高值的答案不再计算ratio()
+        """
+        best = 0.0
+        for answer in answers:
+            matcher.set_seq2(answer)
+            if matcher.real_quick_ratio() <= best or matcher.quick_ratio() <= best:
+                continue
+            best = max(best, matcher.ratio())
+        return best
+
     def get_answer(self, character: str, answer_list: List[str]) -> str:
         """
         返回正确答案，AI写的
@@ -102,37 +238,36 @@ class Dialogue:
         if not answer_list:
             return ''
 
-        # 获取所有正确答案和错误答案
-        correct_answers = self.get_answer_list(character, True)
-        wrong_answers = self.get_answer_list(character, False)
+        character_index = self.get_character(character)
+        if character_index is None:
+            return random.choice(answer_list)
+        keys = [normalize(candidate) for candidate in answer_list]
 
         # 策略1: 直接匹配正确答案
-        for candidate in answer_list:
-            if candidate in correct_answers:
+        for candidate, key in zip(answer_list, keys):
+            if key in character_index.correct_keys:
                 return candidate
 
         # 策略2: 错误答案排除法
         # 当其中一个在错误答案列表中时，选择其他选项
-        for candidate in answer_list:
-            if candidate in wrong_answers:
-                other_answers = [a for a in answer_list if a != candidate and a not in wrong_answers]
-                if other_answers:
-                    return random.choice(other_answers)
+        wrong_keys = character_index.wrong_keys
+        if any(key in wrong_keys for key in keys):
+            other_answers = [a for a, key in zip(answer_list, keys) if key not in wrong_keys]
+            if other_answers:
+                return random.choice(other_answers)
 
         # 策略3: 综合相似度匹配策略
+        # 只和共有n元组的答案计算相似度，没有则和所有答案计算
         candidate_scores = []
-        for candidate in answer_list:
+        matcher = SequenceMatcher(None)
+        for candidate, key in zip(answer_list, keys):
+            indexes = character_index.candidates(key)
+            answers = [character_index.answers[i] for i in indexes]
+            matcher.set_seq1(candidate)
             # 1. 计算与所有正确答案的最高相似度
-            max_correct_similarity = max(
-                (self.similarity_difflib(candidate, correct_answer) for correct_answer in correct_answers),
-                default=0.0,
-            )
-
+            max_correct_similarity = self.max_similarity(matcher, [a for a, _, right in answers if right])
             # 2. 计算与所有错误答案的最高相似度
-            max_wrong_similarity = max(
-                (self.similarity_difflib(candidate, wrong_answer) for wrong_answer in wrong_answers),
-                default=0.0,
-            )
+            max_wrong_similarity = self.max_similarity(matcher, [a for a, _, right in answers if not right])
 
             # 3. 计算综合可信度得分
             confidence_score = max_correct_similarity - (0.5 * max_wrong_similarity)
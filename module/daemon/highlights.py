@@ -1,9 +1,11 @@
 from module.base.button import Button
+from module.base.rule import Detect, Rule, RuleSet
 from module.base.timer import Timer
 from module.base.utils import crop, point2str
 from module.conversation.assets import COMMUNICATE_NIKKE_AVATAR, DETAIL_CHECK
 from module.daemon.assets import *
 from module.daemon.daemon_base import DaemonBase
+from module.handler.assets import REWARD
 from module.logger import logger
 from module.ui.assets import SKIP
 from module.ui.ui import UI
@@ -82,21 +84,31 @@ class Highlights(UI, DaemonBase):
     def play(self):
         logger.hr('Highlights a nikke', 2)
         confirm_timer = Timer(1, count=3)
-        click_timer = Timer(0.3)
 
         skip = False
+        skip_rule = Rule(SKIP, offset=10, interval=1)
+        # 关闭鉴赏列表, 回到咨询页面时不再关闭
+        close_rule = Rule(HIGHLIGHTS_LIST_CLOSE, offset=30, interval=1,
+                          require=[Detect(HIGHLIGHTS_LIST, offset=10)],
+                          exclude=[Detect(PLAY_HIGHLIGHTS, offset=30), Detect(DETAIL_CHECK, offset=10, threshold=0.85)],
+                          guard=lambda: skip)
+        rules = RuleSet([
+            # SKIP
+            skip_rule,
+            # 领取
+            Rule(REWARD, offset=(30, 30), interval=1, static=False),
+            close_rule,
+        ], click_interval=0.3)
+
         while 1:
             self.device.screenshot()
 
-            # SKIP
-            if click_timer.reached() and self.appear_then_click(SKIP, offset=10, interval=1):
+            rule = self.run_rules(rules)
+            if rule is skip_rule:
                 skip = True
-                click_timer.reset()
-                continue
-
-            # 领取
-            if self.handle_reward(interval=1):
-                click_timer.reset()
+            if rule is close_rule:
+                logger.info('Highlights end, close list')
+            if rule is not None:
                 continue
 
             # 回到咨询页面
@@ -104,17 +116,6 @@ class Highlights(UI, DaemonBase):
                 logger.info('Back to conversation page')
                 break
 
-            # 关闭鉴赏列表
-            if (
-                skip
-                and self.appear(HIGHLIGHTS_LIST, offset=10)
-                and not self.appear(PLAY_HIGHLIGHTS, offset=30)
-                and self.appear_then_click(HIGHLIGHTS_LIST_CLOSE, offset=30, interval=1)
-            ):
-                logger.info('Highlights end, close list')
-                click_timer.reset()
-                continue
-
             # 下一个花絮超过1秒
             if self.appear(PLAY_HIGHLIGHTS, offset=30):
                 if not confirm_timer.started():
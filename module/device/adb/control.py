@@ -49,7 +49,15 @@ class Control(Minitouch):
         method(x, y)
 
     def swipe(self, p1, p2, speed=15, method='swipe', name='SWIPE',
-            distance_check=True, handle_control_check=True):
+            distance_check=True, handle_control_check=True, wait=True):
+        """
+        Args:
+            wait (bool): False to return before the swipe finishes,
+                call wait() on the returned future before relying on its result.
+
+        Returns:
+            MinitouchFuture | None: None if swipe is dropped.
+        """
         if handle_control_check:
             self.handle_control_check(name)
         p1, p2 = ensure_int(p1, p2)
@@ -65,4 +73,4 @@ class Control(Minitouch):
                 return
 
         # if method == 'minitouch':
-        self.swipe_minitouch(p1, p2, speed=speed, method=method)
+        return self.swipe_minitouch(p1, p2, speed=speed, method=method, wait=wait)
@@ -6,6 +6,7 @@ from module.device.adb.app_control import AppControl
 from module.device.adb.control import Control
 from module.device.adb.env import IS_WINDOWS
 from module.device.adb.screenshot import Screenshot
+from module.device.wait_change import WaitChange
 from module.exception import (
     EmulatorNotRunningError,
     GameNotRunningError,
@@ -17,7 +18,7 @@ from module.logger import logger
 from module.ocr.models import OCR_MODEL
 
 
-class Device(Screenshot, Control, AppControl):
+class Device(Screenshot, Control, AppControl, WaitChange):
     get_location = OCR_MODEL.get_location
 
     # 尝试检测的 Button 集合
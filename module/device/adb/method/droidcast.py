@@ -9,7 +9,9 @@ from adbutils.errors import AdbError
 
 from functools import cached_property
 from module.base.decorator import del_cached_property
+from module.base.http import HttpSession
 from module.base.timer import Timer
+from module.device.adb.method.rgb565 import Rgb565Decoder
 from module.device.adb.method.uiautomator_2 import ProcessInfo, Uiautomator2
 from module.device.adb.method.utils import (
     ImageTruncated, PackageNotInstalled, RETRY_TRIES, handle_adb_error, handle_unknown_host_service, retry_sleep)
@@ -106,8 +108,8 @@ class DroidCast(Uiautomator2):
 
     @cached_property
     def droidcast_session(self):
-        session = requests.Session()
-        session.trust_env = False  # Ignore proxy
+        # Ignore proxy, one connection is enough for screenshots
+        session = HttpSession(pool_size=1, trust_env=False)
         self._droidcast_port = self.adb_forward('tcp:53516')
         return session
 
@@ -121,6 +123,62 @@ class DroidCast(Uiautomator2):
         To get PNG screenshots.
     """
 
+    @cached_property
+    def droidcast_decoder(self):
+        return Rgb565Decoder(method=self.config.DROIDCAST_RAW_DECODE)
+
+    @property
+    def droidcast_raw_timing(self):
+        """
+        Returns:
+            dict[str, float]: Cost of each stage of the last DroidCast_raw screenshot, in seconds.
+                Keys: 'request', 'read', 'decode', 'total'
+        """
+        return self.droidcast_decoder.timing
+
+    def droidcast_raw_read(self, shape):
+        """
+        Request a screenshot from DroidCast_raw and read the body into the persistent buffer of decoder.
+
+        Args:
+            shape (tuple): (height, width)
+
+        Returns:
+            memoryview | bytes: Body of the response
+        """
+        decoder = self.droidcast_decoder
+        start = time.perf_counter()
+        resp = self.droidcast_session.get(self.droidcast_raw_url(), timeout=3, stream=True)
+        decoder.timing['request'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        released = False
+        try:
+            size = int(resp.headers.get('Content-Length', -1))
+            if size != shape[0] * shape[1] * 2:
+                content = resp.content
+                # Fully read, connection goes back to pool
+                released = True
+                return content
+
+            # Read socket into the buffer through urllib3, instead of building resp.content
+            view = decoder.body_view(size)
+            received = 0
+            while received < size:
+                n = resp.raw.readinto(view[received:])
+                if not n:
+                    break
+                received += n
+            if received == size:
+                # Keep the connection alive for the next frame
+                resp.raw.release_conn()
+                released = True
+            return view[:received]
+        finally:
+            if not released:
+                resp.close()
+            decoder.timing['read'] = time.perf_counter() - start
+
     def droidcast_url(self, url='/preview'):
         if self.is_mumu_over_version_356:
             w, h = self.droidcast_width, self.droidcast_height
@@ -236,7 +294,8 @@ class DroidCast(Uiautomator2):
 
         rotate = self.is_mumu_over_version_356 and self.orientation == 1
 
-        image = self.droidcast_session.get(self.droidcast_raw_url(), timeout=3).content
+        start = time.perf_counter()
+        image = self.droidcast_raw_read(shape)
         # DroidCast_raw returns a RGB565 bitmap
 
         try:
@@ -250,6 +309,7 @@ class DroidCast(Uiautomator2):
             else:
                 arr = arr.reshape(shape)
         except ValueError as e:
+            image = bytes(image)
             if len(image) < 500:
                 logger.warning(f'Unexpected screenshot: {image}')
             # Try to load as `DroidCast`
@@ -264,37 +324,8 @@ class DroidCast(Uiautomator2):
 
         # Convert RGB565 to RGB888
         # https://blog.csdn.net/happy08god/article/details/10516871
-
-        # r = (arr & 0b1111100000000000) >> (11 - 3)
-        # g = (arr & 0b0000011111100000) >> (5 - 2)
-        # b = (arr & 0b0000000000011111) << 3
-        # r |= (r & 0b11100000) >> 5
-        # g |= (g & 0b11000000) >> 6
-        # b |= (b & 0b11100000) >> 5
-        # r = r.astype(np.uint8)
-        # g = g.astype(np.uint8)
-        # b = b.astype(np.uint8)
-        # image = cv2.merge([r, g, b])
-
-        # The same as the code above but costs about 3~4ms instead of 10ms.
-        # Note that cv2.convertScaleAbs is 5x fast as cv2.multiply, cv2.add is 8x fast as cv2.convertScaleAbs
-        # Note that cv2.convertScaleAbs includes rounding
-        r = cv2.bitwise_and(arr, 0b1111100000000000)
-        r = cv2.convertScaleAbs(r, alpha=0.00390625)
-        m = cv2.convertScaleAbs(r, alpha=0.03125)
-        cv2.add(r, m, dst=r)
-
-        g = cv2.bitwise_and(arr, 0b0000011111100000)
-        g = cv2.convertScaleAbs(g, alpha=0.125)
-        m = cv2.convertScaleAbs(g, alpha=0.015625, dst=m)
-        cv2.add(g, m, dst=g)
-
-        b = cv2.bitwise_and(arr, 0b0000000000011111)
-        b = cv2.convertScaleAbs(b, alpha=8)
-        m = cv2.convertScaleAbs(b, alpha=0.03125, dst=m)
-        cv2.add(b, m, dst=b)
-
-        image = cv2.merge([r, g, b])
+        image = self.droidcast_decoder.decode(arr)
+        self.droidcast_decoder.timing['total'] = time.perf_counter() - start
 
         return image
 
@@ -147,17 +147,20 @@ def insert_swipe(p0, p3, speed=15, min_distance=10):
     ts = np.sign(ts) * abs(ts) ** 0.9
     ts = (ts - min(ts)) / (max(ts) - min(ts))
 
-    # Generate cubic Bézier curve
+    # Generate cubic Bézier curve, all points at once
+    t = ts[:, np.newaxis]
+    curve = p0 * (1 - t) ** 3 + 3 * p1 * t * (1 - t) ** 2 + 3 * p2 * t ** 2 * (1 - t) + p3 * t ** 3
+    curve = curve.astype(int).tolist()
+
+    # Drop points too close to the previous one
     points = []
-    prev = (-100, -100)
-    for t in ts:
-        point = p0 * (1 - t) ** 3 + 3 * p1 * t * (1 - t) ** 2 + 3 * p2 * t ** 2 * (1 - t) + p3 * t ** 3
-        point = point.astype(int).tolist()
-        if np.linalg.norm(np.subtract(point, prev)) < min_distance:
+    prev_x, prev_y = -100, -100
+    min_square = min_distance ** 2
+    for x, y in curve:
+        if (x - prev_x) ** 2 + (y - prev_y) ** 2 < min_square:
             continue
-
-        points.append(point)
-        prev = point
+        points.append([x, y])
+        prev_x, prev_y = x, y
 
     # Delete nearing points
     if len(points[1:]):
@@ -319,6 +322,38 @@ class CommandBuilder:
         return [command.to_atx_agent(self.max_x, self.max_y) for command in self.commands]
 
 
+class MinitouchFuture:
+    """
+    Completion of a gesture sent by Minitouch.minitouch_send(wait=False).
+    Minitouch runs commands in order, so the gesture finishes at a predictable time.
+    """
+
+    def __init__(self, device, deadline):
+        """
+        Args:
+            device (Minitouch):
+            deadline (float): Time when the gesture finishes.
+        """
+        self.device = device
+        self.deadline = deadline
+
+    def done(self):
+        return time.time() >= self.deadline
+
+    def wait(self):
+        """
+        Block until the gesture finishes, so screenshots after it show the result.
+        """
+        remain = self.deadline - time.time()
+        if remain > 0:
+            time.sleep(remain)
+        self.device.last_control_time = max(self.device.last_control_time, self.deadline)
+        return self
+
+    # Same as concurrent.futures.Future
+    result = wait
+
+
 class Minitouch(Connection):
     _minitouch_port: int = 0
     _minitouch_client: socket.socket
@@ -326,6 +361,8 @@ class Minitouch(Connection):
     _minitouch_ws: websockets.WebSocketClientProtocol
     max_x: int
     max_y: int
+    # 上一次操作完成的时间
+    last_control_time: float = 0.
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -407,14 +444,38 @@ class Minitouch(Connection):
             )
         )
 
-    def minitouch_send(self):
-        content = self.minitouch_builder.to_minitouch()
+    def minitouch_send(self, wait=True):
+        """
+        Send all commands in builder as one script.
+
+        Args:
+            wait (bool): True to block until the script finishes.
+                False to return immediately, so screenshots can be taken while the gesture is running.
+
+        Returns:
+            MinitouchFuture:
+        """
+        builder = self.minitouch_builder
+        content = builder.to_minitouch()
         # logger.info("send operation: {}".format(content.replace("\n", "\\n")))
         byte_content = content.encode('utf-8')
         self._minitouch_client.sendall(byte_content)
         self._minitouch_client.recv(0)
-        time.sleep(self.minitouch_builder.delay / 1000 + self.minitouch_builder.DEFAULT_DELAY)
-        self.minitouch_builder.clear()
+        now = time.time()
+        future = MinitouchFuture(self, deadline=now + builder.delay / 1000 + builder.DEFAULT_DELAY)
+        builder.clear()
+        if wait:
+            return future.wait()
+        self.last_control_time = now
+        return future
+
+    def minitouch_gap(self):
+        """
+        Wait between parts of a gesture on device,
+        which used to be the client side sleep after each minitouch_send().
+        """
+        builder = self.minitouch_builder
+        builder.wait(int(builder.DEFAULT_DELAY * 1000))
 
     @retry
     def click_minitouch(self, x, y):
@@ -432,42 +493,63 @@ class Minitouch(Connection):
         self.minitouch_send()
 
     @retry
-    def swipe_minitouch(self, p1, p2, method='swipe', speed=15):
+    def swipe_minitouch(self, p1, p2, method='swipe', speed=15, wait=True):
+        """
+        Args:
+            p1: Start point.
+            p2: End point.
+            method (str): 'swipe', or 'scroll' to hold 1s before releasing.
+            speed: Average move speed, pixels per 10ms.
+            wait (bool): False to return before the swipe finishes.
+
+        Returns:
+            MinitouchFuture:
+        """
         points = insert_swipe(p0=translate_tuple(p1), p3=translate_tuple(p2), speed=speed)
         builder = self.minitouch_builder
 
         builder.down(*points[0]).commit()
-        self.minitouch_send()
+        self.minitouch_gap()
 
         for point in points[1:-1]:
             builder.move(*point).commit().wait(10)
-        self.minitouch_send()
-        
+        self.minitouch_gap()
+
         builder.move(*points[-1]).commit()
-        self.minitouch_send()
-        
+        self.minitouch_gap()
+
         if method == 'scroll':
             builder.wait(1000)
-            self.minitouch_send()
-        
+            self.minitouch_gap()
+
         builder.up().commit()
-        self.minitouch_send()
+        return self.minitouch_send(wait=wait)
 
     @retry
-    def drag_minitouch(self, p1, p2):
+    def drag_minitouch(self, p1, p2, wait=True):
+        """
+        Args:
+            p1: Start point.
+            p2: End point.
+            wait (bool): False to return before the drag finishes.
+
+        Returns:
+            MinitouchFuture:
+        """
         points = insert_swipe(p0=translate_tuple(p1), p3=translate_tuple(p2))
         builder = self.minitouch_builder
 
         builder.down(*points[0]).commit()
-        self.minitouch_send()
+        self.minitouch_gap()
 
         for point in points[1:]:
             builder.move(*point).commit().wait(10)
-        self.minitouch_send()
+        self.minitouch_gap()
 
-        self.sleep(5)
+        # Hold 5s before releasing
+        builder.wait(5000)
         builder.up().commit()
-        self.minitouch_send()
+        return self.minitouch_send(wait=wait)
 
 
 def translate_tuple(p):
@@ -0,0 +1,132 @@
+import time
+
+import cv2
+import numpy as np
+
+
+def rgb565_lut():
+    """
+    Returns:
+        np.ndarray: Shape (65536, 3), RGB888 of every RGB565 value.
+            Low bits are filled with high bits, the same as the bitwise conversion.
+    """
+    value = np.arange(65536, dtype=np.uint32)
+    r = (value >> 11) & 0b11111
+    g = (value >> 5) & 0b111111
+    b = value & 0b11111
+    return np.stack([
+        (r << 3) | (r >> 2),
+        (g << 2) | (g >> 4),
+        (b << 3) | (b >> 2),
+    ], axis=1).astype(np.uint8)
+
+
+class Rgb565Decoder:
+    """
+    Convert RGB565 bitmaps to RGB888 images, with buffers reused between frames.
+
+    The HTTP body is read into `body`, a persistent bytearray, and intermediate planes
+    are allocated once per resolution. Output images are still new arrays, because
+    screenshots are kept by `screenshot_deque` and callers after the next screenshot.
+    """
+
+    def __init__(self, method='cv2'):
+        """
+        Args:
+            method (str): 'cv2' to convert with bitwise operations in opencv, 'lut' to use a lookup table.
+        """
+        self.method = method
+        self.body = bytearray()
+        self.shape = None
+        self._lut = None
+        self._planes = None
+        # Cost of the last frame in seconds, key: stage name
+        self.timing = {}
+
+    def body_view(self, size):
+        """
+        Args:
+            size (int): Body size in bytes.
+
+        Returns:
+            memoryview: Writable view of the persistent body buffer.
+        """
+        if len(self.body) != size:
+            self.body = bytearray(size)
+        return memoryview(self.body)
+
+    def _ensure_planes(self, shape):
+        if self.shape != shape:
+            self.shape = shape
+            self._planes = {
+                'masked': np.empty(shape, dtype=np.uint16),
+                'r': np.empty(shape, dtype=np.uint8),
+                'g': np.empty(shape, dtype=np.uint8),
+                'b': np.empty(shape, dtype=np.uint8),
+                'm': np.empty(shape, dtype=np.uint8),
+            }
+        return self._planes
+
+    @property
+    def lut(self):
+        if self._lut is None:
+            self._lut = rgb565_lut()
+        return self._lut
+
+    def _decode_cv2(self, arr):
+        """
+        The same as
+
+            r = (arr & 0b1111100000000000) >> (11 - 3)
+            g = (arr & 0b0000011111100000) >> (5 - 2)
+            b = (arr & 0b0000000000011111) << 3
+            r |= (r & 0b11100000) >> 5
+            g |= (g & 0b11000000) >> 6
+            b |= (b & 0b11100000) >> 5
+
+        but costs about 3~4ms instead of 10ms.
+        Note that cv2.convertScaleAbs is 5x fast as cv2.multiply, cv2.add is 8x fast as cv2.convertScaleAbs
+        Note that cv2.convertScaleAbs includes rounding
+        """
+        planes = self._ensure_planes(arr.shape)
+        masked, r, g, b, m = planes['masked'], planes['r'], planes['g'], planes['b'], planes['m']
+
+        cv2.bitwise_and(arr, 0b1111100000000000, dst=masked)
+        cv2.convertScaleAbs(masked, alpha=0.00390625, dst=r)
+        cv2.convertScaleAbs(r, alpha=0.03125, dst=m)
+        cv2.add(r, m, dst=r)
+
+        cv2.bitwise_and(arr, 0b0000011111100000, dst=masked)
+        cv2.convertScaleAbs(masked, alpha=0.125, dst=g)
+        cv2.convertScaleAbs(g, alpha=0.015625, dst=m)
+        cv2.add(g, m, dst=g)
+
+        cv2.bitwise_and(arr, 0b0000000000011111, dst=masked)
+        cv2.convertScaleAbs(masked, alpha=8, dst=b)
+        cv2.convertScaleAbs(b, alpha=0.03125, dst=m)
+        cv2.add(b, m, dst=b)
+
+        image = np.empty((*arr.shape, 3), dtype=np.uint8)
+        cv2.merge([r, g, b], dst=image)
+        return image
+
+    def _decode_lut(self, arr):
+        image = np.empty((*arr.shape, 3), dtype=np.uint8)
+        np.take(self.lut, arr, axis=0, out=image)
+        return image
+
+    def decode(self, arr):
+        """
+        Args:
+            arr (np.ndarray): RGB565 bitmap in uint16, shape (height, width)
+
+        Returns:
+            np.ndarray: RGB image, shape (height, width, 3)
+        """
+        start = time.perf_counter()
+        if self.method == 'lut':
+            image = self._decode_lut(arr)
+        else:
+            image = self._decode_cv2(arr)
+        self.timing['decode'] = time.perf_counter() - start
+        return image
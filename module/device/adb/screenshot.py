@@ -1,11 +1,17 @@
-from collections import deque
+import threading
+import time
 from datetime import datetime
 from functools import cached_property
 
+import numpy as np
+
+from module.base.pacer import ScreenshotPacer
+from module.base.ring_buffer import ImageRingBuffer
 from module.base.timer import Timer
-from module.base.utils import image_size
+from module.base.utils import image_diff_ratio, image_downscale, image_fingerprint, image_size
 from module.device.adb.method.droidcast import DroidCast
 from module.device.adb.method.nemu_ipc import NemuIpc
+from module.logger import logger
 
 
 class ScreenshotSizeError(Exception):
@@ -13,11 +19,40 @@ class ScreenshotSizeError(Exception):
 
 
 class Screenshot(DroidCast, NemuIpc):
+    # 截图指纹与上一帧相同
+    image_unchanged = False
+    # 画面静止, 与上一帧相比只有很小的区域变化
+    image_static = False
+    image_fingerprint = None
+    appear_cache_image = None
+    # 截图序号, 每张新截图递增
+    screenshot_seq = 0
+    # (seq, image, {level: downscaled image}), 只对这一帧截图有效
+    _image_downscale = None
+
+    _stream_thread: threading.Thread = None
+    # (seq, capture start time, image)
+    _stream_frame = None
+    _stream_error: Exception = None
+    _stream_demand = 0.
+
     def __init__(self, config):
         super().__init__(config)
         self._screenshot_interval = Timer(
             float(self.config.Emulator_ScreenshotInterval)
         )
+        # 当前画面的识别结果缓存, 画面改变时清空
+        self.appear_cache = {}
+
+    @cached_property
+    def screenshot_pacer(self):
+        return ScreenshotPacer(
+            float(self.config.Emulator_ScreenshotInterval),
+            fast=self.config.SCREENSHOT_INTERVAL_FAST,
+            slow=self.config.SCREENSHOT_INTERVAL_SLOW,
+            backoff=self.config.SCREENSHOT_BACKOFF,
+            click_window=self.config.SCREENSHOT_CLICK_WINDOW,
+        )
 
     @cached_property
     def screenshot_methods(self):
@@ -27,7 +62,7 @@ class Screenshot(DroidCast, NemuIpc):
 
     @cached_property
     def screenshot_deque(self):
-        return deque(maxlen=int(self.config.Error_ScreenshotLength))
+        return ImageRingBuffer(int(self.config.Error_ScreenshotLength), scale=self.config.Error_ScreenshotScale)
 
     def screenshot(self):
         """
@@ -38,18 +73,152 @@ class Screenshot(DroidCast, NemuIpc):
         """
 
         # 每次两次截图间隔时间
-        self._screenshot_interval.wait()
-        self._screenshot_interval.reset()
-
-        method = self.screenshot_methods.get(self.config.Emulator_ScreenshotMethod)
-        self.image = method()
+        if self.config.SCREENSHOT_ADAPTIVE:
+            self.screenshot_pacer.wait(getattr(self, 'last_control_time', 0.))
+        else:
+            self._screenshot_interval.wait()
+            self._screenshot_interval.reset()
+
+        if self.config.SCREENSHOT_STREAM:
+            self.image = self._screenshot_stream()
+        else:
+            method = self.screenshot_methods.get(self.config.Emulator_ScreenshotMethod)
+            self.image = method()
+            self.screenshot_seq += 1
 
         self.image = self._handle_orientated_image(self.image)
+        self._update_fingerprint(self.image)
+        if self.config.SCREENSHOT_ADAPTIVE:
+            self.screenshot_pacer.update(self.image_static)
 
         self.screenshot_deque.append({"time": datetime.now(), "image": self.image})
 
         return self.image
 
+    def image_downscale(self, level):
+        """
+        Current screenshot downscaled by `level`,
+        so buttons matching on the same screenshot with pyramid share one resize.
+
+        Args:
+            level (int): Downscale ratio, such as 2, 4.
+
+        Returns:
+            np.ndarray:
+        """
+        cache = self._image_downscale
+        # 外部修改 self.image 后也要重新缩放
+        if cache is None or cache[0] != self.screenshot_seq or cache[1] is not self.image:
+            cache = (self.screenshot_seq, self.image, {})
+            self._image_downscale = cache
+        small = cache[2].get(level)
+        if small is None:
+            small = image_downscale(self.image, level)
+            cache[2][level] = small
+        return small
+
+    @cached_property
+    def _stream_condition(self):
+        return threading.Condition()
+
+    def _stream_loop(self):
+        """
+        Keep taking screenshots in background, only the latest frame is kept.
+        Capturing pauses if no one requests screenshots for SCREENSHOT_STREAM_IDLE seconds.
+        """
+        method = self.screenshot_methods.get(self.config.Emulator_ScreenshotMethod)
+        condition = self._stream_condition
+        seq = self._stream_frame[0] if self._stream_frame is not None else self.screenshot_seq
+        while 1:
+            with condition:
+                while time.time() - self._stream_demand > self.config.SCREENSHOT_STREAM_IDLE:
+                    condition.wait(timeout=1)
+
+            start = time.time()
+            try:
+                image = method()
+            except Exception as e:
+                with condition:
+                    self._stream_error = e
+                    condition.notify_all()
+                return
+
+            seq += 1
+            with condition:
+                self._stream_frame = (seq, start, image)
+                condition.notify_all()
+
+    def _screenshot_stream(self):
+        """
+        Get the latest frame from the background capture thread.
+        The frame must be newer than the last returned one and captured after the last control,
+        so a screenshot after click always shows the screen after click.
+
+        Returns:
+            np.ndarray:
+        """
+        condition = self._stream_condition
+        with condition:
+            self._stream_demand = time.time()
+            condition.notify_all()
+            while 1:
+                if self._stream_error is not None:
+                    error, self._stream_error = self._stream_error, None
+                    raise error
+                if self._stream_thread is None or not self._stream_thread.is_alive():
+                    logger.info('Start screenshot stream')
+                    self._stream_thread = threading.Thread(
+                        target=self._stream_loop, name='ScreenshotStream', daemon=True)
+                    self._stream_thread.start()
+
+                frame = self._stream_frame
+                if frame is not None \
+                        and frame[0] > self.screenshot_seq \
+                        and frame[1] > getattr(self, 'last_control_time', 0.):
+                    break
+                condition.wait(timeout=1)
+                self._stream_demand = time.time()
+
+        self.screenshot_seq = frame[0]
+        return frame[2]
+
+    def _update_fingerprint(self, image):
+        """
+        Compare the downsampled screenshot with the last one,
+        set `image_unchanged` and `image_static`, and clear `appear_cache` if screen changed.
+        Equal fingerprints are confirmed at full resolution before reusing `appear_cache`.
+
+        Args:
+            image (np.ndarray):
+        """
+        scale = self.config.SCREENSHOT_FINGERPRINT_SCALE
+        if not scale:
+            self.image_unchanged = False
+            self.image_static = False
+            self.appear_cache.clear()
+            self.appear_cache_image = None
+            return
+
+        fingerprint = image_fingerprint(image, scale=scale)
+        previous = self.image_fingerprint
+        self.image_unchanged = previous is not None and np.array_equal(fingerprint, previous)
+        if self.image_unchanged:
+            # 缩小后的指纹会抹掉小区域的变化, 例如数字跳动, 用全分辨率确认
+            # appear_cache_image 是上一帧截图
+            last = self.appear_cache_image
+            self.image_unchanged = last is not None and np.array_equal(image, last)
+        if self.image_unchanged:
+            self.image_static = True
+        elif previous is not None and previous.shape == fingerprint.shape:
+            self.image_static = image_diff_ratio(fingerprint, previous) < self.config.SCREENSHOT_STATIC_RATIO
+        else:
+            self.image_static = False
+        self.image_fingerprint = fingerprint
+        if not self.image_unchanged:
+            self.appear_cache.clear()
+        # 缓存只对这一帧截图有效, 外部修改 self.image 后不再使用
+        self.appear_cache_image = image
+
     def _handle_orientated_image(self, image):
         """
         Args:
@@ -0,0 +1,121 @@
+from module.base.button import Button
+from module.base.timer import Timer
+from module.base.utils import crop, image_diff_ratio
+from module.logger import logger
+
+
+class WaitChange:
+    """
+    Wait for the game to respond to an operation by comparing screenshots,
+    instead of sleeping for a fixed time.
+    With SCREENSHOT_ADAPTIVE, screenshots are taken at SCREENSHOT_INTERVAL_FAST right after a click,
+    see ScreenshotPacer.
+    """
+
+    @staticmethod
+    def _region_area(region, image):
+        """
+        Args:
+            region (Button, tuple, None): Button, area, or None for the whole screen.
+            image (np.ndarray):
+
+        Returns:
+            tuple[int, int, int, int]:
+        """
+        if region is None:
+            return 0, 0, image.shape[1], image.shape[0]
+        if isinstance(region, Button):
+            return region.area
+        return region
+
+    def wait_change(self, reference, region=None, timeout=2, settle=None):
+        """
+        Take screenshots until the region is different from reference, and then stays unchanged.
+
+        Args:
+            reference (np.ndarray): Screenshot before the operation.
+            region (Button, tuple, None): Button, area, or None for the whole screen.
+            timeout (int, float): Max seconds to wait.
+            settle (int, float): Seconds that region should stay unchanged after the change,
+                0 to return as soon as it changes. Default to WAIT_CHANGE_SETTLE.
+
+        Returns:
+            bool: If region changed.
+        """
+        if settle is None:
+            settle = self.config.WAIT_CHANGE_SETTLE
+        ratio = self.config.WAIT_CHANGE_RATIO
+        area = self._region_area(region, reference)
+        reference = crop(reference, area)
+        timeout = Timer(timeout).start()
+        settle_timer = Timer(settle)
+        previous = None
+
+        while 1:
+            current = crop(self.screenshot(), area)
+
+            if previous is None:
+                if image_diff_ratio(current, reference) >= ratio:
+                    if not settle:
+                        return True
+                    previous = current
+                    settle_timer.start()
+            elif image_diff_ratio(current, previous) >= ratio:
+                # Still moving
+                previous = current
+                settle_timer.reset()
+            elif settle_timer.reached():
+                return True
+
+            if timeout.reached():
+                if previous is None:
+                    logger.info(f'Wait change timeout, region unchanged: {area}')
+                    return False
+                logger.info(f'Wait change timeout, region not settled: {area}')
+                return True
+
+    def click_and_wait_change(self, button, region=None, timeout=2, settle=None, click_offset=0):
+        """
+        Click a button and wait until the game responds.
+
+        Args:
+            button (Button):
+            region (Button, tuple, None): Region expected to change, default to the whole screen.
+            timeout (int, float): Max seconds to wait.
+            settle (int, float): Seconds that region should stay unchanged after the change,
+                0 to return as soon as it changes. Default to WAIT_CHANGE_SETTLE.
+            click_offset (int, tuple): The same as click().
+
+        Returns:
+            bool: If region changed.
+
+        Examples:
+            if self.appear(REWARD, offset=10):
+                self.device.click_and_wait_change(REWARD, region=REWARD_LIST)
+        """
+        if getattr(self, 'image', None) is None:
+            self.screenshot()
+        reference = self.image
+        self.click(button, click_offset=click_offset)
+        return self.wait_change(reference, region=region, timeout=timeout, settle=settle)
+
+    def swipe_and_wait_change(self, p1, p2, region=None, timeout=2, settle=None, **kwargs):
+        """
+        Swipe and wait until the screen stops moving.
+
+        Args:
+            p1: Start point.
+            p2: End point.
+            region (Button, tuple, None): Region expected to change, default to the whole screen.
+            timeout (int, float): Max seconds to wait.
+            settle (int, float): Seconds that region should stay unchanged after the change.
+            **kwargs: The same as swipe().
+
+        Returns:
+            bool: If region changed, False if reached the end of a list.
+        """
+        if getattr(self, 'image', None) is None:
+            self.screenshot()
+        reference = self.image
+        self.swipe(p1, p2, **kwargs)
+        return self.wait_change(reference, region=region, timeout=timeout, settle=settle)
@@ -1,9 +1,9 @@
 import time
-from collections import deque
 from datetime import datetime
 from functools import cached_property, wraps
 
 from module.base.button import Button
+from module.base.ring_buffer import ImageRingBuffer
 from module.base.timer import Timer
 from module.base.utils import ensure_int, image_size, point2str
 from module.config.config import NikkeConfig
@@ -154,7 +154,7 @@ class Automation:
 
     @cached_property
     def screenshot_deque(self):
-        return deque(maxlen=int(self.config.Error_ScreenshotLength))
+        return ImageRingBuffer(int(self.config.Error_ScreenshotLength), scale=self.config.Error_ScreenshotScale)
 
     def _handle_orientated_image(self, image, resolution):
         """
@@ -5,6 +5,7 @@ from module.base.button import Button
 from module.base.timer import Timer
 from module.device.win.app_control import AppControl
 from module.device.win.automation import Automation
+from module.device.wait_change import WaitChange
 from module.exception import (
     GameNotRunningError,
     GameStuckError,
@@ -14,7 +15,7 @@ from module.exception import (
 from module.logger import logger
 
 
-class Device(AppControl, Automation):
+class Device(AppControl, Automation, WaitChange):
     # 尝试检测的 Button 集合
     detect_record = set()
     # 点击过的 Button 队列
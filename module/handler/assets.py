@@ -8,7 +8,7 @@ ANNOUNCEMENT = Button(area={'zh-CN': (631, 111, 675, 152), 'en-US': (631, 111, 6
 ANNOUNCEMENT_CHECK = Button(area={'zh-CN': (318, 264, 344, 297), 'en-US': (318, 264, 344, 297)}, color={'zh-CN': (155, 197, 245), 'en-US': (155, 197, 245)}, button={'zh-CN': (318, 264, 344, 297), 'en-US': (318, 264, 344, 297)}, file={'zh-CN': './assets/zh-CN/handler/ANNOUNCEMENT_CHECK.png', 'en-US': './assets/zh-CN/handler/ANNOUNCEMENT_CHECK.png'})
 AUTO_CLICK_CHECK = Button(area={'zh-CN': (359, 22, 423, 41), 'en-US': (359, 22, 423, 41)}, color={'zh-CN': (125, 125, 125), 'en-US': (125, 125, 125)}, button={'zh-CN': (359, 22, 423, 41), 'en-US': (359, 22, 423, 41)}, file={'zh-CN': './assets/zh-CN/handler/AUTO_CLICK_CHECK.png', 'en-US': './assets/zh-CN/handler/AUTO_CLICK_CHECK.png'})
 CLICK_TO_CLOSE = Button(area={'zh-CN': (292, 1179, 410, 1199), 'en-US': (292, 1179, 410, 1199)}, color={'zh-CN': (104, 102, 104), 'en-US': (104, 102, 104)}, button={'zh-CN': (292, 1179, 410, 1199), 'en-US': (292, 1179, 410, 1199)}, file={'zh-CN': './assets/zh-CN/handler/CLICK_TO_CLOSE.png', 'en-US': './assets/zh-CN/handler/CLICK_TO_CLOSE.png'})
-CONFIRM_A = Button(area={'zh-CN': (354, 819, 393, 844), 'en-US': (354, 819, 393, 844)}, color={'zh-CN': (136, 217, 255), 'en-US': (136, 217, 255)}, button={'zh-CN': (354, 819, 393, 844), 'en-US': (354, 819, 393, 844)}, file={'zh-CN': './assets/zh-CN/handler/CONFIRM_A.png', 'en-US': './assets/en-US/handler/CONFIRM_A.png'})
+CONFIRM_A = Button(area={'zh-CN': (354, 819, 393, 844), 'en-US': (354, 819, 393, 844)}, color={'zh-CN': (136, 217, 255), 'en-US': (136, 217, 255)}, button={'zh-CN': (354, 819, 393, 844), 'en-US': (354, 819, 393, 844)}, file={'zh-CN': './assets/zh-CN/handler/CONFIRM_A.png', 'en-US': './assets/en-US/handler/CONFIRM_A.png'}, pyramid=2)
 CONFIRM_B = Button(area={'zh-CN': (507, 790, 555, 813), 'en-US': (337, 792, 427, 813)}, color={'zh-CN': (110, 197, 241), 'en-US': (91, 189, 235)}, button={'zh-CN': (507, 790, 555, 813), 'en-US': (337, 792, 427, 813)}, file={'zh-CN': './assets/zh-CN/handler/CONFIRM_B.png', 'en-US': './assets/en-US/handler/CONFIRM_B.png'})
 CONFIRM_C = Button(area={'zh-CN': (334, 1012, 385, 1036), 'en-US': (334, 1012, 385, 1036)}, color={'zh-CN': (115, 206, 248), 'en-US': (115, 206, 248)}, button={'zh-CN': (334, 1012, 385, 1036), 'en-US': (334, 1012, 385, 1036)}, file={'zh-CN': './assets/zh-CN/handler/CONFIRM_C.png', 'en-US': './assets/en-US/handler/CONFIRM_C.png'})
 DOWNLOADING_CHECK = Button(area={'zh-CN': (85, 1217, 107, 1228), 'en-US': (85, 1217, 107, 1228)}, color={'zh-CN': (255, 114, 25), 'en-US': (255, 114, 25)}, button={'zh-CN': (85, 1217, 107, 1228), 'en-US': (85, 1217, 107, 1228)}, file={'zh-CN': './assets/zh-CN/handler/DOWNLOADING_CHECK.png', 'en-US': './assets/zh-CN/handler/DOWNLOADING_CHECK.png'})
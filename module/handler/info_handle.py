@@ -1,4 +1,5 @@
 import time
+from functools import cached_property
 
 from module.base.base import ModuleBase
 from module.base.langs import Langs
@@ -8,6 +9,7 @@ from module.base.utils import point2str
 # from module.event.event_5.assets import SKIP, TOUCH_TO_CONTINUE
 from module.exception import GameServerUnderMaintenance, GameStuckError
 from module.handler.assets import *
+from module.handler.red_circle import RedCircleTracker
 from module.interception.assets import TEMPLATE_RED_CIRCLE
 from module.logger import logger
 from module.ui.assets import GOTO_BACK, MAIN_CHECK
@@ -158,16 +160,19 @@ class InfoHandler(ModuleBase):
             self.device.click(LOGIN_CHECK)
             logger.info('Login success')
 
+    @cached_property
+    def red_circle_tracker(self):
+        # 忽略左侧和底部的红圈
+        return RedCircleTracker(TEMPLATE_RED_CIRCLE, similarity=0.65, area=(75, 0, 10000, 1000))
+
     def handle_red_circles(self):
         """
         处理红圈
         """
-        circles = TEMPLATE_RED_CIRCLE.match_multi(self.device.image, similarity=0.65, name='RED_CIRCLE')
+        circles = self.red_circle_tracker.match_multi(self.device.image, name='RED_CIRCLE')
         for circle in circles:
             x = circle.location[0]
             y = circle.location[1]
-            if x < 75 or y > 1000:
-                continue
 
             # 因为画面变动添加的偏移
             if x < 300:
@@ -0,0 +1,175 @@
+import cv2
+import numpy as np
+
+from module.base.template import Template
+from module.base.utils import match_peaks
+
+
+class RedCircleTracker:
+    """
+    Find red circles in combat fast enough to run on every frame.
+
+    1. If there was a hit in the last frame, search near it first, red circles move slowly.
+       It keeps tracking the circle even if its color is covered by effects.
+    2. Then find warm colored (high red, low blue) regions on a half-size image,
+       and only run template matching around them, to find the other circles.
+    3. Peaks are extracted in one pass with non-maximum suppression, see match_peaks().
+    """
+
+    def __init__(self, template, similarity=0.65, area=None, track_range=40,
+                 red=140, red_blue=90, color_fraction=0.25, full_ratio=0.4):
+        """
+        Args:
+            template (Template):
+            similarity (float): 0 to 1.
+            area (tuple[int, int, int, int]): Circles whose center is outside this area are ignored, None for all.
+            track_range (int): Distance in pixels to search around the last hit.
+            red (int): Min red channel of warm colored pixels.
+            red_blue (int): Min difference between red and blue channel.
+            color_fraction (float): Min fraction of warm colored pixels in a template sized window
+                to search around it. Template itself is about 0.7.
+            full_ratio (float): If candidate regions cover more than this ratio of the image,
+                search the whole image instead.
+        """
+        self.template: Template = template
+        self.similarity = similarity
+        self.area = area
+        self.track_range = track_range
+        self.red = red
+        self.red_blue = red_blue
+        self.color_fraction = color_fraction
+        self.full_ratio = full_ratio
+        # Upper left of the last hit
+        self.last = None
+
+    @property
+    def size(self):
+        return self.template.size
+
+    def is_valid(self, point):
+        """
+        Args:
+            point (tuple[int, int]): Upper left.
+
+        Returns:
+            bool: If center of the template at this point is in self.area
+        """
+        if self.area is None:
+            return True
+        width, height = self.size
+        x, y = point[0] + width / 2, point[1] + height / 2
+        return self.area[0] <= x <= self.area[2] and self.area[1] <= y <= self.area[3]
+
+    def _match_area(self, image, area):
+        """
+        Args:
+            image (np.ndarray): Screenshot.
+            area (tuple[int, int, int, int]): Area to search.
+
+        Returns:
+            list[tuple[float, tuple[int, int]]]: (similarity, upper_left) of valid peaks.
+        """
+        width, height = self.size
+        x1, y1, x2, y2 = area
+        x1, y1 = max(x1, 0), max(y1, 0)
+        x2, y2 = min(x2, image.shape[1]), min(y2, image.shape[0])
+        if x2 - x1 < width or y2 - y1 < height:
+            return []
+        res = cv2.matchTemplate(image[y1:y2, x1:x2], self.template.image, cv2.TM_CCOEFF_NORMED)
+        peaks = match_peaks(res, threshold=self.similarity, size=self.size)
+        peaks = [(sim, (x + x1, y + y1)) for sim, (x, y) in peaks]
+        return [(sim, point) for sim, point in peaks if self.is_valid(point)]
+
+    def candidate_areas(self, image):
+        """
+        Args:
+            image (np.ndarray): Screenshot in RGB.
+
+        Returns:
+            list[tuple[int, int, int, int]]: Areas that may contain red circles.
+        """
+        width, height = self.size
+        small = image[::2, ::2]
+        red = small[:, :, 0]
+        mask = cv2.inRange(red, self.red, 255) & cv2.inRange(cv2.subtract(red, small[:, :, 2]), self.red_blue, 255)
+        # Fraction of warm colored pixels in each template sized window
+        window = (max(width // 2, 1), max(height // 2, 1))
+        density = cv2.boxFilter(mask, cv2.CV_32F, window)
+        candidate = (density >= 255 * self.color_fraction).astype(np.uint8)
+        _, _, stats, _ = cv2.connectedComponentsWithStats(candidate, connectivity=8)
+
+        areas = []
+        # Label 0 is background
+        for x, y, w, h, _ in stats[1:]:
+            # Window centers back to full size, pad with template size
+            areas.append((
+                int(x * 2 - width), int(y * 2 - height),
+                int((x + w) * 2 + width), int((y + h) * 2 + height),
+            ))
+        return areas
+
+    def detect(self, image):
+        """
+        Find all red circles.
+
+        Args:
+            image (np.ndarray): Screenshot in RGB.
+
+        Returns:
+            list[tuple[float, tuple[int, int]]]: (similarity, upper_left), sorted by similarity descending.
+        """
+        width, height = self.size
+        peaks = []
+        tracked = None
+        # Search near the last hit
+        if self.last is not None:
+            x, y = self.last
+            r = self.track_range
+            tracked = (x - r, y - r, x + width + r, y + height + r)
+            peaks += self._match_area(image, tracked)
+
+        areas = self.candidate_areas(image)
+        if tracked is not None:
+            # Already searched
+            areas = [area for area in areas if not (
+                    tracked[0] <= area[0] and tracked[1] <= area[1]
+                    and area[2] <= tracked[2] and area[3] <= tracked[3])]
+        covered = sum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in areas)
+        if covered > image.shape[0] * image.shape[1] * self.full_ratio:
+            peaks += self._match_area(image, (0, 0, image.shape[1], image.shape[0]))
+        else:
+            for area in areas:
+                peaks += self._match_area(image, area)
+        peaks = self._suppress(peaks)
+
+        self.last = peaks[0][1] if peaks else None
+        return peaks
+
+    def _suppress(self, peaks):
+        """
+        Remove duplicates from overlapping areas.
+        """
+        peaks = sorted(peaks, key=lambda p: p[0], reverse=True)
+        width, height = self.size
+        kept = []
+        for sim, (x, y) in peaks:
+            if any(abs(x - kx) < width and abs(y - ky) < height for _, (kx, ky) in kept):
+                continue
+            kept.append((sim, (x, y)))
+        return kept
+
+    def match_multi(self, image, name=None):
+        """
+        Like Template.match_multi(), but faster.
+
+        Args:
+            image (np.ndarray): Screenshot in RGB.
+            name (str):
+
+        Returns:
+            list[Button]: Sorted by similarity descending.
+        """
+        return [self.template._point_to_button(point, image=image, name=name) for _, point in self.detect(image)]
+
+    def reset(self):
+        self.last = None
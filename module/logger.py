@@ -2,13 +2,16 @@ import datetime
 import logging
 import os
 import sys
+import time
+import traceback
 from typing import Callable, List
 
-from rich.console import Console, ConsoleOptions, ConsoleRenderable, NewLine
+from rich.console import Console, ConsoleOptions, ConsoleRenderable, Group, NewLine
 from rich.highlighter import NullHighlighter, RegexHighlighter
 from rich.logging import RichHandler
 from rich.rule import Rule
 from rich.style import Style
+from rich.text import Text
 from rich.theme import Theme
 from rich.traceback import Traceback
 
@@ -41,6 +44,52 @@ class RichFileHandler(RichHandler):
     pass
 
 
+class StructuredLogHandler(logging.Handler):
+    """
+    Pass log records as plain dicts into a function, such as Connection.send() of a pipe to GUI.
+    Records are rendered into html in GUI only when they are shown, see render_record().
+
+    Record:
+        {'level': 'INFO', 'time': 1700000000.0, 'message': '12:00:00.000 │ text', 'attrs': {}}
+    Attrs:
+        'markup' (bool): Message has rich markups.
+        'traceback' (str): Formatted exception.
+        'rule' (dict): Keyword arguments of rich.rule.Rule, message is empty.
+    """
+
+    def __init__(self, func: Callable[[dict], None] = None, level=logging.NOTSET):
+        super().__init__(level=level)
+        self._func = func
+
+    def send(self, data: dict):
+        if not self._func:
+            return
+        try:
+            self._func(data)
+        except (OSError, EOFError):
+            # GUI is closed
+            self._func = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            formatter = self.formatter or web_formatter
+            record.message = record.getMessage()
+            record.asctime = formatter.formatTime(record, formatter.datefmt)
+            attrs = {}
+            if getattr(record, 'markup', False):
+                attrs['markup'] = True
+            if record.exc_info and record.exc_info != (None, None, None):
+                attrs['traceback'] = ''.join(traceback.format_exception(*record.exc_info))
+            self.send({
+                'level': record.levelname,
+                'time': record.created,
+                'message': formatter.formatMessage(record),
+                'attrs': attrs,
+            })
+        except Exception:
+            self.handleError(record)
+
+
 class RichRenderableHandler(RichHandler):
     """
     Pass renderable into a function
@@ -204,32 +253,66 @@ def set_file_logger(name=pyw_name):
 
 
 def set_func_logger(func):
-    console = HTMLConsole(
-        force_terminal=False,
-        force_interactive=False,
-        width=80,
-        color_system='truecolor',
-        markup=False,
-        safe_box=False,
-        highlighter=Highlighter(),
-        theme=WEB_THEME,
-    )
-    hdlr = RichRenderableHandler(
-        func=func,
+    """
+    Args:
+        func (callable): Receives structured log records, see StructuredLogHandler.
+    """
+    hdlr = StructuredLogHandler(func=func)
+    hdlr.setFormatter(web_formatter)
+    hdlr.setLevel(logging.INFO)    # ✅ func 日志级别 INFO
+
+    logger.handlers = [h for h in logger.handlers if not isinstance(h, (RichRenderableHandler, StructuredLogHandler))]
+    logger.addHandler(hdlr)
+
+
+def web_log_handler(console):
+    """
+    Args:
+        console (Console): Console of GUI log widget.
+
+    Returns:
+        RichHandler: Handler to render structured log records, see render_record().
+    """
+    return RichHandler(
         console=console,
         show_path=False,
         show_time=False,
         show_level=True,
-        rich_tracebacks=True,
-        tracebacks_show_locals=True,
-        tracebacks_extra_lines=5,
         highlighter=Highlighter(),
     )
-    hdlr.setFormatter(web_formatter)
-    hdlr.setLevel(logging.INFO)    # ✅ func 日志级别 INFO
 
-    logger.handlers = [h for h in logger.handlers if not isinstance(h, RichRenderableHandler)]
-    logger.addHandler(hdlr)
+
+def render_record(handler, data):
+    """
+    Convert a structured log record back to a renderable, the same as what RichRenderableHandler produces.
+
+    Args:
+        handler (RichHandler): See web_log_handler().
+        data (dict, str): Record from StructuredLogHandler, or plain text.
+
+    Returns:
+        ConsoleRenderable | str:
+    """
+    if not isinstance(data, dict):
+        return data
+    attrs = data.get('attrs', {})
+    if 'rule' in attrs:
+        return Rule(**attrs['rule'])
+    level = data.get('level', 'INFO')
+    record = logging.makeLogRecord({
+        'name': logger.name,
+        'levelname': level,
+        'levelno': logging.getLevelName(level),
+        'msg': data.get('message', ''),
+        'created': data.get('time', 0),
+        'markup': attrs.get('markup', False),
+    })
+    message = data.get('message', '')
+    renderable = handler.render(
+        record=record, traceback=None, message_renderable=handler.render_message(record, message))
+    if 'traceback' in attrs:
+        return Group(renderable, Text(attrs['traceback']))
+    return renderable
 
 
 def _get_renderables(
@@ -266,7 +349,15 @@ def _get_renderables(
 
 def print(*objects: ConsoleRenderable, **kwargs):
     for hdlr in logger.handlers:
-        if isinstance(hdlr, RichRenderableHandler):
+        if isinstance(hdlr, StructuredLogHandler):
+            for obj in objects:
+                if isinstance(obj, Rule):
+                    attrs = {'rule': {'title': str(obj.title), 'characters': obj.characters,
+                                      'style': obj.style, 'end': obj.end}}
+                    hdlr.send({'level': 'INFO', 'time': time.time(), 'message': '', 'attrs': attrs})
+                else:
+                    hdlr.send({'level': 'INFO', 'time': time.time(), 'message': str(obj), 'attrs': {}})
+        elif isinstance(hdlr, RichRenderableHandler):
             for renderable in _get_renderables(hdlr.console, *objects, **kwargs):
                 hdlr._func(renderable)
         elif isinstance(hdlr, RichHandler):
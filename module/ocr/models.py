@@ -1,10 +1,61 @@
 import numpy as np
 
+from module.base.timer import Timer
+from module.config.manual_config import ManualConfig
+from module.logger import logger
+
+
+class SharedModel:
+    """
+    Predict on the shared OCR server, fallback to the model in this process if server is unavailable.
+    """
+
+    def __init__(self, model, local):
+        """
+        Args:
+            model (tuple): (kind, lang, model_type)
+            local (callable): Returns the model in this process.
+        """
+        from module.ocr.server import OcrClient
+        self.client = OcrClient(model)
+        self.local = local
+        # 连接失败后, 间隔一段时间再重试, 期间使用本进程的模型
+        self.retry_timer = Timer(ManualConfig.OCR_SERVER_RETRY_INTERVAL)
+        self.failed = False
+
+    def predict(self, img_fp):
+        if self.client.authkey is not None and self.retry_timer.reached():
+            try:
+                result = self.client.predict(img_fp)
+            except OSError as e:
+                logger.warning(f'{e}, use OCR models in this process, '
+                               f'retry in {ManualConfig.OCR_SERVER_RETRY_INTERVAL}s')
+                self.failed = True
+                self.retry_timer.reset()
+            else:
+                if self.failed:
+                    logger.info('OCR server reconnected')
+                    self.failed = False
+                return result
+        return self.local().predict(img_fp)
+
 
 class OcrModel:
-    def __init__(self):
+    def __init__(self, use_server=ManualConfig.OCR_SERVER):
+        """
+        Args:
+            use_server (bool): True to predict on the shared OCR server, see module/ocr/server.py
+        """
+        self.use_server = use_server
         self._paddle_cache = {}
         self._paddle_num_cache = {}
+        self._paddle_rec_cache = {}
+        self._shared_cache = {}
+
+    def shared(self, model, local):
+        if model not in self._shared_cache:
+            self._shared_cache[model] = SharedModel(model, local)
+        return self._shared_cache[model]
 
     def paddle(self, model_type, interval):
         if model_type not in self._paddle_cache:
@@ -36,7 +87,27 @@ class OcrModel:
             )
         return self._paddle_num_cache[model_type]
 
+    def paddle_rec(self, model_type, interval):
+        """
+        Recognition-only model, PP-OCRv5 rec model supports both Chinese and English.
+        """
+        if model_type not in self._paddle_rec_cache:
+            from module.ocr.nikke_ocr import NIKKETextRecognition
+
+            self._paddle_rec_cache[model_type] = NIKKETextRecognition(
+                model_type=model_type,
+                interval=interval,
+            )
+        return self._paddle_rec_cache[model_type]
+
     def get_model_by(self, lang='ch', model_type='mobile', interval=0):
+        if self.use_server and lang in ('ch', 'en', 'num'):
+            lang = 'ch' if lang == 'ch' else 'en'
+            return self.shared(('ocr', lang, model_type),
+                               lambda: self.get_local_model_by(lang=lang, model_type=model_type, interval=interval))
+        return self.get_local_model_by(lang=lang, model_type=model_type, interval=interval)
+
+    def get_local_model_by(self, lang='ch', model_type='mobile', interval=0):
         if lang == 'ch':
             return self.paddle(model_type=model_type, interval=interval)
         elif lang in ('en', 'num'):
@@ -44,6 +115,12 @@ class OcrModel:
         else:
             raise ValueError(f'Unsupported lang: {lang}')
 
+    def get_rec_model_by(self, model_type='mobile', interval=0):
+        if self.use_server:
+            return self.shared(('rec', 'ch', model_type),
+                               lambda: self.paddle_rec(model_type=model_type, interval=interval))
+        return self.paddle_rec(model_type=model_type, interval=interval)
+
     def get_location(self, text, result, threshold=0.7):
         """
         获取目标文本在 OCR 结果中的中心坐标
@@ -2,7 +2,7 @@ import os
 import time
 
 import numpy as np
-from paddleocr import PaddleOCR
+from paddleocr import PaddleOCR, TextRecognition
 
 from module.exception import RequestHumanTakeover
 from module.logger import logger
@@ -124,3 +124,60 @@ class NIKKEOcr(PaddleOCR):
         logger.warning(f'Missing files: {missing_files}')
         logger.critical('Please ensure all required model files exist')
         raise RequestHumanTakeover
+
+
+class NIKKETextRecognition(TextRecognition):
+    """
+    只有文字识别模型, 没有文字检测模型
+    用于已知文字区域的 OCR, 如数字, 计数器, 时间, 每个裁剪图片视为一行文字
+    """
+
+    def __init__(self, model_type: str = 'mobile', interval: float = 0):
+        logger.hr('PaddleOCR Recognition Prepare')
+
+        name = 'PP-OCRv5_server_rec' if model_type == 'server' else 'PP-OCRv5_mobile_rec'
+        rec_model_dir = maybe_download(ModelsPath / f'{name}_infer', models[f'{name}_infer'])
+        required_files = ['inference.json', 'inference.pdiparams', 'inference.yml']
+        missing_files = [os.path.join(rec_model_dir, f) for f in required_files
+                         if not os.path.exists(os.path.join(rec_model_dir, f))]
+        if missing_files:
+            logger.warning(f'Missing files: {missing_files}')
+            logger.critical('Please ensure all required model files exist')
+            raise RequestHumanTakeover
+
+        self.interval = interval
+        self.last_time = 0
+
+        logger.info('PaddleOCR Recognition Initializing')
+        super().__init__(
+            model_name=name,
+            model_dir=rec_model_dir,
+            device='CPU',
+            cpu_threads=1,
+        )
+        logger.info('PaddleOCR Recognition prepared')
+
+    def predict(self, img_fp, batch_size=8):
+        """
+        Args:
+            img_fp (list[np.ndarray]): Images of text lines.
+            batch_size (int):
+
+        Returns:
+            list[dict]: Result pages in the same format as NIKKEOcr.predict(),
+                each page has one line of text, and bbox is the whole image.
+        """
+        self.check_interval()
+        result = super().predict(img_fp, batch_size=batch_size)
+        pages = []
+        for image, res in zip(img_fp, result):
+            height, width = image.shape[:2]
+            text = res.get('rec_text', '')
+            pages.append({
+                'rec_texts': [text] if text else [],
+                'rec_scores': [float(res.get('rec_score', 0.))] if text else [],
+                'rec_boxes': [np.array((0, 0, width, height))] if text else [],
+            })
+        return pages
+
+    check_interval = NIKKEOcr.check_interval
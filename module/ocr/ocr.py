@@ -1,5 +1,6 @@
 import re
 import time
+from collections import OrderedDict
 from datetime import timedelta
 from typing import TYPE_CHECKING, Dict, List
 
@@ -7,19 +8,79 @@ import cv2
 import numpy as np  # 新增
 
 from module.base.button import Button
+from module.base.cpu_limit import CpuLimit
 from module.base.utils import crop, float2str
 from module.logger import logger
 from module.ocr.models import OCR_MODEL
 
 if TYPE_CHECKING:
-    from module.ocr.nikke_ocr import NIKKEOcr
+    from module.ocr.nikke_ocr import NIKKEOcr, NIKKETextRecognition
 
 
-from module.ocr.models import OCR_MODEL
+class OcrCache:
+    """
+    LRU cache of OCR results, keyed by the hash of each cropped image.
+    Raw results are stored, so the same crop is never recognized twice.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(image, lang, model_type, rec_only=False):
+        image = np.ascontiguousarray(image)
+        return lang, model_type, rec_only, image.shape, hash(image.tobytes())
+
+    def get(self, key):
+        """
+        Returns:
+            dict | None: {'rec_texts': list, 'rec_scores': list, 'rec_boxes': list}
+        """
+        try:
+            page = self.cache[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.cache.move_to_end(key)
+        self.hits += 1
+        return page
+
+    def set(self, key, page):
+        # 只保留识别结果, 不保留 paddlex 结果里的输入图片
+        self.cache[key] = {
+            'rec_texts': list(page.get('rec_texts', [])),
+            'rec_scores': list(page.get('rec_scores', [])),
+            'rec_boxes': list(page.get('rec_boxes', [])),
+        }
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+        return self.cache[key]
+
+    def clear(self):
+        self.cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.
+
+    def __str__(self):
+        return f'OcrCache(size={len(self.cache)}, hits={self.hits}, misses={self.misses})'
+
+
+OCR_CACHE = OcrCache()
 
 
 class Ocr:
     SHOW_REVISE_WARNING = False
+    # 按钮区域内只有一行文字时, 跳过文字检测, 只运行文字识别
+    REC_ONLY = False
 
     def __init__(self, buttons, lang='ch', model_type='mobile', interval=0, name=None):
         """
@@ -39,6 +100,10 @@ class Ocr:
     def paddleocr(self) -> 'NIKKEOcr':
         return OCR_MODEL.get_model_by(lang=self.lang, model_type=self.model_type, interval=self.interval)
 
+    @property
+    def paddleocr_rec(self) -> 'NIKKETextRecognition':
+        return OCR_MODEL.get_rec_model_by(model_type=self.model_type, interval=self.interval)
+
     @property
     def buttons(self):
         buttons = self._buttons
@@ -80,11 +145,12 @@ class Ocr:
         """
         return result
 
-    def ocr(self, image, direct_ocr=False, threshold: float = 0.51, show_log=True):
+    def ocr(self, image, direct_ocr=False, threshold: float = 0.51, show_log=True, absolute_bbox=False):
         """
         Args:
             image (np.ndarray, list[np.ndarray]):
             direct_ocr (bool): True to skip cropping.
+            absolute_bbox (bool): True to move bbox of cropped areas to the coordinates of image.
 
         Returns:
             list[str] or str
@@ -102,7 +168,9 @@ class Ocr:
         #     processed_img = self.pre_process(img)
         #     images_to_ocr.append(processed_img)
 
-        result = self.paddleocr.predict(images_to_ocr)
+        result = self.predict_cached(images_to_ocr, rec_only=self.REC_ONLY and not direct_ocr)
+        if absolute_bbox and not direct_ocr:
+            result = [self._move_bbox(page, area) for page, area in zip(result, self.buttons)]
         # 处理识别结果
         processed_result = self._process_ocr_result(result, threshold)
         processed_result['text'] = self.after_process(processed_result['text'])
@@ -115,6 +183,45 @@ class Ocr:
 
         return processed_result
 
+    def predict_cached(self, images, rec_only=False):
+        """
+        Only images that are not in OCR_CACHE are sent to PaddleOCR, in one batch.
+
+        Args:
+            images (list[np.ndarray]):
+            rec_only (bool): True to treat each image as one line of text,
+                and run the recognition model only.
+
+        Returns:
+            list[dict]: Result pages, in the same order as images.
+        """
+        keys = [OcrCache.key(image, lang=self.lang, model_type=self.model_type, rec_only=rec_only)
+                for image in images]
+        pages = [OCR_CACHE.get(key) for key in keys]
+        missing = [index for index, page in enumerate(pages) if page is None]
+        if missing:
+            model = self.paddleocr_rec if rec_only else self.paddleocr
+            with CpuLimit.heavy():
+                result = model.predict([images[index] for index in missing])
+            for index, page in zip(missing, result):
+                pages[index] = OCR_CACHE.set(keys[index], page)
+        return pages
+
+    @staticmethod
+    def _move_bbox(page, area):
+        """
+        Args:
+            page (dict): Result page of a cropped image.
+            area (tuple): Crop area.
+
+        Returns:
+            dict: Result page with bbox in the coordinates of the whole image.
+        """
+        offset = np.array((area[0], area[1], area[0], area[1]))
+        page = dict(page)
+        page['rec_boxes'] = [np.asarray(box) + offset if np.shape(box) == (4,) else box for box in page['rec_boxes']]
+        return page
+
     def _process_ocr_result(self, result: List[dict], threshold: float) -> Dict:
         """
         处理 Paddlex OCR dict 格式的识别结果，仅使用 rec_texts/rec_scores/rec_boxes。
@@ -127,6 +234,7 @@ class Ocr:
             Dict: {
                 'text': str,               # 合并后的文本
                 'details': List[dict],     # 每行的详细信息
+                'pages': List[str],        # 每张图片的文本, 与输入图片一一对应, 没有识别结果时为 ''
                 'stats': {
                     'total_lines': int,    # 有效行数
                     'total_chars': int,    # 总字符数（不含空格和换行）
@@ -144,6 +252,7 @@ class Ocr:
             return {
                 'text': '',
                 'details': [],
+                'pages': [],
                 'stats': {
                     'total_lines': 0,
                     'total_chars': 0,
@@ -152,7 +261,9 @@ class Ocr:
                 },
             }
 
+        page_texts = []
         for page in result:
+            page_lines = []
             rec_texts = page.get('rec_texts', [])
             rec_scores = page.get('rec_scores', [])
             rec_boxes = page.get('rec_boxes', [])
@@ -169,6 +280,7 @@ class Ocr:
                 valid_lines += 1
                 total_conf += confidence
                 text_lines.append(text)
+                page_lines.append(text)
                 details.append(
                     {
                         'line_number': valid_lines,
@@ -178,6 +290,7 @@ class Ocr:
                         'char_count': len(text),
                     }
                 )
+            page_texts.append(''.join(page_lines))
 
         combined_text = ''.join(text_lines)
         avg_conf = (total_conf / valid_lines) if valid_lines > 0 else 0.0
@@ -186,6 +299,7 @@ class Ocr:
         return {
             'text': combined_text,
             'details': details,
+            'pages': page_texts,
             'stats': {
                 'total_lines': valid_lines,
                 'total_chars': total_chars,
@@ -200,6 +314,7 @@ class Digit(Ocr):
     Do OCR on a digit, such as `45`.
     Method ocr() returns digit string, or a list of digit strings.
     """
+    REC_ONLY = True
 
     def __init__(self, buttons, lang='num', model_type='mobile', name=None):
         super().__init__(buttons, lang=lang, model_type=model_type, name=name)
@@ -235,6 +350,8 @@ class Digit(Ocr):
 
 
 class DigitCounter(Ocr):
+    REC_ONLY = True
+
     def __init__(self, buttons, lang='num', model_type='mobile', name=None):
         super().__init__(buttons, lang=lang, model_type=model_type, name=name)
 
@@ -251,7 +368,7 @@ class DigitCounter(Ocr):
         Returns:
             int, int, int: current, remain, total.
         """
-        result_list = super().ocr(image, direct_ocr=direct_ocr)
+        result_list = super().ocr(image, direct_ocr=direct_ocr)['text']
         result = result_list[0] if isinstance(result_list, list) else result_list
 
         result = re.search(r'(\d+)/(\d+)', result)
@@ -265,6 +382,8 @@ class DigitCounter(Ocr):
 
 
 class Duration(Ocr):
+    REC_ONLY = True
+
     def __init__(self, buttons, lang='en', model_type='mobile', name=None):
         super().__init__(buttons, lang=lang, model_type=model_type, name=name)
 
@@ -284,7 +403,12 @@ class Duration(Ocr):
         Returns:
             list, datetime.timedelta: timedelta object, or a list of it.
         """
-        result_list = super().ocr(image, direct_ocr=direct_ocr)
+        result = super().ocr(image, direct_ocr=direct_ocr)
+        if len(self.buttons) == 1:
+            result_list = result['text']
+        else:
+            # One text per button, '' if nothing recognized, so results stay aligned with buttons
+            result_list = [self.after_process(text) for text in result['pages']]
         if not isinstance(result_list, list):
             result_list = [result_list]
         result_list = [self.parse_time(result) for result in result_list]
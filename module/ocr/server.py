@@ -0,0 +1,184 @@
+import queue
+import threading
+from functools import cached_property
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+
+from module.config.manual_config import ManualConfig
+from module.logger import logger
+
+
+class OcrJob:
+    def __init__(self, model, images):
+        """
+        Args:
+            model (tuple): (kind, lang, model_type), kind is 'ocr' or 'rec'
+            images (list[np.ndarray]):
+        """
+        self.model = model
+        self.images = images
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class OcrServer:
+    """
+    One set of OCR models shared by all NKAS instances on this host.
+
+    Each client connection is served by a thread, jobs are put into one queue,
+    and the worker takes all pending jobs of the same model to predict them in one batch.
+    """
+
+    def __init__(self, authkey, address=ManualConfig.OCR_SERVER_ADDRESS):
+        """
+        Args:
+            authkey (bytes): Random key generated by GUI, only instances started by the same GUI can connect.
+                Connections are unpickled, so the key must not be guessable.
+            address (tuple[str, int]):
+        """
+        self.address = address
+        self.authkey = authkey
+        self.jobs = queue.Queue()
+
+    @cached_property
+    def models(self):
+        from module.ocr.models import OcrModel
+        return OcrModel(use_server=False)
+
+    def get_model(self, model):
+        kind, lang, model_type = model
+        if kind == 'rec':
+            return self.models.get_rec_model_by(model_type=model_type)
+        else:
+            return self.models.get_model_by(lang=lang, model_type=model_type)
+
+    def worker(self):
+        while 1:
+            jobs = [self.jobs.get()]
+            # 合并同一模型的请求
+            pending = []
+            while 1:
+                try:
+                    job = self.jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if job.model == jobs[0].model:
+                    jobs.append(job)
+                else:
+                    pending.append(job)
+            for job in pending:
+                self.jobs.put(job)
+
+            images = [image for job in jobs for image in job.images]
+            try:
+                result = list(self.get_model(jobs[0].model).predict(images))
+            except Exception as e:
+                logger.exception(e)
+                for job in jobs:
+                    job.error = str(e)
+                    job.done.set()
+                continue
+
+            for job in jobs:
+                pages, result = result[:len(job.images)], result[len(job.images):]
+                job.result = [{
+                    'rec_texts': list(page.get('rec_texts', [])),
+                    'rec_scores': list(page.get('rec_scores', [])),
+                    'rec_boxes': list(page.get('rec_boxes', [])),
+                } for page in pages]
+                job.done.set()
+
+    def handle(self, conn):
+        with conn:
+            while 1:
+                try:
+                    model, images = conn.recv()
+                except (EOFError, OSError):
+                    return
+                job = OcrJob(tuple(model), images)
+                self.jobs.put(job)
+                job.done.wait()
+                try:
+                    conn.send((job.error, job.result))
+                except OSError:
+                    return
+
+    def serve(self):
+        logger.hr('OCR server', level=1)
+        logger.info(f'OCR server listening on {self.address}')
+        threading.Thread(target=self.worker, daemon=True).start()
+        with Listener(self.address, authkey=self.authkey) as listener:
+            while 1:
+                try:
+                    conn = listener.accept()
+                except (OSError, EOFError, AuthenticationError) as e:
+                    logger.warning(f'OCR server failed to accept: {e}')
+                    continue
+                threading.Thread(target=self.handle, args=(conn,), daemon=True).start()
+
+
+class OcrClient:
+    """
+    Send images to OcrServer, has the same predict() as NIKKEOcr.
+    """
+    # Key of the OCR server started by GUI, set in ProcessManager.run_process()
+    # None if this instance is not started by GUI, then the server is not used
+    authkey: bytes = None
+
+    def __init__(self, model, address=ManualConfig.OCR_SERVER_ADDRESS):
+        """
+        Args:
+            model (tuple): (kind, lang, model_type)
+        """
+        self.model = model
+        self.address = address
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def connect(self):
+        if self._conn is None:
+            if self.authkey is None:
+                raise OSError('OCR server authkey is not set')
+            self._conn = Client(self.address, authkey=self.authkey)
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except OSError:
+                pass
+            self._conn = None
+
+    def predict(self, img_fp):
+        """
+        Args:
+            img_fp (list[np.ndarray]):
+
+        Returns:
+            list[dict]:
+
+        Raises:
+            OSError: If server is unavailable.
+            RuntimeError: If server failed to predict.
+        """
+        with self._lock:
+            try:
+                conn = self.connect()
+                conn.send((self.model, list(img_fp)))
+                error, result = conn.recv()
+            except (EOFError, OSError, AuthenticationError) as e:
+                self.close()
+                raise OSError(f'OCR server unavailable: {e}')
+        if error is not None:
+            raise RuntimeError(f'OCR server error: {error}')
+        return result
+
+
+def run_server(authkey):
+    """
+    Args:
+        authkey (bytes): See OcrServer.
+    """
+    OcrServer(authkey).serve()
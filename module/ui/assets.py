@@ -16,7 +16,7 @@ ARK_GOTO_SIMULATION_ROOM = Button(area={'zh-CN': (100, 587, 189, 598), 'en-US':
 ARK_GOTO_TRIBE_TOWER = Button(area={'zh-CN': (504, 381, 549, 396), 'en-US': (504, 381, 549, 396)}, color={'zh-CN': (140, 164, 166), 'en-US': (140, 164, 166)}, button={'zh-CN': (504, 381, 549, 396), 'en-US': (504, 381, 549, 396)}, file={'zh-CN': './assets/zh-CN/ui/ARK_GOTO_TRIBE_TOWER.png', 'en-US': './assets/zh-CN/ui/ARK_GOTO_TRIBE_TOWER.png'})
 CASH_SHOP_CHECK = Button(area={'zh-CN': (19, 37, 56, 57), 'en-US': (19, 37, 56, 57)}, color={'zh-CN': (138, 139, 145), 'en-US': (138, 139, 145)}, button={'zh-CN': (19, 37, 56, 57), 'en-US': (19, 37, 56, 57)}, file={'zh-CN': './assets/zh-CN/ui/CASH_SHOP_CHECK.png', 'en-US': './assets/zh-CN/ui/CASH_SHOP_CHECK.png'})
 CHAMPION_ARENA_CHECK = Button(area={'zh-CN': (75, 309, 405, 374), 'en-US': (75, 309, 405, 374)}, color={'zh-CN': (198, 178, 234), 'en-US': (198, 178, 234)}, button={'zh-CN': (75, 309, 405, 374), 'en-US': (75, 309, 405, 374)}, file={'zh-CN': './assets/zh-CN/ui/CHAMPION_ARENA_CHECK.png', 'en-US': './assets/zh-CN/ui/CHAMPION_ARENA_CHECK.png'})
-CLICK_TO_NEXT = Button(area={'zh-CN': (289, 858, 431, 876), 'en-US': (289, 858, 431, 876)}, color={'zh-CN': (141, 141, 141), 'en-US': (141, 141, 141)}, button={'zh-CN': (289, 858, 431, 876), 'en-US': (289, 858, 431, 876)}, file={'zh-CN': './assets/zh-CN/ui/CLICK_TO_NEXT.png', 'en-US': './assets/zh-CN/ui/CLICK_TO_NEXT.png'})
+CLICK_TO_NEXT = Button(area={'zh-CN': (289, 858, 431, 876), 'en-US': (289, 858, 431, 876)}, color={'zh-CN': (141, 141, 141), 'en-US': (141, 141, 141)}, button={'zh-CN': (289, 858, 431, 876), 'en-US': (289, 858, 431, 876)}, file={'zh-CN': './assets/zh-CN/ui/CLICK_TO_NEXT.png', 'en-US': './assets/zh-CN/ui/CLICK_TO_NEXT.png'}, pyramid=2)
 COMMISSION_CHECK = Button(area={'zh-CN': (93, 183, 259, 213), 'en-US': (93, 183, 259, 213)}, color={'zh-CN': (134, 134, 134), 'en-US': (134, 134, 134)}, button={'zh-CN': (93, 183, 259, 213), 'en-US': (93, 183, 259, 213)}, file={'zh-CN': './assets/zh-CN/ui/COMMISSION_CHECK.png', 'en-US': './assets/zh-CN/ui/COMMISSION_CHECK.png'})
 COMMISSION_GOTO_OUTPOST = Button(area={'zh-CN': (634, 152, 679, 197), 'en-US': (634, 152, 679, 197)}, color={'zh-CN': (232, 228, 231), 'en-US': (232, 228, 231)}, button={'zh-CN': (634, 152, 679, 197), 'en-US': (634, 152, 679, 197)}, file={'zh-CN': './assets/zh-CN/ui/COMMISSION_GOTO_OUTPOST.png', 'en-US': './assets/zh-CN/ui/COMMISSION_GOTO_OUTPOST.png'})
 CONVERSATION_CHECK = Button(area={'zh-CN': (262, 171, 452, 187), 'en-US': (262, 171, 452, 187)}, color={'zh-CN': (138, 138, 136), 'en-US': (138, 138, 136)}, button={'zh-CN': (262, 171, 452, 187), 'en-US': (262, 171, 452, 187)}, file={'zh-CN': './assets/zh-CN/ui/CONVERSATION_CHECK.png', 'en-US': './assets/zh-CN/ui/CONVERSATION_CHECK.png'})
@@ -79,7 +79,7 @@ ROOKIE_ARENA_CHECK = Button(area={'zh-CN': (199, 141, 518, 238), 'en-US': (199,
 SELECT_MAX = Button(area={'zh-CN': (554, 894, 580, 912), 'en-US': (554, 894, 580, 912)}, color={'zh-CN': (130, 130, 130), 'en-US': (130, 130, 130)}, button={'zh-CN': (554, 894, 580, 912), 'en-US': (554, 894, 580, 912)}, file={'zh-CN': './assets/zh-CN/ui/SELECT_MAX.png', 'en-US': './assets/zh-CN/ui/SELECT_MAX.png'})
 SHOP_CHECK = Button(area={'zh-CN': (18, 37, 56, 57), 'en-US': (18, 37, 56, 57)}, color={'zh-CN': (121, 118, 115), 'en-US': (121, 118, 115)}, button={'zh-CN': (18, 37, 56, 57), 'en-US': (18, 37, 56, 57)}, file={'zh-CN': './assets/zh-CN/ui/SHOP_CHECK.png', 'en-US': './assets/zh-CN/ui/SHOP_CHECK.png'})
 SIMULATION_ROOM_CHECK = Button(area={'zh-CN': (264, 605, 462, 627), 'en-US': (264, 605, 462, 627)}, color={'zh-CN': (136, 140, 141), 'en-US': (136, 140, 141)}, button={'zh-CN': (264, 605, 462, 627), 'en-US': (264, 605, 462, 627)}, file={'zh-CN': './assets/zh-CN/ui/SIMULATION_ROOM_CHECK.png', 'en-US': './assets/zh-CN/ui/SIMULATION_ROOM_CHECK.png'})
-SKIP = Button(area={'zh-CN': (616, 22, 671, 41), 'en-US': (616, 22, 671, 41)}, color={'zh-CN': (133, 134, 133), 'en-US': (133, 134, 133)}, button={'zh-CN': (616, 22, 671, 41), 'en-US': (616, 22, 671, 41)}, file={'zh-CN': './assets/zh-CN/ui/SKIP.png', 'en-US': './assets/zh-CN/ui/SKIP.png'})
+SKIP = Button(area={'zh-CN': (616, 22, 671, 41), 'en-US': (616, 22, 671, 41)}, color={'zh-CN': (133, 134, 133), 'en-US': (133, 134, 133)}, button={'zh-CN': (616, 22, 671, 41), 'en-US': (616, 22, 671, 41)}, file={'zh-CN': './assets/zh-CN/ui/SKIP.png', 'en-US': './assets/zh-CN/ui/SKIP.png'}, pyramid=2)
 SPECIAL_ARENA_CHECK = Button(area={'zh-CN': (204, 138, 524, 229), 'en-US': (204, 138, 524, 229)}, color={'zh-CN': (87, 90, 97), 'en-US': (87, 90, 97)}, button={'zh-CN': (204, 138, 524, 229), 'en-US': (204, 138, 524, 229)}, file={'zh-CN': './assets/zh-CN/ui/SPECIAL_ARENA_CHECK.png', 'en-US': './assets/zh-CN/ui/SPECIAL_ARENA_CHECK.png'})
 SPECIAL_INTERCEPTION_CHECK = Button(area={'zh-CN': (73, 831, 260, 862), 'en-US': (73, 831, 260, 862)}, color={'zh-CN': (200, 199, 200), 'en-US': (200, 199, 200)}, button={'zh-CN': (73, 831, 260, 862), 'en-US': (73, 831, 260, 862)}, file={'zh-CN': './assets/zh-CN/ui/SPECIAL_INTERCEPTION_CHECK.png', 'en-US': './assets/zh-CN/ui/SPECIAL_INTERCEPTION_CHECK.png'})
 SYNCHRO_CHECK = Button(area={'zh-CN': (122, 469, 202, 482), 'en-US': (122, 469, 202, 482)}, color={'zh-CN': (108, 108, 107), 'en-US': (108, 108, 107)}, button={'zh-CN': (122, 469, 202, 482), 'en-US': (122, 469, 202, 482)}, file={'zh-CN': './assets/zh-CN/ui/SYNCHRO_CHECK.png', 'en-US': './assets/zh-CN/ui/SYNCHRO_CHECK.png'})
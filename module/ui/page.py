@@ -4,13 +4,18 @@ from module.ui.assets import *
 
 
 class Page:
-    parent = None
+    # All pages, in the order of creation
+    all_pages = []
+    # Key: destination page, value: {page: next page on the shortest path to destination}
+    # Compiled by Page.init_routes(), cleared when a link is added
+    routes = {}
 
     def __init__(self, check_button):
         self.check_button = check_button
         self.links = {}
         (filename, line_number, function_name, text) = traceback.extract_stack()[-2]
         self.name = text[: text.find('=')].strip()
+        Page.all_pages.append(self)
 
     def __eq__(self, other):
         return self.name == other.name
@@ -23,6 +28,45 @@ class Page:
 
     def link(self, button, destination):
         self.links[destination] = button
+        Page.routes = {}
+
+    @classmethod
+    def init_routes(cls):
+        """
+        Compile the next-hop table of all pages to all pages.
+        BFS backwards from each destination, so every page goes to destination by the least clicks.
+        """
+        routes = {}
+        for destination in cls.all_pages:
+            next_hop = {}
+            visited = {destination}
+            current = [destination]
+            while current:
+                new = []
+                for page in current:
+                    for source in cls.all_pages:
+                        if source in visited:
+                            continue
+                        if page in source.links:
+                            next_hop[source] = page
+                            visited.add(source)
+                            new.append(source)
+                current = new
+            routes[destination] = next_hop
+        cls.routes = routes
+
+    @classmethod
+    def route(cls, destination):
+        """
+        Args:
+            destination (Page):
+
+        Returns:
+            dict[Page, Page]: Key: page that can go to destination, value: next page to go.
+        """
+        if not cls.routes:
+            cls.init_routes()
+        return cls.routes.get(destination, {})
 
 
 # Main
@@ -106,10 +106,14 @@ class UI(InfoHandler):
                 break
 
             # Known pages
+            # 所有页面的 check_button 在同一张截图上一次性检测
+            results = self.appear_many(
+                [page.check_button for page in self.ui_pages if page.check_button is not None], offset=(30, 30)
+            )
             for page in self.ui_pages:
                 if page.check_button is None:
                     continue
-                if self.ui_page_appear(page=page):
+                if results[page.check_button]:
                     logger.attr('UI', page.name)
                     self.ui_current = page
                     return page
@@ -158,36 +162,14 @@ class UI(InfoHandler):
             confirm_wait:
             skip_first_screenshot:
         """
-        # Reset connection
-        for page in self.ui_pages:
-            page.parent = None
-
-        # Create connection
-        visited = [destination]
-        visited = set(visited)
-
-        """
-            这段代码最开始会从所有页面的链接中找出去往 destination 的页面，将其添加到 new
-            例如 destination 为 page_reward，这样添加到 new 的页面为 page_main
-            然后 visited 和 new 的长度不相等，继续循环
-            继续执行会找出所有去往 page_main 的页面，直到可去往 page_main 的页面都在 visited 中
-            总之，这样会找出去往的目标页的页面，接着找出去往这个页面的页面，遍历完所有支持页面直到所有关联页面都被添加
-        """
-        while 1:
-            new = visited.copy()
-
-            for page in visited:
-                for link in self.ui_pages:
-                    if link in visited:
-                        continue
-                    if page in link.links:
-                        link.parent = page
-                        new.add(link)
-
-            if len(new) == len(visited):
-                break
-
-            visited = new
+        # 预先编译的路由表, 页面 -> 去往 destination 的下一个页面
+        route = Page.route(destination)
+        pages = [page for page in self.ui_pages if page in route and page.check_button is not None]
+        # 优先检测预期会出现的页面, 没有匹配到时再检测路线上的所有页面
+        expected = []
+        current = getattr(self, 'ui_current', None)
+        if current in pages:
+            expected.append(current)
 
         logger.hr(f'UI goto {destination}')
         confirm_timer = Timer(confirm_wait, count=int(confirm_wait // 0.5)).start()
@@ -203,6 +185,7 @@ class UI(InfoHandler):
             if self.appear(destination.check_button, offset=offset):
                 if confirm_timer.reached():
                     logger.info(f'Page arrive: {destination}')
+                    self.ui_current = destination
                     break
             else:
                 confirm_timer.reset()
@@ -211,22 +194,29 @@ class UI(InfoHandler):
             #     continue
 
             # Other pages
-            clicked = False
-            for page in visited:
-                # 跳过 page_unknown 和 destination
-                if not page.parent or not page.check_button:
-                    continue
-
+            hit = None
+            for page in expected:
                 if self.appear(page.check_button, offset=offset, interval=4):
-                    logger.info(f'Page switch: {page} -> {page.parent}')
-                    button = page.links[page.parent]
-                    self.device.click(button)
-                    # self.ui_button_interval_reset(button)
-                    confirm_timer.reset()
-                    clicked = True
+                    hit = page
                     break
-
-            if clicked:
+            if hit is None:
+                others = [page for page in pages if page not in expected]
+                results = self.appear_many([page.check_button for page in others], offset=offset, interval=4)
+                for page in others:
+                    if results[page.check_button]:
+                        self.interval_timer[page.check_button.name].reset()
+                        hit = page
+                        break
+
+            if hit is not None:
+                next_page = route[hit]
+                logger.info(f'Page switch: {hit} -> {next_page}')
+                button = hit.links[next_page]
+                self.device.click(button)
+                # self.ui_button_interval_reset(button)
+                confirm_timer.reset()
+                # 点击后应该到达下一个页面, 如果点击没有生效则还在当前页面
+                expected = [page for page in (next_page, hit) if page in pages]
                 continue
 
     def ui_ensure(self, destination, confirm_wait=0, skip_first_screenshot=True):
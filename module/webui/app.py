@@ -570,6 +570,8 @@ class NKASGUI(Frame):
                     f"Save config {filepath_config(config_name)}, {dict_to_kv(modified)}"
                 )
                 config_updater.write_file(config_name, config)
+                # Scheduler of the running instance picks up changes immediately
+                ProcessManager.get_manager(config_name).wakeup()
         except Exception as e:
             logger.exception(e)
 
@@ -1472,6 +1474,7 @@ def startup():
         task_handler.add(updater.check_update, updater.delay)
     task_handler.add(updater.schedule_update(), 86400)
     task_handler.start()
+    ProcessManager.prewarm()
     # if State.deploy_config.DiscordRichPresence:
     #     init_discord_rpc()
     # if State.deploy_config.StartOcrServer:
@@ -1494,6 +1497,8 @@ def clearup():
     # stop_ocr_server_process()
     for nkas in ProcessManager._processes.values():
         nkas.stop()
+    if ProcessManager._supervisor is not None:
+        ProcessManager._supervisor.close()
     State.clearup()
     task_handler.stop()
     logger.info("NKAS closed.")
@@ -1,12 +1,11 @@
 import argparse
 import os
-import queue
 import threading
-from multiprocessing import Process
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
 from typing import Dict, List, Union
 
 import inflection
-from rich.console import Console, ConsoleRenderable
 
 # Since this file does not run under the same process or subprocess of app.py
 # the following code needs to be repeated
@@ -22,11 +21,18 @@ from module.webui.setting import State
 
 class ProcessManager:
     _processes: Dict[str, "ProcessManager"] = {}
+    _ocr_server: Process = None
+    # Random key of the OCR server, generated once per GUI session
+    _ocr_authkey: bytes = None
+    _supervisor = None
 
     def __init__(self, config_name: str = "nkas") -> None:
         self.config_name = config_name
-        self._renderable_queue: queue.Queue[ConsoleRenderable] = State.manager.Queue()
-        self.renderables: List[ConsoleRenderable] = []
+        # Structured log records from StructuredLogHandler, rendered by RichLog when shown
+        self._log_conn: Connection = None
+        # Event to wake up the scheduler waiting for tasks, see ConfigWatcher.wait_change()
+        self._wakeup = None
+        self.renderables: List[Union[dict, str]] = []
         self.renderables_max_length = 400
         self.renderables_reduce_length = 80
         self._process: Process = None
@@ -35,20 +41,90 @@ class ProcessManager:
 
     def start(self, func, ev: threading.Event = None) -> None:
         if not self.alive:
+            self.start_ocr_server()
             if func is None:
                 func = get_config_mod(self.config_name)
-            self._process = Process(
-                target=ProcessManager.run_process,
-                args=(
-                    self.config_name,
-                    func,
-                    self._renderable_queue,
-                    ev,
-                ),
-            )
-            self._process.start()
+            self._log_conn, log_conn = Pipe(duplex=False)
+            self._wakeup = State.manager.Event() if State.manager is not None else None
+            supervisor = self.get_supervisor()
+            if supervisor is not None:
+                self._process = supervisor.spawn(
+                    self.config_name, func, log_conn, ev, self._wakeup, self._ocr_authkey
+                )
+            else:
+                self._process = Process(
+                    target=ProcessManager.run_process,
+                    args=(
+                        self.config_name,
+                        func,
+                        log_conn,
+                        ev,
+                        self._wakeup,
+                        self._ocr_authkey,
+                    ),
+                )
+                self._process.start()
+            # Child process has its own copy, so reader gets EOF when child exits
+            log_conn.close()
             self.start_log_queue_handler()
 
+    def wakeup(self) -> None:
+        """
+        Wake up the instance if it's waiting for tasks,
+        call this after writing its config file or setting the update event.
+        """
+        if self._wakeup is None or not self.alive:
+            return
+        try:
+            self._wakeup.set()
+        except (OSError, EOFError) as e:
+            logger.warning(f"Failed to wake up [{self.config_name}]: {e}")
+
+    @classmethod
+    def get_supervisor(cls):
+        """
+        Returns:
+            Supervisor: If supervisor mode is enabled in ManualConfig, see module/webui/supervisor.py
+        """
+        from module.config.manual_config import ManualConfig
+
+        if not ManualConfig.SUPERVISOR:
+            return None
+        if cls._supervisor is None:
+            from module.webui.supervisor import Supervisor
+
+            cls._supervisor = Supervisor()
+        return cls._supervisor
+
+    @classmethod
+    def prewarm(cls) -> None:
+        """
+        Start warm workers in advance, if supervisor mode is enabled.
+        """
+        supervisor = cls.get_supervisor()
+        if supervisor is not None:
+            supervisor.prewarm()
+
+    @classmethod
+    def start_ocr_server(cls) -> None:
+        """
+        Start the OCR server shared by all instances, if enabled in ManualConfig.
+        """
+        from module.config.manual_config import ManualConfig
+
+        if not ManualConfig.OCR_SERVER:
+            return
+        if cls._ocr_server is not None and cls._ocr_server.is_alive():
+            return
+        from module.ocr.server import run_server
+
+        # Server unpickles what it receives, so only processes started by this GUI should know the key.
+        # Keep the key if server restarts, so running instances can reconnect
+        if cls._ocr_authkey is None:
+            cls._ocr_authkey = os.urandom(32)
+        cls._ocr_server = Process(target=run_server, args=(cls._ocr_authkey,), daemon=True)
+        cls._ocr_server.start()
+
     def start_log_queue_handler(self):
         if (
             self.thd_log_queue_handler is not None
@@ -73,6 +149,11 @@ class ProcessManager:
                 self.renderables.append(
                     f"[{self.config_name}] exited. Reason: Manual stop\n"
                 )
+                supervisor = self.get_supervisor()
+                if supervisor is not None:
+                    # Killed process can't release its CPU permits, give them back
+                    self._process.join(timeout=3)
+                    supervisor.reclaim()
             if self.thd_log_queue_handler is not None:
                 self.thd_log_queue_handler.join(timeout=1)
                 if self.thd_log_queue_handler.is_alive():
@@ -82,11 +163,19 @@ class ProcessManager:
         logger.info(f"[{self.config_name}] exited")
 
     def _thread_log_queue_handler(self) -> None:
-        while self.alive:
+        while True:
+            # Pipe is renewed if the process is restarted
+            conn = self._log_conn
             try:
-                log = self._renderable_queue.get(timeout=1)
-            except queue.Empty:
-                continue
+                if not conn.poll(1):
+                    if self.alive:
+                        continue
+                    break
+                log = conn.recv()
+            except (EOFError, OSError):
+                if conn is not self._log_conn:
+                    continue
+                break
             self.renderables.append(log)
             if len(self.renderables) > self.renderables_max_length:
                 self.renderables = self.renderables[self.renderables_reduce_length :]
@@ -106,10 +195,9 @@ class ProcessManager:
         elif len(self.renderables) == 0:
             return 2
         else:
-            console = Console(no_color=True)
-            with console.capture() as capture:
-                console.print(self.renderables[-1])
-            s = capture.get().strip()
+            log = self.renderables[-1]
+            s = log.get("message", "") if isinstance(log, dict) else str(log)
+            s = s.strip()
             if s.endswith("Reason: Manual stop"):
                 return 2
             elif s.endswith("Reason: Finish"):
@@ -130,7 +218,12 @@ class ProcessManager:
 
     @staticmethod
     def run_process(
-        config_name, func: str, q: queue.Queue, e: threading.Event = None
+        config_name,
+        func: str,
+        q: Connection,
+        e: threading.Event = None,
+        w: threading.Event = None,
+        k: bytes = None,
     ) -> None:
         parser = argparse.ArgumentParser()
         parser.add_argument(
@@ -146,7 +239,7 @@ class ProcessManager:
             logger.info("Electron detected, remove log output to stdout")
             from module.logger import console_hdlr
             logger.removeHandler(console_hdlr)
-        set_func_logger(func=q.put)
+        set_func_logger(func=q.send)
 
         from module.config.config import NikkeConfig
 
@@ -154,6 +247,11 @@ class ProcessManager:
         # remove_fake_pil_module()
 
         NikkeConfig.stop_event = e
+        NikkeConfig.wakeup_event = w
+        if k is not None:
+            from module.ocr.server import OcrClient
+
+            OcrClient.authkey = k
         try:
             # Run nkas
             if func == "nkas":
@@ -0,0 +1,242 @@
+import os
+import threading
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+from typing import Dict, List, Optional, Tuple
+
+import psutil
+
+from module.config.manual_config import ManualConfig
+from module.logger import logger
+
+
+def get_ocr_model_type(config_name: str) -> str:
+    """
+    Returns:
+        str: Optimization_OcrModelType of the config, 'mobile' if not found.
+    """
+    from module.config.utils import deep_get, filepath_config, read_file
+
+    try:
+        data = read_file(filepath_config(config_name))
+    except Exception as e:
+        logger.warning(f"Failed to read OCR model type of [{config_name}]: {e}")
+        return "mobile"
+    return deep_get(data, keys="NKAS.Optimization.OcrModelType", default="mobile") or "mobile"
+
+
+def warm_up_ocr(model_type: str) -> None:
+    """
+    Load OCR models of the given model type, no-op if already loaded.
+    """
+    if ManualConfig.OCR_SERVER:
+        # Models are on the OCR server
+        return
+    try:
+        from module.ocr.models import OCR_MODEL
+
+        OCR_MODEL.get_model_by(lang="ch", model_type=model_type)
+        OCR_MODEL.get_model_by(lang="en", model_type=model_type)
+        OCR_MODEL.get_rec_model_by(model_type=model_type)
+    except Exception as e:
+        logger.warning(f"Failed to warm up OCR models: {e}")
+
+
+def warm_up(model_type: str = "mobile") -> None:
+    """
+    Import the whole stack and load OCR models and template atlas,
+    so an instance starts running tasks as soon as it's assigned.
+
+    Args:
+        model_type: OCR model type expected to be used, the one of the last started instance.
+    """
+    try:
+        import main  # noqa: F401
+        import module.ui.ui  # noqa: F401
+        from module.base.atlas import TEMPLATE_ATLAS
+
+        _ = TEMPLATE_ATLAS.data
+    except Exception as e:
+        logger.warning(f"Failed to warm up imports: {e}")
+
+    warm_up_ocr(model_type)
+
+
+def set_cpu_affinity(cpus: List[int]) -> None:
+    try:
+        psutil.Process().cpu_affinity(cpus)
+    except (AttributeError, ValueError, psutil.Error) as e:
+        # cpu_affinity() is not available on macOS
+        logger.warning(f"Failed to set CPU affinity {cpus}: {e}")
+
+
+def run_worker(conn: Connection, model_type: str = "mobile") -> None:
+    """
+    Entry of warm workers. Warm up, wait for an instance to run, then run it like ProcessManager.run_process().
+    A worker runs one instance only and exits with it.
+    """
+    warm_up(model_type)
+    try:
+        config_name, func, q, e, w, k, cpus, semaphore, holders = conn.recv()
+    except (EOFError, OSError):
+        # Supervisor exited
+        return
+    finally:
+        conn.close()
+
+    from module.base.cpu_limit import CpuLimit
+    from module.webui.process_manager import ProcessManager
+
+    if cpus:
+        set_cpu_affinity(cpus)
+    CpuLimit.semaphore = semaphore
+    CpuLimit.holders = holders
+    # Instance may use another model type than the one warmed up
+    config_model_type = get_ocr_model_type(config_name)
+    if config_model_type != model_type:
+        warm_up_ocr(config_model_type)
+    ProcessManager.run_process(config_name, func, q, e, w, k)
+
+
+class Supervisor:
+    """
+    Run instances in pre-warmed worker processes.
+
+    - `warm` idle workers are kept, they have already imported modules and loaded OCR models.
+    - Each instance is pinned to `cpus` CPU cores, instances use different cores if possible.
+    - At most `heavy` instances run CPU-heavy phases at the same time, see module/base/cpu_limit.py
+
+    Instances share nothing but the semaphore, each of them runs its own scheduler.
+    """
+
+    def __init__(
+        self,
+        warm: int = ManualConfig.SUPERVISOR_WARM_WORKERS,
+        cpus: int = ManualConfig.SUPERVISOR_CPUS_PER_INSTANCE,
+        heavy: int = ManualConfig.SUPERVISOR_HEAVY_LIMIT,
+    ) -> None:
+        self.warm = warm
+        self.cpus = cpus
+        self.heavy = heavy
+        self._workers: List[Tuple[Process, Connection]] = []
+        # Key: config_name, value: (slot, process)
+        self._slots: Dict[str, Tuple[int, Process]] = {}
+        self._semaphore = None
+        # Permits of the semaphore held by each worker, key: pid, value: count, see CpuLimit
+        self._holders = None
+        # Workers running instances, key: pid
+        self._instances: Dict[int, Process] = {}
+        # OCR model type to warm up, the one of the last started instance
+        self.model_type = get_ocr_model_type("nkas")
+        self._lock = threading.Lock()
+
+    @property
+    def semaphore(self):
+        if self._semaphore is None and self.heavy > 0:
+            from module.webui.setting import State
+
+            self._semaphore = State.manager.BoundedSemaphore(self.heavy)
+        return self._semaphore
+
+    @property
+    def holders(self):
+        if self._holders is None and self.heavy > 0:
+            from module.webui.setting import State
+
+            self._holders = State.manager.dict()
+        return self._holders
+
+    def reclaim(self) -> None:
+        """
+        Release permits held by dead workers.
+        Workers killed by ProcessManager.stop() in a CPU-heavy phase never release their permits,
+        other instances would block forever once all permits are lost.
+        """
+        holders = self._holders
+        if holders is None:
+            return
+        with self._lock:
+            for pid, count in list(holders.items()):
+                process = self._instances.get(pid)
+                if process is not None and process.is_alive():
+                    continue
+                holders.pop(pid, None)
+                for _ in range(count):
+                    try:
+                        self._semaphore.release()
+                    except ValueError:
+                        break
+                logger.warning(f"Reclaimed {count} CPU permit(s) of dead worker {pid}")
+            self._instances = {pid: p for pid, p in self._instances.items() if p.is_alive()}
+
+    def _start_worker(self) -> Tuple[Process, Connection]:
+        conn, child_conn = Pipe()
+        process = Process(target=run_worker, args=(child_conn, self.model_type))
+        process.start()
+        child_conn.close()
+        return process, conn
+
+    def prewarm(self) -> None:
+        self.reclaim()
+        with self._lock:
+            self._workers = [(p, c) for p, c in self._workers if p.is_alive()]
+            for _ in range(self.warm - len(self._workers)):
+                self._workers.append(self._start_worker())
+
+    def _pop_worker(self) -> Tuple[Process, Connection]:
+        with self._lock:
+            while self._workers:
+                process, conn = self._workers.pop(0)
+                if process.is_alive():
+                    return process, conn
+                conn.close()
+        # No warm worker, start a cold one
+        logger.info("No warm worker available, start a new one")
+        return self._start_worker()
+
+    def assign_cpus(self, config_name: str, process: Process) -> Optional[List[int]]:
+        """
+        Returns:
+            list[int]: CPU cores for this instance, None to leave it unpinned.
+        """
+        count = os.cpu_count() or 1
+        if self.cpus <= 0 or self.cpus >= count:
+            return None
+        with self._lock:
+            self._slots = {k: v for k, v in self._slots.items() if v[1].is_alive() and k != config_name}
+            used = {slot for slot, _ in self._slots.values()}
+            slot = 0
+            while slot in used:
+                slot += 1
+            self._slots[config_name] = (slot, process)
+        return [(slot * self.cpus + i) % count for i in range(self.cpus)]
+
+    def spawn(self, config_name: str, func: str, q, e=None, w=None, k=None) -> Process:
+        """
+        Run an instance in a warm worker.
+
+        Returns:
+            Process: The worker process, which exits when the instance ends.
+        """
+        self.reclaim()
+        self.model_type = get_ocr_model_type(config_name)
+        process, conn = self._pop_worker()
+        cpus = self.assign_cpus(config_name, process)
+        with self._lock:
+            self._instances[process.pid] = process
+        conn.send((config_name, func, q, e, w, k, cpus, self.semaphore, self.holders))
+        conn.close()
+        logger.info(f"[{config_name}] started in warm worker {process.pid}, CPU: {cpus}")
+        threading.Thread(target=self.prewarm, daemon=True).start()
+        return process
+
+    def close(self) -> None:
+        """
+        Kill idle workers, running instances are stopped by ProcessManager.
+        """
+        with self._lock:
+            for process, conn in self._workers:
+                conn.close()
+                if process.is_alive():
+                    process.kill()
+            self._workers = []
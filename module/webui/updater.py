@@ -199,6 +199,14 @@ class Updater(DeployConfig, GitManager, PipManager):
     def pip_install(self):
         return super().pip_install()
 
+    def atlas_build(self):
+        """
+        Rebuild template atlas, entries of updated assets are ignored until rebuilt.
+        """
+        logger.hr("Build template atlas")
+        if not self.execute(f'"{self.python}" -m dev_tools.assets_atlas', allow_failure=True):
+            logger.warning("Failed to build template atlas, updated assets are loaded from files")
+
     def update(self):
         logger.hr("Run update")
         try:
@@ -206,6 +214,7 @@ class Updater(DeployConfig, GitManager, PipManager):
             self.pip_install()
         except ExecutionError:
             return False
+        self.atlas_build()
         return True
 
     def run_update(self):
@@ -228,6 +237,8 @@ class Updater(DeployConfig, GitManager, PipManager):
             self.state = 1
         self.state = "wait"
         self.event.set()
+        for nkas in instances:
+            nkas.wakeup()
         _instances = instances.copy()
         start_time = time.time()
         while _instances:
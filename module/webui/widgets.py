@@ -8,9 +8,9 @@ from pywebio.exceptions import SessionException
 from pywebio.io_ctrl import Output
 from pywebio.output import *
 from pywebio.session import eval_js, local, run_js
-from rich.console import ConsoleRenderable
+from rich.console import ConsoleRenderable, Group
 
-from module.logger import HTMLConsole, Highlighter, WEB_THEME
+from module.logger import HTMLConsole, Highlighter, WEB_THEME, render_record, web_log_handler
 from module.webui.lang import t
 from module.webui.pin import put_checkbox, put_input, put_select, put_textarea
 from module.webui.process_manager import ProcessManager
@@ -88,6 +88,7 @@ class RichLog:
             highlighter=Highlighter(),
             theme=WEB_THEME,
         )
+        self.handler = web_log_handler(self.console)
         # self.callback_id = output_register_callback(
         #     self._callback_set_width, serial_mode=True)
         # self._callback_thread = None
@@ -98,9 +99,17 @@ class RichLog:
         else:
             self.terminal_theme = LIGHT_TERMINAL_THEME
 
-    def render(self, renderable: ConsoleRenderable) -> str:
+    def render(self, logs: List[Union[dict, str, ConsoleRenderable]]) -> str:
+        """
+        Render log records into html, all records are exported at once.
+
+        Args:
+            logs: Structured log records from ProcessManager.renderables, or renderables.
+        """
+        if not logs:
+            return ""
         with self.console.capture():
-            self.console.print(renderable)
+            self.console.print(Group(*[render_record(self.handler, log) for log in logs]))
 
         html = self.console.export_html(
             theme=self.terminal_theme,
@@ -191,7 +200,7 @@ class RichLog:
         try:
             while True:
                 last_idx = len(pm.renderables)
-                html = "".join(map(self.render, pm.renderables[:]))
+                html = self.render(pm.renderables[:])
                 self.reset()
                 self.extend(html)
                 counter = last_idx
@@ -201,7 +210,7 @@ class RichLog:
                     if idx < last_idx:
                         last_idx -= pm.renderables_reduce_length
                     if idx != last_idx:
-                        html = "".join(map(self.render, pm.renderables[last_idx:idx]))
+                        html = self.render(pm.renderables[last_idx:idx])
                         self.extend(html)
                         counter += idx - last_idx
                         last_idx = idx